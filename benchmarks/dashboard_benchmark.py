@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+"""
+Dashboard Pipeline Benchmark
+============================
+
+Generates synthetic Robot Framework output.xml files of configurable size and
+measures how long dashboard.py takes to parse, analyse and render them, and
+how much memory parsing needs. Results are written as JSON so runs can be
+compared across commits:
+
+    python benchmarks/dashboard_benchmark.py --tests 20000 --suites 200
+    python benchmarks/dashboard_benchmark.py --tests 20000 --suites 200 \\
+        --baseline benchmarks/results/<earlier>.json --fail-threshold 20
+"""
+
+import os
+import sys
+import gc
+import math
+import json
+import time
+import random
+import argparse
+import logging
+import platform
+import subprocess
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, TextIO
+from xml.sax.saxutils import escape, quoteattr
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import dashboard  # noqa: E402
+
+logger = logging.getLogger('dashboard_benchmark')
+
+LIBRARIES = ['BuiltIn', 'PlaywrightLibrary', 'APILibrary', 'Collections', 'String']
+KEYWORDS = ['Click Element', 'Fill Form', 'Wait For Selector', 'Validate Response Schema', 'Log',
+            'Should Be Equal', 'Navigate To Login Page', 'Get Page Metrics', 'Lease Pooled Account', 'Sleep']
+TAGS = ['smoke', 'regression', 'ui', 'api', 'critical', 'login', 'products', 'checkout']
+ERROR_TEMPLATES = [
+    "Connection timeout after {n} ms for testuser{ts}@automation.com",
+    "Element 'id=btn-{n}' not found after 30s",
+    "AssertionError: expected status 200 but got {status}",
+    "Response schema mismatch at user.field{n}: missing field",
+    "GET https://automationexercise.com/api/productsList?page={n} failed with 503",
+]
+# Measured phases, in pipeline order; timing keys in the result JSON
+PHASES = ('parse', 'analysis', 'render')
+
+
+class SyntheticOutputWriter:
+    """Stream a synthetic output.xml in the Robot Framework 6 or 7 schema"""
+
+    def __init__(self, tests: int = 1000, suites: int = 20, suite_depth: int = 2, keywords: int = 5,
+                 keyword_depth: int = 2, keyword_fanout: int = 2, messages: int = 1, message_length: int = 80,
+                 failure_rate: float = 0.05, schema: int = 6, seed: int = 42):
+        if schema not in (6, 7):
+            raise ValueError("Schema must be 6 or 7")
+        self.tests = tests
+        self.suites = max(suites, 1)
+        self.suite_depth = max(suite_depth, 1)
+        self.keywords = keywords
+        self.keyword_depth = keyword_depth
+        self.keyword_fanout = keyword_fanout
+        self.messages = messages
+        self.message_length = message_length
+        self.failure_rate = failure_rate
+        self.schema = schema
+        self.rng = random.Random(seed)
+        self.clock = datetime(2026, 1, 1, 9, 0, 0)
+        self.tests_written = 0
+
+    def write(self, path: str) -> str:
+        """Write the file and return its path"""
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        leaves = self._leaf_paths()
+        self.tests_written = 0
+        tests_per_leaf = [self.tests // len(leaves) + (1 if i < self.tests % len(leaves) else 0)
+                          for i in range(len(leaves))]
+        with open(path, 'w', encoding='utf-8') as out:
+            out.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+            if self.schema == 6:
+                out.write(f'<robot generator="Robot 6.1.1 (synthetic)" generated="{self._stamp(self.clock)}" '
+                          f'rpa="false" schemaversion="4">\n')
+            else:
+                out.write(f'<robot generator="Robot 7.0 (synthetic)" generated="{self.clock.isoformat()}" '
+                          f'rpa="false" schemaversion="5">\n')
+            self._write_suite(out, 's1', 'Synthetic', (), leaves, iter(tests_per_leaf))
+            out.write('<statistics></statistics>\n<errors></errors>\n</robot>\n')
+        return path
+
+    def _leaf_paths(self) -> List[tuple]:
+        """Spread the requested number of leaf suites over a tree of the requested depth"""
+        if self.suite_depth == 1:
+            return [(i,) for i in range(self.suites)]
+        # Mixed-radix counter: the first `suites` values are distinct as long as fanout ** depth covers them
+        fanout = max(2, math.ceil(self.suites ** (1 / self.suite_depth)))
+        while fanout ** self.suite_depth < self.suites:
+            fanout += 1
+        return [tuple((i // fanout ** level) % fanout for level in reversed(range(self.suite_depth)))
+                for i in range(self.suites)]
+
+    def _write_suite(self, out: TextIO, suite_id: str, name: str, prefix: tuple, leaves: List[tuple], counts) -> bool:
+        start = self.clock
+        out.write(f'<suite id="{suite_id}" name={quoteattr(name)} source="/synthetic/{suite_id}">\n')
+        children = sorted({leaf[len(prefix)] for leaf in leaves if leaf[:len(prefix)] == prefix
+                           and len(leaf) > len(prefix)})
+        failed = False
+        if not children:
+            for index in range(next(counts)):
+                failed |= self._write_test(out, f'{suite_id}-t{index + 1}', f'{name} Test {index + 1}')
+        else:
+            for position, child in enumerate(children, 1):
+                child_name = f'{name} {child + 1}' if prefix else f'Suite {child + 1}'
+                failed |= self._write_suite(out, f'{suite_id}-s{position}', child_name, prefix + (child,), leaves, counts)
+        out.write(self._status('FAIL' if failed else 'PASS', start, self.clock))
+        out.write('</suite>\n')
+        return failed
+
+    def _write_test(self, out: TextIO, test_id: str, name: str) -> bool:
+        start = self.clock
+        self.tests_written += 1
+        out.write(f'<test id="{test_id}" name={quoteattr(name)} line="1">\n')
+        for _ in range(self.keywords):
+            self._write_keyword(out, self.keyword_depth)
+        for tag in self.rng.sample(TAGS, 2):
+            out.write(f'<tag>{tag}</tag>\n')
+        failed = self.rng.random() < self.failure_rate
+        message = ''
+        if failed:
+            message = escape(self.rng.choice(ERROR_TEMPLATES).format(
+                n=self.rng.randrange(10000), ts=self.rng.randrange(1700000000, 1800000000),
+                status=self.rng.choice([400, 401, 404, 500])))
+        out.write(self._status('FAIL' if failed else 'PASS', start, self.clock, message))
+        out.write('</test>\n')
+        return failed
+
+    def _write_keyword(self, out: TextIO, depth: int):
+        start = self.clock
+        library = self.rng.choice(LIBRARIES)
+        owner = 'library' if self.schema == 6 else 'owner'
+        out.write(f'<kw name="{self.rng.choice(KEYWORDS)}" {owner}="{library}">\n<arg>synthetic</arg>\n')
+        for _ in range(self.messages):
+            self.clock += timedelta(milliseconds=self.rng.randint(1, 20))
+            stamp = (f'timestamp="{self._stamp(self.clock)}"' if self.schema == 6
+                     else f'time="{self.clock.isoformat()}"')
+            out.write(f'<msg {stamp} level="INFO">{"x" * self.message_length}</msg>\n')
+        if depth > 0:
+            for _ in range(self.keyword_fanout):
+                self._write_keyword(out, depth - 1)
+        self.clock += timedelta(milliseconds=self.rng.randint(5, 400))
+        out.write(self._status('PASS', start, self.clock))
+        out.write('</kw>\n')
+
+    def _status(self, status: str, start: datetime, end: datetime, message: str = '') -> str:
+        if self.schema == 6:
+            timing = f'starttime="{self._stamp(start)}" endtime="{self._stamp(end)}"'
+        else:
+            timing = f'start="{start.isoformat()}" elapsed="{(end - start).total_seconds():.6f}"'
+        return f'<status status="{status}" {timing}>{message}</status>\n'
+
+    def _stamp(self, moment: datetime) -> str:
+        return moment.strftime('%Y%m%d %H:%M:%S.') + f'{moment.microsecond // 1000:03d}'
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmark(results_dir: str, repeat: int = 3) -> Dict:
+    """Best-of-N wall time per phase, plus peak traced memory of a separate parse"""
+    parser = dashboard.ProfessionalDashboardParser()
+    generator = dashboard.ProfessionalDashboardGenerator()
+    html_path = os.path.join(results_dir, 'benchmark_dashboard.html')
+    timings = {phase: [] for phase in PHASES}
+
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        tests, suites = parser.parse_results(results_dir)
+        parsed = time.perf_counter()
+        data = parser.build_dashboard_data(tests, suites, [])
+        analysed = time.perf_counter()
+        generator.generate(data, html_path)
+        rendered = time.perf_counter()
+        timings['parse'].append(parsed - started)
+        timings['analysis'].append(analysed - parsed)
+        timings['render'].append(rendered - analysed)
+        del tests, suites, data
+
+    # tracemalloc slows allocation-heavy code, so memory is measured on its own pass
+    gc.collect()
+    tracemalloc.start()
+    parser.parse_results(results_dir)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        **{f'{phase}_s': round(min(values), 4) for phase, values in timings.items()},
+        'total_s': round(sum(min(values) for values in timings.values()), 4),
+        'parse_peak_memory_mb': round(peak / 1024 / 1024, 2),
+        'html_bytes': os.path.getsize(html_path)
+    }
+
+
+def compare_with_baseline(result: Dict, baseline_file: str, threshold: float) -> List[str]:
+    """Metrics that regressed by more than threshold percent against an earlier result"""
+    with open(baseline_file, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('params') != result['params']:
+        logger.warning("Baseline was measured with different parameters; the comparison is indicative only")
+    regressions = []
+    for metric in [f'{phase}_s' for phase in PHASES] + ['total_s', 'parse_peak_memory_mb']:
+        before, after = baseline['results'].get(metric), result['results'][metric]
+        if not before:
+            continue
+        change = (after / before - 1) * 100
+        logger.info(f"{metric:<22} {before:>10} -> {after:<10} ({change:+.1f}%)")
+        if change > threshold:
+            regressions.append(f"{metric} {change:+.1f}%")
+    return regressions
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description='Benchmark the dashboard pipeline on synthetic Robot results')
+    parser.add_argument('--tests', type=int, default=5000, help='Total number of tests')
+    parser.add_argument('--suites', type=int, default=50, help='Number of leaf suites')
+    parser.add_argument('--suite-depth', type=int, default=2, help='Suite nesting depth')
+    parser.add_argument('--keywords', type=int, default=5, help='Top-level keywords per test')
+    parser.add_argument('--keyword-depth', type=int, default=2, help='Nested keyword levels below each top-level keyword')
+    parser.add_argument('--keyword-fanout', type=int, default=2, help='Child keywords per keyword')
+    parser.add_argument('--messages', type=int, default=1, help='Log messages per keyword')
+    parser.add_argument('--message-length', type=int, default=80, help='Characters per log message')
+    parser.add_argument('--failure-rate', type=float, default=0.05, help='Share of failing tests')
+    parser.add_argument('--files', type=int, default=1, help='Split the tests over this many output.xml files')
+    parser.add_argument('--schema', type=int, choices=[6, 7], default=6, help='Robot Framework output schema')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per phase; the fastest is reported')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for the synthetic data')
+    parser.add_argument('--output-dir', default=os.path.join(REPO_ROOT, 'benchmarks', 'results'),
+                        help='Where the JSON result is written')
+    parser.add_argument('--baseline', help='Earlier result JSON to compare against')
+    parser.add_argument('--fail-threshold', type=float, default=None,
+                        help='Exit non-zero if any metric regressed by more than this percent')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    logging.getLogger(dashboard.__name__).setLevel(logging.WARNING)
+
+    params = {key: getattr(args, key) for key in ('tests', 'suites', 'suite_depth', 'keywords', 'keyword_depth',
+                                                  'keyword_fanout', 'messages', 'message_length', 'failure_rate',
+                                                  'files', 'schema', 'seed')}
+
+    with tempfile.TemporaryDirectory(prefix='dashboard-bench-') as results_dir:
+        started = time.perf_counter()
+        xml_bytes = 0
+        tests_written = 0
+        for index in range(args.files):
+            share = args.tests // args.files + (1 if index < args.tests % args.files else 0)
+            writer = SyntheticOutputWriter(
+                tests=share, suites=max(args.suites // args.files, 1), suite_depth=args.suite_depth,
+                keywords=args.keywords, keyword_depth=args.keyword_depth, keyword_fanout=args.keyword_fanout,
+                messages=args.messages, message_length=args.message_length, failure_rate=args.failure_rate,
+                schema=args.schema, seed=args.seed + index)
+            xml_bytes += os.path.getsize(writer.write(os.path.join(results_dir, f'run{index}', 'output.xml')))
+            tests_written += writer.tests_written
+        logger.info(f"Generated {tests_written} tests in {args.files} file(s), {xml_bytes / 1024 / 1024:.1f} MB "
+                    f"in {time.perf_counter() - started:.1f}s")
+
+        results = run_benchmark(results_dir, args.repeat)
+        results['xml_bytes'] = xml_bytes
+
+    result = {
+        'commit': _git_commit(),
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': params,
+        'results': results
+    }
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_file = os.path.join(args.output_dir, f"{datetime.now():%Y%m%d-%H%M%S}-{result['commit'] or 'nogit'}.json")
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+
+    logger.info(f"Parse {results['parse_s']}s, analysis {results['analysis_s']}s, render {results['render_s']}s, "
+                f"parse peak memory {results['parse_peak_memory_mb']} MB")
+    logger.info(f"Results written: {output_file}")
+
+    if args.baseline:
+        regressions = compare_with_baseline(result, args.baseline, args.fail_threshold or 0.0)
+        if regressions and args.fail_threshold is not None:
+            logger.error(f"Performance regression: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
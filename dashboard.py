@@ -19,29 +19,127 @@ Version: 3.0.0 - Professional Edition
 """
 
 import os
+import io
+import re
+import gzip
+import base64
 import sys
 import json
+import string
+import math
+import struct
+import hashlib
+import heapq
+import threading
+import time
+import cProfile
+import pstats
+import tracemalloc
 import xml.etree.ElementTree as ET
 from datetime import datetime, timedelta
 from pathlib import Path
 import argparse
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterable, TextIO
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from dataclasses import dataclass
 from collections import defaultdict, Counter
+from functools import lru_cache
+from contextlib import contextmanager
 import statistics
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('professional_dashboard.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
 logger = logging.getLogger(__name__)
 
+# Written by libraries/DashboardListener.py
+EVENTS_FILE = 'dashboard_events.jsonl'
+
+# output.xml elements that group keywords without being keywords themselves
+CONTROL_TAGS = ('for', 'iter', 'if', 'branch', 'try', 'while', 'group')
+# Flame graph frames shorter than this share of the test are dropped
+FLAME_MIN_FRACTION = 0.005
+HOT_KEYWORD_LIMIT = 15
+
+RF6_TIMESTAMP_FORMAT = '%Y%m%d %H:%M:%S.%f'
+
+
+def _events_are_current(events_path: str) -> bool:
+    """Whether an event stream belongs to the same or a later run than the output.xml beside it"""
+    xml_path = os.path.join(os.path.dirname(events_path), 'output.xml')
+    try:
+        events_mtime = os.path.getmtime(events_path)
+        with open(xml_path, 'rb') as f:
+            head = f.read(IncrementalResultIngestor.HEAD_BYTES)
+        xml_mtime = os.path.getmtime(xml_path)
+    except OSError:
+        return os.path.exists(events_path)
+    # output.xml records when its run started; a stream last written before that is left over
+    match = re.search(rb'generated="([^"]+)"', head)
+    if match:
+        generated = match.group(1).decode('ascii', 'replace')
+        for parse in (lambda value: datetime.strptime(value, RF6_TIMESTAMP_FORMAT), datetime.fromisoformat):
+            try:
+                return datetime.fromtimestamp(events_mtime) >= parse(generated)
+            except ValueError:
+                continue
+    return events_mtime >= xml_mtime
+
+
+def _status_timing(status_elem) -> tuple:
+    """Start time (ISO) and elapsed seconds from a <status> of either output.xml schema"""
+    if status_elem is None:
+        return '', 0.0
+    if status_elem.get('start') is not None:
+        # Robot Framework 7: ISO start and elapsed seconds
+        return status_elem.get('start'), float(status_elem.get('elapsed', 0))
+    start, end = status_elem.get('starttime'), status_elem.get('endtime')
+    try:
+        start_dt = datetime.strptime(start, RF6_TIMESTAMP_FORMAT)
+        end_dt = datetime.strptime(end, RF6_TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return '', 0.0
+    return start_dt.isoformat(), (end_dt - start_dt).total_seconds()
+
+
+class KeywordProfiler:
+    """Accumulate per-keyword self/total time and a flame tree for one test"""
+    
+    def __init__(self):
+        # (library, name) -> [calls, total time, self time]
+        self.stats = {}
+        self.stack = [{'key': None, 'nodes': [], 'inner': 0.0}]
+    
+    def start(self, name: str, library: str, is_keyword: bool = True):
+        key = (library or '', name) if is_keyword else None
+        self.stack.append({'key': key, 'nodes': [], 'inner': 0.0})
+    
+    def end(self, elapsed: float = 0.0):
+        frame = self.stack.pop()
+        parent = self.stack[-1]
+        if frame['key'] is None:
+            # Control structures are transparent: their keywords belong to the enclosing one
+            parent['nodes'].extend(frame['nodes'])
+            parent['inner'] += frame['inner']
+            return
+        entry = self.stats.setdefault(frame['key'], [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[2] += max(elapsed - frame['inner'], 0.0)
+        # Count total time once per recursion chain
+        if all(outer['key'] != frame['key'] for outer in self.stack):
+            entry[1] += elapsed
+        parent['inner'] += elapsed
+        library, name = frame['key']
+        parent['nodes'].append({'n': name, 'l': library, 't': round(elapsed, 4), 'c': frame['nodes']})
+    
+    def flame(self, test_elapsed: float) -> List[Dict]:
+        """Keyword tree without frames too short to see"""
+        min_time = test_elapsed * FLAME_MIN_FRACTION
+        
+        def prune(nodes):
+            return [{**node, 'c': prune(node['c'])} for node in nodes if node['t'] >= min_time]
+        
+        return prune(self.stack[0]['nodes'])
+
 @dataclass
 class DashboardMetrics:
     """Professional dashboard metrics"""
@@ -61,22 +159,292 @@ class DashboardMetrics:
     reliability_score: float
     last_execution: str
 
+# Volatile fragments replaced before failure messages are compared
+ERROR_NORMALIZERS = [
+    (re.compile(r'[\w.+-]+@[\w-]+(\.[\w-]+)+'), '<email>'),
+    (re.compile(r'\b\w+://\S+'), '<url>'),
+    (re.compile(r'\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b', re.IGNORECASE), '<uuid>'),
+    (re.compile(r'\b\d{4}-\d{2}-\d{2}[t ]\d{2}:\d{2}:\d{2}(\.\d+)?\b', re.IGNORECASE), '<time>'),
+    (re.compile(r'\b\d+(\.\d+)?\s*(ms|milliseconds?|s|sec|secs|seconds?|min|minutes?)\b', re.IGNORECASE), '<duration>'),
+    (re.compile(r'\b0x[0-9a-f]+\b|\b[0-9a-f]{12,}\b', re.IGNORECASE), '<hex>'),
+    (re.compile(r'\d+(\.\d+)?'), '<n>'),
+    (re.compile(r'\s+'), ' '),
+]
+SIGNATURE_MAX_LENGTH = 500
+CLUSTER_SAMPLE_TESTS = 5
+
+
+class FailureClusterer:
+    """Group failing tests whose normalized error messages are near-duplicates.
+
+    Identical signatures are grouped directly; distinct signatures are then
+    merged with MinHash over their word sets and LSH banding, so only likely
+    matches are compared and the cost stays close to linear in the number of
+    distinct signatures.
+    """
+    
+    def __init__(self, similarity: float = 0.6, bands: int = 16, rows: int = 4):
+        self.similarity = similarity
+        self.bands = bands
+        self.rows = rows
+        self.word_format = struct.Struct(f'<{bands * rows}I')
+        self.word_hashes = {}
+    
+    @staticmethod
+    def signature(error: str) -> str:
+        """Error message with numbers, emails, URLs, ids and timings masked"""
+        text = error.strip().lower()
+        for pattern, replacement in ERROR_NORMALIZERS:
+            text = pattern.sub(replacement, text)
+        return text[:SIGNATURE_MAX_LENGTH]
+    
+    def cluster(self, tests: List[Dict]) -> List[Dict]:
+        """Ranked clusters of failed tests, largest first"""
+        by_signature = defaultdict(list)
+        for test in tests:
+            if test['status'] == 'FAIL':
+                by_signature[self.signature(test['error'] or '')].append(test)
+        signatures = list(by_signature)
+        tokens = [frozenset(sig.split()) for sig in signatures]
+        
+        parent = list(range(len(signatures)))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        buckets = defaultdict(list)
+        for index, words in enumerate(tokens):
+            for band in self._bands(words):
+                buckets[band].append(index)
+        for members in buckets.values():
+            for other in members[1:]:
+                first, second = find(members[0]), find(other)
+                if first != second and self._jaccard(tokens[members[0]], tokens[other]) >= self.similarity:
+                    parent[second] = first
+        
+        groups = defaultdict(list)
+        for index in range(len(signatures)):
+            groups[find(index)].append(index)
+        
+        clusters = []
+        for members in groups.values():
+            failed = [test for index in members for test in by_signature[signatures[index]]]
+            representative = max(members, key=lambda index: len(by_signature[signatures[index]]))
+            clusters.append({
+                'signature': signatures[representative],
+                'example': by_signature[signatures[representative]][0]['error'],
+                'count': len(failed),
+                'variants': len(members),
+                # The same test failing in several runs is listed once
+                'tests': list(dict.fromkeys(test.get('longname', test['name']) for test in failed))
+            })
+        clusters.sort(key=lambda c: (-c['count'], c['signature']))
+        return clusters
+    
+    def _bands(self, words: frozenset) -> List[tuple]:
+        """LSH band keys of the MinHash of a word set"""
+        minhash = list(map(min, zip(*(self._word_hash(word) for word in words)))) or [0] * (self.bands * self.rows)
+        return [(band, *minhash[band * self.rows:(band + 1) * self.rows]) for band in range(self.bands)]
+    
+    def _word_hash(self, word: str) -> tuple:
+        """One independent 32-bit hash per MinHash slot, cached because words repeat across messages"""
+        hashes = self.word_hashes.get(word)
+        if hashes is None:
+            digest = hashlib.shake_128(word.encode('utf-8')).digest(self.word_format.size)
+            hashes = self.word_hashes[word] = self.word_format.unpack(digest)
+        return hashes
+    
+    @staticmethod
+    def _jaccard(first: frozenset, second: frozenset) -> float:
+        union = len(first | second)
+        return len(first & second) / union if union else 1.0
+
+
+# Generation phases in pipeline order, as reported by --profile
+PROFILE_PHASES = ('discovery', 'parse', 'metrics', 'charts', 'insights', 'render', 'write')
+PROFILE_TOP_FUNCTIONS = 25
+PROFILE_TOP_ALLOCATIONS = 10
+# Allocation sites that belong to the profiler or the import system, not to the dashboard
+PROFILER_INTERNALS = (tracemalloc.__file__, cProfile.__file__, '<frozen importlib._bootstrap')
+
+
+class DashboardProfiler:
+    """Wall time per generation phase, plus cProfile stats and tracemalloc peaks once started"""
+    
+    def __init__(self, top_functions: int = PROFILE_TOP_FUNCTIONS, top_allocations: int = PROFILE_TOP_ALLOCATIONS):
+        self.top_functions = top_functions
+        self.top_allocations = top_allocations
+        self.phases = defaultdict(float)
+        self.phase_peaks = {}
+        self.peak_memory = 0
+        self.profile = None
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.started = None
+        self.wall_time = None
+    
+    @property
+    def active(self) -> bool:
+        return self.profile is not None
+    
+    def start(self):
+        """Begin tracing allocations and profiling calls"""
+        tracemalloc.start()
+        self.profile = cProfile.Profile()
+        self.started = time.perf_counter()
+        self.profile.enable()
+    
+    def stop(self):
+        """Stop tracing; the collected numbers stay available for report()"""
+        if self.profile is None or self.wall_time is not None:
+            return
+        self.profile.disable()
+        self.wall_time = time.perf_counter() - self.started
+        self.peak_memory = max(self.peak_memory, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time a block; while tracing also record its peak memory"""
+        tracing = self.active and self.wall_time is None and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] += time.perf_counter() - started
+            if tracing:
+                current, peak = tracemalloc.get_traced_memory()
+                self.phase_peaks[name] = max(self.phase_peaks.get(name, 0), peak)
+                self.peak_memory = max(self.peak_memory, peak)
+                if current > self.snapshot_size:
+                    # Keep allocation sites from the point where the most memory is held, without profiling the snapshot
+                    self.profile.disable()
+                    self.snapshot_size = current
+                    self.snapshot = tracemalloc.take_snapshot()
+                    self.profile.enable()
+    
+    def report(self) -> Dict:
+        """Machine-readable summary of everything recorded so far"""
+        # Summarising mid-run (for the HTML section) must not show up in the profile itself
+        running = self.profile is not None and self.wall_time is None
+        if running:
+            self.profile.disable()
+        try:
+            return self._report()
+        finally:
+            if running:
+                self.profile.enable()
+    
+    def _report(self) -> Dict:
+        measured = sum(self.phases.values())
+        names = [name for name in PROFILE_PHASES if name in self.phases]
+        names += [name for name in self.phases if name not in PROFILE_PHASES]
+        report = {
+            'timestamp': datetime.now().isoformat(),
+            'wall_time': self.wall_time if self.wall_time is not None else (
+                time.perf_counter() - self.started if self.started else measured),
+            'phase_time': round(measured, 6),
+            'phases': [{
+                'phase': name,
+                'seconds': round(self.phases[name], 6),
+                'share': round(self.phases[name] / measured * 100, 1) if measured else 0.0,
+                'peak_memory': self.phase_peaks.get(name)
+            } for name in names],
+            'peak_memory': self.peak_memory or None,
+            'top_allocations': [],
+            'functions_by_self_time': [],
+            'functions_by_cumulative_time': []
+        }
+        if self.snapshot is not None:
+            report['allocations_at'] = self.snapshot_size
+            # Filtering the aggregated statistics is far cheaper than filtering every trace
+            report['top_allocations'] = [{
+                'site': f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                'size': stat.size,
+                'count': stat.count
+            } for stat in self.snapshot.statistics('lineno')
+                if not stat.traceback[0].filename.startswith(PROFILER_INTERNALS)][:self.top_allocations]
+        if self.profile is not None:
+            functions = [{
+                'function': name,
+                'location': f"{filename}:{line}",
+                'calls': calls,
+                'self_time': round(own, 6),
+                'cumulative_time': round(cumulative, 6)
+            } for (filename, line, name), (_, calls, own, cumulative, _) in pstats.Stats(self.profile).stats.items()]
+            report['functions_by_self_time'] = sorted(
+                functions, key=lambda f: f['self_time'], reverse=True)[:self.top_functions]
+            report['functions_by_cumulative_time'] = sorted(
+                functions, key=lambda f: f['cumulative_time'], reverse=True)[:self.top_functions]
+        return report
+    
+    def write(self, report_path: str) -> str:
+        """Write the JSON report, with the raw cProfile stats next to it for pstats or snakeviz"""
+        self.stop()
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+        if self.profile is not None:
+            self.profile.dump_stats(f"{os.path.splitext(report_path)[0]}.prof")
+        logger.info(f"Profile report written: {report_path}")
+        return report_path
+
+
 class ProfessionalDashboardParser:
     """Parser for Robot Framework XML files with professional metrics"""
     
-    def __init__(self):
+    def __init__(self, profiler: Optional[DashboardProfiler] = None):
         self.all_data = []
+        self.profiler = profiler or DashboardProfiler()
         
     def parse_all_xml_files(self, root_dir: str = ".") -> Dict:
         """Parse all XML files and generate professional metrics"""
+        all_tests, all_suites = self.parse_results(root_dir)
+        with self.profiler.phase('parse'):
+            page_metrics = self._parse_page_metrics(root_dir)
+        
+        return self.build_dashboard_data(all_tests, all_suites, page_metrics)
+    
+    def parse_results(self, root_dir: str = ".") -> tuple:
+        """Test and suite records from every result file under root_dir"""
         logger.info(f"Scanning for test results in: {root_dir}")
         
-        xml_files = self._find_all_xml_files(root_dir)
-        logger.info(f"Found {len(xml_files)} test result files")
+        with self.profiler.phase('discovery'):
+            event_files = []
+            for path in self._find_all_event_files(root_dir):
+                if _events_are_current(path):
+                    event_files.append(path)
+                else:
+                    logger.info(f"Ignoring {path}, the output.xml next to it is from a later run")
+            # A run streamed through DashboardListener is already covered by its event file
+            event_dirs = {os.path.dirname(path) for path in event_files}
+            xml_files = [path for path in self._find_all_xml_files(root_dir)
+                         if os.path.dirname(path) not in event_dirs]
+        logger.info(f"Found {len(xml_files) + len(event_files)} test result files")
         
+        with self.profiler.phase('parse'):
+            return self._parse_result_files(event_files, xml_files)
+    
+    def _parse_result_files(self, event_files: List[str], xml_files: List[str]) -> tuple:
+        """Test and suite records from event streams and output.xml files"""
         all_suites = []
         all_tests = []
         
+        for event_file in event_files:
+            replay = ListenerEventReplay(event_file, self)
+            with open(event_file, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        replay.feed(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.debug(f"Skipped malformed line in {event_file}")
+            all_suites.extend(replay.suites)
+            all_tests.extend(replay.tests)
+        
         for xml_file in xml_files:
             try:
                 data = self._parse_xml_file(xml_file)
@@ -86,24 +454,60 @@ class ProfessionalDashboardParser:
             except Exception as e:
                 logger.warning(f"Skipped {xml_file}: {e}")
         
+        return all_tests, all_suites
+    
+    def build_dashboard_data(self, all_tests: List[Dict], all_suites: List[Dict], page_metrics: List[Dict]) -> Dict:
+        """Derive metrics, charts and insights from already parsed records"""
         # Calculate professional metrics
-        metrics = self._calculate_metrics(all_tests, all_suites)
+        with self.profiler.phase('metrics'):
+            metrics = self._calculate_metrics(all_tests, all_suites)
+            keyword_profile = self._aggregate_keyword_profile(all_tests)
         
         # Generate visualizations data
-        charts_data = self._prepare_charts_data(all_tests, all_suites)
+        with self.profiler.phase('charts'):
+            charts_data = self._prepare_charts_data(all_tests, all_suites)
+            charts_data['page_performance'] = self._prepare_page_performance(page_metrics)
         
         # Generate insights
-        insights = self._generate_insights(all_tests, all_suites, metrics)
+        with self.profiler.phase('insights'):
+            insights = self._generate_insights(all_tests, all_suites, metrics)
+            failure_clusters = FailureClusterer().cluster(all_tests)
         
         return {
+            'keyword_profile': keyword_profile,
+            'failure_clusters': failure_clusters,
             'metrics': metrics,
             'suites': all_suites,
             'tests': all_tests,
             'charts': charts_data,
             'insights': insights,
+            'page_metrics': page_metrics,
             'timestamp': datetime.now().isoformat()
         }
     
+    def _aggregate_keyword_profile(self, all_tests: List[Dict]) -> List[Dict]:
+        """Keyword self/total time across all tests, hottest self time first"""
+        totals = defaultdict(lambda: [0, 0.0, 0.0, 0])
+        for test in all_tests:
+            for key, (calls, total, own) in test.get('keyword_stats', {}).items():
+                entry = totals[key]
+                entry[0] += calls
+                entry[1] += total
+                entry[2] += own
+                entry[3] += 1
+        
+        profile = [{
+            'library': library,
+            'name': name,
+            'calls': calls,
+            'total_time': total,
+            'self_time': own,
+            'avg_time': total / calls if calls else 0.0,
+            'tests': tests
+        } for (library, name), (calls, total, own, tests) in totals.items()]
+        profile.sort(key=lambda k: k['self_time'], reverse=True)
+        return profile
+    
     def _find_all_xml_files(self, root_dir: str) -> List[str]:
         """Find all output.xml files"""
         xml_files = []
@@ -113,6 +517,42 @@ class ProfessionalDashboardParser:
                     xml_files.append(os.path.join(root, file))
         return xml_files
     
+    def _find_all_event_files(self, root_dir: str) -> List[str]:
+        """Find all DashboardListener event streams"""
+        event_files = []
+        for root, dirs, files in os.walk(root_dir):
+            if EVENTS_FILE in files:
+                event_files.append(os.path.join(root, EVENTS_FILE))
+        return event_files
+    
+    def _parse_page_metrics(self, root_dir: str) -> List[Dict]:
+        """Load page timing records written by PlaywrightLibrary"""
+        records = []
+        for root, dirs, files in os.walk(root_dir):
+            if 'page_metrics.jsonl' not in files:
+                continue
+            metrics_file = os.path.join(root, 'page_metrics.jsonl')
+            with open(metrics_file, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        logger.debug(f"Skipped malformed line in {metrics_file}")
+        records.sort(key=lambda r: r.get('timestamp', ''))
+        return records
+    
+    def _prepare_page_performance(self, page_metrics: List[Dict]) -> Dict:
+        """Per-page load and LCP series over time"""
+        series = defaultdict(list)
+        for record in page_metrics:
+            series[record.get('page', 'unknown')].append({
+                'time': record.get('timestamp', ''),
+                'load': record.get('load'),
+                'lcp': record.get('lcp'),
+                'ttfb': record.get('ttfb')
+            })
+        return dict(series)
+    
     def _parse_xml_file(self, xml_file: str) -> Dict:
         """Parse single XML file"""
         tree = ET.parse(xml_file)
@@ -121,39 +561,44 @@ class ProfessionalDashboardParser:
         suites = []
         tests = []
         
-        for suite_elem in root.findall('.//suite'):
-            suite_data = self._parse_suite(suite_elem, xml_file)
-            if suite_data:
-                suites.append(suite_data)
-                tests.extend(suite_data['tests'])
+        def walk(parent, parent_longname: str):
+            for suite_elem in parent.findall('suite'):
+                name = suite_elem.get('name', '')
+                longname = f"{parent_longname}.{name}" if parent_longname else name
+                suite_data = self._parse_suite(suite_elem, xml_file, longname)
+                if suite_data:
+                    suites.append(suite_data)
+                    tests.extend(suite_data['tests'])
+                walk(suite_elem, longname)
         
+        walk(root, '')
         return {'suites': suites, 'tests': tests}
     
-    def _parse_suite(self, suite_elem, source_file: str) -> Dict:
+    def _parse_suite(self, suite_elem, source_file: str, longname: str = '') -> Dict:
         """Parse test suite"""
         suite_name = suite_elem.get('name', '')
         status_elem = suite_elem.find('status')
         
-        if status_elem is not None:
-            status = status_elem.get('status', 'PASS')
-            start_time = status_elem.get('start', '')
-            elapsed = float(status_elem.get('elapsed', 0)) / 1000.0
-        else:
-            status = 'PASS'
-            start_time = ''
-            elapsed = 0.0
+        status = status_elem.get('status', 'PASS') if status_elem is not None else 'PASS'
+        start_time, elapsed = _status_timing(status_elem)
         
         tests = []
         for test_elem in suite_elem.findall('test'):
-            test_data = self._parse_test(test_elem, suite_name)
+            test_data = self._parse_test(test_elem, suite_name, longname)
             if test_data:
                 tests.append(test_data)
         
+        return self._suite_record(suite_name, status, start_time, elapsed, tests, source_file, longname)
+    
+    def _suite_record(self, suite_name: str, status: str, start_time: str, elapsed: float,
+                      tests: List[Dict], source_file: str, longname: str = '') -> Dict:
+        """Suite record shared by the XML and listener-event paths"""
         passed = sum(1 for t in tests if t['status'] == 'PASS')
         failed = sum(1 for t in tests if t['status'] == 'FAIL')
         
         return {
             'name': suite_name,
+            'longname': longname or suite_name,
             'status': status,
             'start_time': start_time,
             'elapsed_time': elapsed,
@@ -165,28 +610,50 @@ class ProfessionalDashboardParser:
             'source': source_file
         }
     
-    def _parse_test(self, test_elem, suite_name: str) -> Dict:
+    def _parse_test(self, test_elem, suite_name: str, suite_longname: str = '') -> Dict:
         """Parse test case"""
         test_name = test_elem.get('name', '')
         status_elem = test_elem.find('status')
         
         if status_elem is not None:
             status = status_elem.get('status', 'PASS')
-            start_time = status_elem.get('start', '')
-            elapsed = float(status_elem.get('elapsed', 0)) / 1000.0
             error = status_elem.text if status_elem.text else ""
         else:
             status = 'PASS'
-            start_time = ''
-            elapsed = 0.0
             error = ""
+        start_time, elapsed = _status_timing(status_elem)
         
         tags = [tag.text for tag in test_elem.findall('tag') if tag.text]
         doc_elem = test_elem.find('doc')
         doc = doc_elem.text if doc_elem is not None else ""
         
+        profiler = KeywordProfiler()
+        self._profile_keywords(test_elem, profiler)
+        
+        return self._test_record(test_name, suite_name, status, start_time, elapsed, error, tags, doc, profiler,
+                                 suite_longname)
+    
+    def _profile_keywords(self, parent_elem, profiler: KeywordProfiler):
+        """Walk <kw> elements, descending through control structures"""
+        for child in parent_elem:
+            if child.tag == 'kw':
+                # Robot Framework 7 renamed 'library' to 'owner'
+                profiler.start(child.get('name', ''), child.get('library') or child.get('owner'))
+                self._profile_keywords(child, profiler)
+                profiler.end(_status_timing(child.find('status'))[1])
+            elif child.tag in CONTROL_TAGS:
+                profiler.start(child.tag.upper(), '', is_keyword=False)
+                self._profile_keywords(child, profiler)
+                profiler.end()
+    
+    def _test_record(self, test_name: str, suite_name: str, status: str, start_time: str, elapsed: float,
+                     error: str, tags: List[str], doc: str, profiler: Optional[KeywordProfiler] = None,
+                     suite_longname: str = '') -> Dict:
+        """Test record shared by the XML and listener-event paths"""
+        profiler = profiler or KeywordProfiler()
         return {
             'name': test_name,
+            'longname': f"{suite_longname or suite_name}.{test_name}",
             'suite': suite_name,
             'status': status,
             'start_time': start_time,
@@ -194,7 +661,9 @@ class ProfessionalDashboardParser:
             'error': error,
             'tags': tags,
             'doc': doc,
-            'critical': 'critical' in tags or 'smoke' in tags
+            'critical': 'critical' in tags or 'smoke' in tags,
+            'keyword_stats': profiler.stats,
+            'flame': profiler.flame(elapsed)
         }
     
     def _calculate_metrics(self, all_tests: List[Dict], all_suites: List[Dict]) -> DashboardMetrics:
@@ -337,36 +806,179 @@ class ProfessionalDashboardParser:
         
         return insights
 
-class ProfessionalDashboardGenerator:
-    """Generate professional-grade HTML dashboard"""
+# Listener keyword event types that are real keywords rather than control structures
+KEYWORD_EVENT_TYPES = ('KEYWORD', 'SETUP', 'TEARDOWN')
+
+
+class ListenerEventReplay:
+    """Rebuild suite and test records from a DashboardListener event stream"""
     
-    def generate(self, data: Dict, output_path: str = "professional_dashboard.html"):
-        """Generate professional dashboard HTML"""
-        logger.info(f"Generating professional dashboard: {output_path}")
-        
-        html = self._generate_html(data)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-        
-        logger.info(f"Professional dashboard generated: {output_path}")
-        return output_path
+    def __init__(self, source_file: str, parser: ProfessionalDashboardParser):
+        self.source_file = source_file
+        self.parser = parser
+        self.suites = []
+        self.tests = []
+        self.open_suites = []
+        self.open_tests = {}
+        # Keywords are profiled only inside tests
+        self.profiler = None
+        self.keyword_starts = []
     
-    def _generate_html(self, data: Dict) -> str:
-        """Generate complete HTML"""
-        metrics = data['metrics']
-        
-        return f"""<!DOCTYPE html>
+    def feed(self, record: Dict) -> bool:
+        """Apply one event; True when it completed a test or suite"""
+        event = record.get('event')
+        if event == 'start_suite':
+            # Streams from older listeners append every run; only the latest one is kept
+            restarted = not self.open_suites and bool(self.suites or self.tests)
+            if restarted:
+                self.suites, self.tests = [], []
+            self.open_suites.append({'name': record['name'], 'start': record['t'], 'tests': []})
+            return restarted
+        elif event == 'start_test':
+            self.open_tests[record['id']] = record
+            self.keyword_starts = []
+            self.profiler = KeywordProfiler()
+        elif event == 'start_keyword' and self.profiler:
+            self.keyword_starts.append(record['t'])
+            self.profiler.start(record['name'], record.get('library', ''),
+                                is_keyword=record.get('type') in KEYWORD_EVENT_TYPES)
+        elif event == 'end_keyword' and self.keyword_starts:
+            self.profiler.end(record['t'] - self.keyword_starts.pop())
+        elif event == 'end_test' and record['id'] in self.open_tests:
+            start = self.open_tests.pop(record['id'])
+            suite = self.open_suites[-1] if self.open_suites else {'name': '', 'tests': []}
+            test = self.parser._test_record(
+                start['name'], suite['name'], record['status'], self._timestamp(start['t']),
+                record['t'] - start['t'], record.get('message', ''), start.get('tags', []), start.get('doc', ''),
+                self.profiler, self._longname()
+            )
+            self.profiler = None
+            suite['tests'].append(test)
+            self.tests.append(test)
+            return True
+        elif event == 'end_suite' and self.open_suites:
+            longname = self._longname()
+            suite = self.open_suites.pop()
+            self.suites.append(self.parser._suite_record(
+                suite['name'], record['status'], self._timestamp(suite['start']),
+                record['t'] - suite['start'], suite['tests'], self.source_file, longname
+            ))
+            return True
+        return False
+    
+    def _longname(self) -> str:
+        return '.'.join(suite['name'] for suite in self.open_suites)
+    
+    def _timestamp(self, epoch: float) -> str:
+        return datetime.fromtimestamp(epoch).isoformat()
+
+
+def _compile_template(template: str) -> Callable[..., str]:
+    """Validate a str.format-style template at import time and return its renderer"""
+    for _, field, spec, _ in string.Formatter().parse(template):
+        if field is not None and not field:
+            raise ValueError(f"Template placeholders must be named: {template[:60]!r}")
+        if spec and '{' in spec:
+            raise ValueError(f"Nested template placeholders are not supported: {field!r}")
+    return template.format
+
+
+ROW_CHUNK_SIZE = 500
+
+VENDOR_DIR = Path(__file__).resolve().parent / 'vendor' / 'dashboard'
+CHARTJS_ASSET = 'chartjs-4.4.0/chart.umd.min.js'
+FONTAWESOME_CSS_ASSETS = ('fontawesome-free-6.6.0/fontawesome.min.css', 'fontawesome-free-6.6.0/solid.min.css')
+FONTAWESOME_FONT_ASSET = 'fontawesome-free-6.6.0/fa-solid-900.woff2'
+INTER_FONT_ASSETS = {
+    400: 'inter-4.001/Inter-Regular.latin.woff2',
+    500: 'inter-4.001/Inter-Medium.latin.woff2',
+    600: 'inter-4.001/Inter-SemiBold.latin.woff2',
+    700: 'inter-4.001/Inter-Bold.latin.woff2'
+}
+
+
+@lru_cache(maxsize=None)
+def _bundled_assets() -> tuple:
+    """Read vendored assets once and return the inline head and Chart.js markup"""
+    def font_url(asset: str) -> str:
+        encoded = base64.b64encode((VENDOR_DIR / asset).read_bytes()).decode('ascii')
+        return f"url(data:font/woff2;base64,{encoded}) format(\"woff2\")"
+
+    try:
+        font_faces = ''.join(
+            f'@font-face{{font-family:"Inter";font-style:normal;font-weight:{weight};'
+            f'font-display:swap;src:{font_url(asset)}}}'
+            for weight, asset in INTER_FONT_ASSETS.items()
+        )
+        icons_css = ''.join((VENDOR_DIR / asset).read_text(encoding='utf-8') for asset in FONTAWESOME_CSS_ASSETS)
+        icons_css = re.sub(r'src:url\(\.\./webfonts/fa-solid-900\.woff2\)[^;}]*',
+                           lambda _: f"src:{font_url(FONTAWESOME_FONT_ASSET)}", icons_css)
+        chartjs = (VENDOR_DIR / CHARTJS_ASSET).read_text(encoding='utf-8')
+    except OSError as e:
+        logger.error(f"Vendored dashboard assets missing under {VENDOR_DIR}: {e}")
+        raise
+
+    return (f"    <style>{font_faces}{icons_css}</style>\n",
+            f"    <script>{chartjs}</script>\n")
+
+
+CHART_DATA_DECODER = """
+        async function decodeChartData(encoded) {
+            const bytes = Uint8Array.from(atob(encoded), c => c.charCodeAt(0));
+            const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+            return JSON.parse(await new Response(stream).text());
+        }
+"""
+
+LIVE_UPDATE_SCRIPT = """
+        // Live updates pushed by `dashboard.py serve`
+        const liveSections = ['.metrics-grid', '.insights-grid', '.table-container'];
+        const liveCharts = ['statusChart', 'timeChart', 'suiteChart', 'pagePerfChart'];
+        new EventSource('/events').addEventListener('update', async () => {
+            const [page, chartData] = await Promise.all([
+                fetch('/').then(r => r.text()),
+                fetch('/data.json').then(r => r.json())
+            ]);
+            const fresh = new DOMParser().parseFromString(page, 'text/html');
+            if (fresh.querySelectorAll('.table-section').length !== document.querySelectorAll('.table-section').length) {
+                location.reload();
+                return;
+            }
+            liveSections.forEach(selector => {
+                const current = document.querySelectorAll(selector);
+                fresh.querySelectorAll(selector).forEach((section, i) => {
+                    if (current[i]) current[i].innerHTML = section.innerHTML;
+                });
+            });
+            liveCharts.forEach(id => {
+                const chart = Chart.getChart(id);
+                if (chart) chart.destroy();
+            });
+            const pagePerfCard = document.getElementById('pagePerfChart').closest('.chart-card');
+            pagePerfCard.style.display = Object.keys(chartData.page_performance).length ? '' : 'none';
+            renderCharts(chartData);
+            document.getElementById('testSearch').dispatchEvent(new Event('input'));
+            document.getElementById('statusFilter').dispatchEvent(new Event('change'));
+        });
+"""
+
+HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>MetLife Test Monitoring Dashboard</title>
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
+"""
+
+CDN_ASSETS = """    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css" rel="stylesheet">
     <script src="https://cdn.jsdelivr.net/npm/chart.js@4.4.0/dist/chart.umd.js"></script>
-    <style>
-        {self._get_professional_css()}
+"""
+
+STYLE_OPEN = """    <style>
+        """
+
+OVERVIEW_TEMPLATE = _compile_template("""
     </style>
 </head>
 <body>
@@ -403,8 +1015,8 @@ class ProfessionalDashboardGenerator:
             </nav>
             <div class="sidebar-footer">
                 <div class="status-indicator">
-                    <span class="status-dot {'success' if metrics.system_health >= 80 else 'warning' if metrics.system_health >= 60 else 'error'}"></span>
-                    <span>System {'Healthy' if metrics.system_health >= 80 else 'Warning' if metrics.system_health >= 60 else 'Critical'}</span>
+                    <span class="status-dot {health_status_class}"></span>
+                    <span>System {health_status_text}</span>
                 </div>
             </div>
         </aside>
@@ -440,7 +1052,7 @@ class ProfessionalDashboardGenerator:
                             <span class="metric-label">Total Tests</span>
                             <i class="fas fa-list-check metric-icon"></i>
                         </div>
-                        <div class="metric-value">{metrics.total_tests:,}</div>
+                        <div class="metric-value">{total_tests:,}</div>
                         <div class="metric-footer">
                             <span class="metric-change positive">
                                 <i class="fas fa-arrow-up"></i> Active
@@ -453,10 +1065,10 @@ class ProfessionalDashboardGenerator:
                             <span class="metric-label">Pass Rate</span>
                             <i class="fas fa-check-circle metric-icon"></i>
                         </div>
-                        <div class="metric-value">{metrics.pass_rate:.1f}%</div>
+                        <div class="metric-value">{pass_rate:.1f}%</div>
                         <div class="metric-footer">
-                            <span class="metric-change {'positive' if metrics.pass_rate >= 90 else 'negative'}">
-                                {metrics.passed_tests} passed / {metrics.failed_tests} failed
+                            <span class="metric-change {pass_rate_class}">
+                                {passed_tests} passed / {failed_tests} failed
                             </span>
                         </div>
                     </div>
@@ -466,10 +1078,10 @@ class ProfessionalDashboardGenerator:
                             <span class="metric-label">Avg Execution Time</span>
                             <i class="fas fa-clock metric-icon"></i>
                         </div>
-                        <div class="metric-value">{self._format_duration(metrics.avg_execution_time)}</div>
+                        <div class="metric-value">{avg_execution_time}</div>
                         <div class="metric-footer">
                             <span class="metric-change">
-                                Total: {self._format_duration(metrics.total_execution_time)}
+                                Total: {total_execution_time}
                             </span>
                         </div>
                     </div>
@@ -479,11 +1091,11 @@ class ProfessionalDashboardGenerator:
                             <span class="metric-label">System Health</span>
                             <i class="fas fa-heartbeat metric-icon"></i>
                         </div>
-                        <div class="metric-value">{metrics.system_health:.0f}%</div>
+                        <div class="metric-value">{system_health:.0f}%</div>
                         <div class="metric-footer">
-                            <span class="metric-change {'positive' if metrics.system_health >= 80 else 'negative'}">
-                                <i class="fas fa-{'arrow-up' if metrics.system_health >= 80 else 'arrow-down'}"></i>
-                                {'Excellent' if metrics.system_health >= 90 else 'Good' if metrics.system_health >= 80 else 'Needs Attention'}
+                            <span class="metric-change {health_change_class}">
+                                <i class="fas fa-{health_arrow}"></i>
+                                {health_label}
                             </span>
                         </div>
                     </div>
@@ -526,13 +1138,40 @@ class ProfessionalDashboardGenerator:
                             <canvas id="suiteChart"></canvas>
                         </div>
                     </div>
+
+                    <div class="chart-card wide" {page_performance_style}>
+                        <div class="card-header">
+                            <h3>Page Load Performance</h3>
+                            <div class="card-actions">
+                                <button class="btn-icon-sm"><i class="fas fa-expand"></i></button>
+                            </div>
+                        </div>
+                        <div class="chart-container">
+                            <canvas id="pagePerfChart"></canvas>
+                        </div>
+                    </div>
                 </section>
 
                 <!-- Insights Section -->
                 <section class="insights-section">
                     <h2>Actionable Insights</h2>
                     <div class="insights-grid">
-                        {self._generate_insights_html(data['insights'])}
+                        """)
+
+FAILURE_CLUSTERS_SECTION_OPEN = """
+                    </div>
+                </section>
+
+                <!-- Failure Clusters -->
+                <section class="table-section">
+                    <div class="table-header">
+                        <h2>Failure Clusters</h2>
+                        <span class="breadcrumb">{failures} failures in {clusters} clusters</span>
+                    </div>
+                    <div class="table-container">
+                        """
+
+SUITES_SECTION_OPEN = """
                     </div>
                 </section>
 
@@ -554,7 +1193,9 @@ class ProfessionalDashboardGenerator:
                         </div>
                     </div>
                     <div class="table-container">
-                        {self._generate_suites_table(data['suites'])}
+                        """
+
+TESTS_SECTION_OPEN = """
                     </div>
                 </section>
 
@@ -575,18 +1216,435 @@ class ProfessionalDashboardGenerator:
                         </div>
                     </div>
                     <div class="table-container">
-                        {self._generate_tests_table(data['tests'])}
+                        """
+
+KEYWORDS_SECTION_OPEN = """
+                    </div>
+                </section>
+
+                <!-- Keyword Profile -->
+                <section class="table-section">
+                    <div class="table-header">
+                        <h2>Hot Keywords</h2>
+                        <span class="breadcrumb">Ranked by self time across all tests</span>
+                    </div>
+                    <div class="table-container">
+                        """
+
+FLAME_SECTION_OPEN = """
+                    </div>
+                </section>
+
+                <!-- Per-test Flame Graph -->
+                <section class="table-section">
+                    <div class="table-header">
+                        <h2>Keyword Flame Graph</h2>
+                        <span class="breadcrumb" id="flameTitle">Click a test execution to see where its time went</span>
+                    </div>
+                    <div class="flame-graph" id="flameGraph">
+"""
+
+LAYOUT_CLOSE = """
                     </div>
                 </section>
             </div>
         </main>
     </div>
 
-    <script>
-        {self._get_professional_javascript(data)}
+"""
+
+SCRIPT_OPEN = """    <script>
+        """
+
+HTML_TAIL = """
     </script>
 </body>
 </html>"""
+
+SUITES_TABLE_OPEN = """
+        <table>
+            <thead>
+                <tr>
+                    <th>Suite Name</th>
+                    <th>Status</th>
+                    <th>Tests</th>
+                    <th>Pass Rate</th>
+                    <th>Duration</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+SUITE_ROW_TEMPLATE = _compile_template("""
+            <tr>
+                <td><strong>{name}</strong></td>
+                <td><span class="status-badge {status_class}">{status}</span></td>
+                <td>{passed} / {total}</td>
+                <td>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {pass_rate}%"></div>
+                    </div>
+                    {pass_rate:.1f}%
+                </td>
+                <td>{duration}</td>
+            </tr>
+            """)
+
+TESTS_TABLE_OPEN = """
+        <table id="testsTable">
+            <thead>
+                <tr>
+                    <th>Test Name</th>
+                    <th>Suite</th>
+                    <th>Status</th>
+                    <th>Duration</th>
+                    <th>Tags</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+TEST_ROW_TEMPLATE = _compile_template("""
+            <tr data-status="{status}" data-index="{index}" class="flame-row">
+                <td><strong>{name}</strong></td>
+                <td>{suite}</td>
+                <td><span class="status-badge {status_class}">{status}</span></td>
+                <td>{duration}</td>
+                <td>{tags}</td>
+            </tr>
+            """)
+
+CLUSTERS_TABLE_OPEN = """
+        <table id="clustersTable">
+            <thead>
+                <tr>
+                    <th>Signature</th>
+                    <th>Failures</th>
+                    <th>Variants</th>
+                    <th>Affected Tests</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+CLUSTER_ROW_TEMPLATE = _compile_template("""
+            <tr>
+                <td><strong>{signature}</strong><br><small title="Example message">{example}</small></td>
+                <td><span class="status-badge fail">{count}</span></td>
+                <td>{variants}</td>
+                <td>{tests}</td>
+            </tr>
+            """)
+
+KEYWORDS_TABLE_OPEN = """
+        <table id="keywordsTable">
+            <thead>
+                <tr>
+                    <th>Keyword</th>
+                    <th>Library</th>
+                    <th>Calls</th>
+                    <th>Self Time</th>
+                    <th>Total Time</th>
+                    <th>Avg / Call</th>
+                    <th>Tests</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+KEYWORD_ROW_TEMPLATE = _compile_template("""
+            <tr>
+                <td><strong>{name}</strong></td>
+                <td>{library}</td>
+                <td>{calls}</td>
+                <td>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {self_share:.1f}%; background: var(--warning-color);"></div>
+                    </div>
+                    {self_time}
+                </td>
+                <td>{total_time}</td>
+                <td>{avg_time}</td>
+                <td>{tests}</td>
+            </tr>
+            """)
+
+PROFILE_SECTION_OPEN = """
+                    </div>
+                </section>
+
+                <!-- Generation Profile -->
+                <section class="table-section">
+                    <div class="table-header">
+                        <h2>Generation Profile</h2>
+                        <span class="breadcrumb">{summary}</span>
+                    </div>
+                    <div class="table-container">
+                        """
+
+PROFILE_PHASES_TABLE_OPEN = """
+        <table id="profilePhasesTable">
+            <thead>
+                <tr>
+                    <th>Phase</th>
+                    <th>Wall Time</th>
+                    <th>Peak Memory</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+PROFILE_PHASE_ROW_TEMPLATE = _compile_template("""
+            <tr>
+                <td><strong>{phase}</strong></td>
+                <td>
+                    <div class="progress-bar">
+                        <div class="progress-fill" style="width: {share:.1f}%;"></div>
+                    </div>
+                    {seconds} ({share:.1f}%)
+                </td>
+                <td>{peak_memory}</td>
+            </tr>
+            """)
+
+PROFILE_FUNCTIONS_TABLE_OPEN = """
+        <table id="profileFunctionsTable">
+            <thead>
+                <tr>
+                    <th>Function</th>
+                    <th>Location</th>
+                    <th>Calls</th>
+                    <th>Self Time</th>
+                    <th>Cumulative Time</th>
+                </tr>
+            </thead>
+            <tbody>
+        """
+
+PROFILE_FUNCTION_ROW_TEMPLATE = _compile_template("""
+            <tr>
+                <td><strong>{function}</strong></td>
+                <td><small>{location}</small></td>
+                <td>{calls:,}</td>
+                <td>{self_time}</td>
+                <td>{cumulative_time}</td>
+            </tr>
+            """)
+
+TAG_TEMPLATE = _compile_template(
+    '<span class="status-badge" style="background: rgba(37, 99, 235, 0.1); color: var(--primary-color);">{tag}</span>'
+)
+
+TABLE_CLOSE = "</tbody></table>"
+
+COMPARISON_TEMPLATE = _compile_template("""
+    </style>
+</head>
+<body>
+    <main class="content-area">
+        <header class="top-bar">
+            <div class="top-bar-left">
+                <h1>Run Comparison</h1>
+                <span class="breadcrumb">{baseline} &rarr; {current}</span>
+            </div>
+        </header>
+
+        <section class="metrics-grid">
+            <div class="metric-card error">
+                <div class="metric-header">
+                    <span class="metric-label">New Failures</span>
+                    <i class="fas fa-times-circle metric-icon"></i>
+                </div>
+                <div class="metric-value">{new_failures:,}</div>
+                <div class="metric-footer"><span class="metric-change positive">{fixed:,} fixed</span></div>
+            </div>
+
+            <div class="metric-card info">
+                <div class="metric-header">
+                    <span class="metric-label">Test Inventory</span>
+                    <i class="fas fa-list-check metric-icon"></i>
+                </div>
+                <div class="metric-value">{current_tests:,}</div>
+                <div class="metric-footer"><span class="metric-change">was {baseline_tests:,}: +{added:,} added / -{removed:,} removed</span></div>
+            </div>
+
+            <div class="metric-card warning">
+                <div class="metric-header">
+                    <span class="metric-label">Slower Tests</span>
+                    <i class="fas fa-arrow-up metric-icon"></i>
+                </div>
+                <div class="metric-value">{slower:,}</div>
+                <div class="metric-footer"><span class="metric-change">{faster:,} significantly faster</span></div>
+            </div>
+        </section>
+""")
+
+COMPARISON_SECTION_OPEN = _compile_template("""
+        <section class="table-section">
+            <div class="table-header">
+                <h2>{title}</h2>
+                <span class="breadcrumb">{shown}</span>
+            </div>
+            <div class="table-container">
+                <table>
+                    <thead><tr>{headers}</tr></thead>
+                    <tbody>
+""")
+
+COMPARISON_ROW_TEMPLATE = _compile_template("""                        <tr>{cells}</tr>
+""")
+
+COMPARISON_SECTION_CLOSE = """                    </tbody>
+                </table>
+            </div>
+        </section>
+"""
+
+COMPARISON_TAIL = """
+    </main>
+</body>
+</html>"""
+
+class ProfessionalDashboardGenerator:
+    """Generate professional-grade HTML dashboard"""
+    
+    def __init__(self, max_suite_rows: Optional[int] = 20, max_test_rows: Optional[int] = 50,
+                 bundle_assets: bool = False, compress_data: bool = False, live_updates: bool = False,
+                 hot_keywords: int = HOT_KEYWORD_LIMIT, max_clusters: int = 20,
+                 profiler: Optional[DashboardProfiler] = None):
+        self.max_suite_rows = max_suite_rows
+        self.max_test_rows = max_test_rows
+        self.max_clusters = max_clusters
+        self.hot_keywords = hot_keywords
+        self.bundle_assets = bundle_assets
+        self.compress_data = compress_data
+        self.live_updates = live_updates
+        self.profiler = profiler or DashboardProfiler()
+    
+    def generate(self, data: Dict, output_path: str = "professional_dashboard.html"):
+        """Generate professional dashboard HTML"""
+        logger.info(f"Generating professional dashboard: {output_path}")
+        
+        if self.profiler.active:
+            # Render into memory first so rendering and disk writes are timed separately
+            buffer = io.StringIO()
+            with self.profiler.phase('render'):
+                self.render(data, buffer)
+            with self.profiler.phase('write'):
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write(buffer.getvalue())
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                self.render(data, f)
+        
+        logger.info(f"Professional dashboard generated: {output_path}")
+        return output_path
+    
+    def render(self, data: Dict, out: TextIO):
+        """Stream the dashboard to any file-like object, one section at a time"""
+        out.write(HTML_HEAD)
+        if self.bundle_assets:
+            bundled_head, bundled_chartjs = _bundled_assets()
+            out.write(bundled_head)
+        else:
+            out.write(CDN_ASSETS)
+        out.write(STYLE_OPEN)
+        out.write(self._get_professional_css())
+        out.write(OVERVIEW_TEMPLATE(**self._overview_fields(data)))
+        out.write(self._generate_insights_html(data['insights']))
+        clusters = data.get('failure_clusters', [])
+        if clusters:
+            out.write(FAILURE_CLUSTERS_SECTION_OPEN.format(failures=sum(c['count'] for c in clusters),
+                                                           clusters=len(clusters)))
+            self._write_clusters_table(out, clusters)
+        out.write(SUITES_SECTION_OPEN)
+        self._write_suites_table(out, data['suites'])
+        out.write(TESTS_SECTION_OPEN)
+        self._write_tests_table(out, data['tests'])
+        out.write(KEYWORDS_SECTION_OPEN)
+        self._write_keywords_table(out, data.get('keyword_profile', []))
+        out.write(FLAME_SECTION_OPEN)
+        if data.get('profile'):
+            self._write_profile_section(out, data['profile'])
+        out.write(LAYOUT_CLOSE)
+        if self.bundle_assets:
+            out.write(bundled_chartjs)
+        out.write(SCRIPT_OPEN)
+        out.write(self._get_professional_javascript(data))
+        if self.live_updates:
+            out.write(LIVE_UPDATE_SCRIPT)
+        out.write(HTML_TAIL)
+    
+    def _generate_html(self, data: Dict) -> str:
+        """Generate complete HTML"""
+        buffer = io.StringIO()
+        self.render(data, buffer)
+        return buffer.getvalue()
+    
+    def generate_comparison(self, diff: Dict, baseline: str, current: str,
+                            output_path: str = "run_comparison.html", max_rows: int = 200) -> str:
+        """Write the run-to-run diff as HTML plus the complete diff as JSON"""
+        logger.info(f"Generating run comparison: {output_path}")
+        
+        sections = [
+            ('New Failures', ['Test', 'Previously'], diff['new_failures'],
+             lambda d: [escape(d['name']), escape(d['was'])]),
+            ('Fixed Tests', ['Test'], diff['fixed'], lambda d: [escape(d['name'])]),
+            ('Significantly Slower', ['Test', 'Before', 'After', 'Change', 'z'], diff['slower'],
+             self._duration_cells),
+            ('Significantly Faster', ['Test', 'Before', 'After', 'Change', 'z'], diff['faster'],
+             self._duration_cells),
+            ('Added Tests', ['Test', 'Status'], diff['added'], lambda d: [escape(d['name']), d['status']]),
+            ('Removed Tests', ['Test', 'Last Status'], diff['removed'], lambda d: [escape(d['name']), d['status']])
+        ]
+        
+        with open(output_path, 'w', encoding='utf-8') as out:
+            out.write(HTML_HEAD)
+            out.write(_bundled_assets()[0] if self.bundle_assets else CDN_ASSETS)
+            out.write(STYLE_OPEN)
+            out.write(self._get_professional_css())
+            out.write(COMPARISON_TEMPLATE(baseline=escape(baseline), current=escape(current), **diff['summary']))
+            for title, headers, items, cells in sections:
+                if not items:
+                    continue
+                shown = f"{len(items):,} tests" if len(items) <= max_rows else f"First {max_rows:,} of {len(items):,}"
+                out.write(COMPARISON_SECTION_OPEN(title=title, shown=shown,
+                                                  headers=''.join(f"<th>{h}</th>" for h in headers)))
+                self._write_rows(out, (COMPARISON_ROW_TEMPLATE(cells=''.join(f"<td>{c}</td>" for c in cells(item)))
+                                       for item in items[:max_rows]))
+                out.write(COMPARISON_SECTION_CLOSE)
+            out.write(COMPARISON_TAIL)
+        
+        with open(f"{output_path}.json", 'w', encoding='utf-8') as f:
+            json.dump({'baseline': baseline, 'current': current, **diff}, f, indent=2)
+        
+        logger.info(f"Run comparison generated: {output_path}")
+        return output_path
+    
+    def _duration_cells(self, change: Dict) -> List[str]:
+        return [escape(change['name']), self._format_duration(change['before']),
+                self._format_duration(change['after']), f"{change['change_pct']:+.0f}%", f"{change['z']:.1f}"]
+    
+    def _overview_fields(self, data: Dict) -> Dict:
+        """Values for the overview template"""
+        metrics = data['metrics']
+        health = metrics.system_health
+        return {
+            'health_status_class': 'success' if health >= 80 else 'warning' if health >= 60 else 'error',
+            'health_status_text': 'Healthy' if health >= 80 else 'Warning' if health >= 60 else 'Critical',
+            'total_tests': metrics.total_tests,
+            'pass_rate': metrics.pass_rate,
+            'pass_rate_class': 'positive' if metrics.pass_rate >= 90 else 'negative',
+            'passed_tests': metrics.passed_tests,
+            'failed_tests': metrics.failed_tests,
+            'avg_execution_time': self._format_duration(metrics.avg_execution_time),
+            'total_execution_time': self._format_duration(metrics.total_execution_time),
+            'system_health': health,
+            'health_change_class': 'positive' if health >= 80 else 'negative',
+            'health_arrow': 'arrow-up' if health >= 80 else 'arrow-down',
+            'health_label': 'Excellent' if health >= 90 else 'Good' if health >= 80 else 'Needs Attention',
+            'page_performance_style': '' if data['charts'].get('page_performance') else 'style="display: none;"'
+        }
     
     def _get_professional_css(self) -> str:
         """Professional CSS styling"""
@@ -863,6 +1921,10 @@ class ProfessionalDashboardGenerator:
             color: var(--warning-color);
         }
 
+        .metric-card.error .metric-icon {
+            color: var(--error-color);
+        }
+
         .metric-value {
             font-size: 2.5rem;
             font-weight: 700;
@@ -1177,6 +2239,33 @@ class ProfessionalDashboardGenerator:
             transition: width 0.3s;
         }
 
+        /* Flame Graph */
+        tr.flame-row {
+            cursor: pointer;
+        }
+
+        .flame-graph {
+            position: relative;
+            min-height: 24px;
+            color: var(--text-tertiary);
+            font-size: 0.875rem;
+        }
+
+        .flame-frame {
+            position: absolute;
+            height: 22px;
+            line-height: 22px;
+            padding: 0 4px;
+            box-sizing: border-box;
+            border: 1px solid var(--bg-primary);
+            border-radius: 3px;
+            color: #fff;
+            font-size: 0.75rem;
+            white-space: nowrap;
+            overflow: hidden;
+            text-overflow: ellipsis;
+        }
+
         /* Animations */
         @keyframes pulse {
             0%, 100% {
@@ -1252,75 +2341,133 @@ class ProfessionalDashboardGenerator:
     
     def _generate_suites_table(self, suites: List[Dict]) -> str:
         """Generate suites table HTML"""
-        html = """
-        <table>
-            <thead>
-                <tr>
-                    <th>Suite Name</th>
-                    <th>Status</th>
-                    <th>Tests</th>
-                    <th>Pass Rate</th>
-                    <th>Duration</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for suite in suites[:20]:  # Show top 20 suites
-            html += f"""
-            <tr>
-                <td><strong>{suite['name']}</strong></td>
-                <td><span class="status-badge {'pass' if suite['status'] == 'PASS' else 'fail'}">{suite['status']}</span></td>
-                <td>{suite['passed']} / {suite['total']}</td>
-                <td>
-                    <div class="progress-bar">
-                        <div class="progress-fill" style="width: {suite['pass_rate']}%"></div>
-                    </div>
-                    {suite['pass_rate']:.1f}%
-                </td>
-                <td>{self._format_duration(suite['elapsed_time'])}</td>
-            </tr>
-            """
-        
-        html += "</tbody></table>"
-        return html
+        buffer = io.StringIO()
+        self._write_suites_table(buffer, suites)
+        return buffer.getvalue()
+    
+    def _write_suites_table(self, out: TextIO, suites: List[Dict]):
+        """Stream suites table rows in chunks"""
+        out.write(SUITES_TABLE_OPEN)
+        rows = suites if self.max_suite_rows is None else suites[:self.max_suite_rows]
+        self._write_rows(out, (SUITE_ROW_TEMPLATE(
+            name=escape(suite['name']),
+            status_class='pass' if suite['status'] == 'PASS' else 'fail',
+            status=suite['status'],
+            passed=suite['passed'],
+            total=suite['total'],
+            pass_rate=suite['pass_rate'],
+            duration=self._format_duration(suite['elapsed_time'])
+        ) for suite in rows))
+        out.write(TABLE_CLOSE)
     
     def _generate_tests_table(self, tests: List[Dict]) -> str:
         """Generate tests table HTML"""
-        html = """
-        <table id="testsTable">
-            <thead>
-                <tr>
-                    <th>Test Name</th>
-                    <th>Suite</th>
-                    <th>Status</th>
-                    <th>Duration</th>
-                    <th>Tags</th>
-                </tr>
-            </thead>
-            <tbody>
-        """
-        
-        for test in tests[:50]:  # Show top 50 tests
-            tags_html = ' '.join([f'<span class="status-badge" style="background: rgba(37, 99, 235, 0.1); color: var(--primary-color);">{tag}</span>' 
-                                 for tag in test['tags'][:3]])
-            
-            html += f"""
-            <tr data-status="{test['status']}">
-                <td><strong>{test['name']}</strong></td>
-                <td>{test['suite']}</td>
-                <td><span class="status-badge {'pass' if test['status'] == 'PASS' else 'fail'}">{test['status']}</span></td>
-                <td>{self._format_duration(test['elapsed_time'])}</td>
-                <td>{tags_html}</td>
-            </tr>
-            """
-        
-        html += "</tbody></table>"
-        return html
+        buffer = io.StringIO()
+        self._write_tests_table(buffer, tests)
+        return buffer.getvalue()
+    
+    def _write_tests_table(self, out: TextIO, tests: List[Dict]):
+        """Stream test table rows in chunks"""
+        out.write(TESTS_TABLE_OPEN)
+        rows = tests if self.max_test_rows is None else tests[:self.max_test_rows]
+        self._write_rows(out, (TEST_ROW_TEMPLATE(
+            index=index,
+            name=escape(test['name']),
+            suite=escape(test['suite']),
+            status=test['status'],
+            status_class='pass' if test['status'] == 'PASS' else 'fail',
+            duration=self._format_duration(test['elapsed_time']),
+            tags=' '.join(TAG_TEMPLATE(tag=escape(tag)) for tag in test['tags'][:3])
+        ) for index, test in enumerate(rows)))
+        out.write(TABLE_CLOSE)
+    
+    def _write_clusters_table(self, out: TextIO, clusters: List[Dict]):
+        """Largest failure clusters with a sample of affected tests"""
+        out.write(CLUSTERS_TABLE_OPEN)
+        self._write_rows(out, (CLUSTER_ROW_TEMPLATE(
+            signature=escape(cluster['signature']),
+            example=escape(cluster['example'][:200]),
+            count=cluster['count'],
+            variants=cluster['variants'],
+            tests=escape(', '.join(cluster['tests'][:CLUSTER_SAMPLE_TESTS])) + (
+                f" +{len(cluster['tests']) - CLUSTER_SAMPLE_TESTS} more"
+                if len(cluster['tests']) > CLUSTER_SAMPLE_TESTS else '')
+        ) for cluster in clusters[:self.max_clusters]))
+        out.write(TABLE_CLOSE)
+    
+    def _write_keywords_table(self, out: TextIO, profile: List[Dict]):
+        """Top keywords by self time"""
+        out.write(KEYWORDS_TABLE_OPEN)
+        hottest = profile[0]['self_time'] if profile and profile[0]['self_time'] else 1.0
+        self._write_rows(out, (KEYWORD_ROW_TEMPLATE(
+            name=escape(kw['name']),
+            library=escape(kw['library'] or '-'),
+            calls=kw['calls'],
+            self_share=kw['self_time'] / hottest * 100,
+            self_time=self._format_duration(kw['self_time']),
+            total_time=self._format_duration(kw['total_time']),
+            avg_time=self._format_duration(kw['avg_time']),
+            tests=kw['tests']
+        ) for kw in profile[:self.hot_keywords]))
+        out.write(TABLE_CLOSE)
+    
+    def _write_profile_section(self, out: TextIO, profile: Dict):
+        """Phase timings and hottest functions recorded by --profile up to the start of rendering"""
+        summary = f"{self._format_duration(profile['phase_time'])} in phases before rendering"
+        if profile.get('peak_memory'):
+            summary += f", peak {self._format_bytes(profile['peak_memory'])} traced"
+        out.write(PROFILE_SECTION_OPEN.format(summary=summary))
+        out.write(PROFILE_PHASES_TABLE_OPEN)
+        self._write_rows(out, (PROFILE_PHASE_ROW_TEMPLATE(
+            phase=phase['phase'],
+            seconds=self._format_duration(phase['seconds']),
+            share=phase['share'],
+            peak_memory=self._format_bytes(phase['peak_memory']) if phase['peak_memory'] is not None else '-'
+        ) for phase in profile['phases']))
+        out.write(TABLE_CLOSE)
+        out.write(PROFILE_FUNCTIONS_TABLE_OPEN)
+        self._write_rows(out, (PROFILE_FUNCTION_ROW_TEMPLATE(
+            function=escape(function['function']),
+            location=escape(function['location']),
+            calls=function['calls'],
+            self_time=self._format_duration(function['self_time']),
+            cumulative_time=self._format_duration(function['cumulative_time'])
+        ) for function in profile['functions_by_self_time']))
+        out.write(TABLE_CLOSE)
+    
+    def _write_rows(self, out: TextIO, rows: Iterable[str]):
+        """Write rendered rows in fixed-size chunks to bound memory"""
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= ROW_CHUNK_SIZE:
+                out.write(''.join(chunk))
+                chunk = []
+        if chunk:
+            out.write(''.join(chunk))
+    
+    def chart_payload(self, data: Dict) -> Dict:
+        """Chart data consumed by renderCharts()"""
+        charts = data['charts']
+        return {
+            'status_distribution': charts['status_distribution'],
+            'time_distribution': charts['time_distribution'],
+            'suite_performance': charts['suite_performance'],
+            'page_performance': charts.get('page_performance', {}),
+            # Aligned with the rendered test rows (data-index)
+            'flames': [{'name': test['name'], 'time': test['elapsed_time'], 'frames': test.get('flame', [])}
+                       for test in data['tests'][:self.max_test_rows]]
+        }
     
     def _get_professional_javascript(self, data: Dict) -> str:
         """Professional JavaScript"""
-        charts = data['charts']
+        payload = json.dumps(self.chart_payload(data)).replace('</', '<\\/')
+        
+        if self.compress_data:
+            encoded = base64.b64encode(gzip.compress(payload.encode('utf-8'), mtime=0)).decode('ascii')
+            chart_loader = f"{CHART_DATA_DECODER}\n        decodeChartData('{encoded}').then(renderCharts);"
+        else:
+            chart_loader = f"renderCharts({payload});"
         
         return f"""
         // Update clock
@@ -1344,108 +2491,210 @@ class ProfessionalDashboardGenerator:
             themeToggle.querySelector('i').className = newTheme === 'dark' ? 'fas fa-sun' : 'fas fa-moon';
         }});
 
+        // Keyword flame graph
+        let testFlames = [];
+        const flameColors = ['#2563eb', '#10b981', '#f59e0b', '#8b5cf6', '#06b6d4', '#ef4444'];
+        function libraryColor(library) {{
+            let hash = 0;
+            for (const c of library) hash = (hash * 31 + c.charCodeAt(0)) | 0;
+            return flameColors[Math.abs(hash) % flameColors.length];
+        }}
+
+        function showFlameGraph(index) {{
+            const flame = testFlames[index];
+            const graph = document.getElementById('flameGraph');
+            graph.innerHTML = '';
+            if (!flame) return;
+            document.getElementById('flameTitle').textContent = flame.name + ' (' + flame.time.toFixed(2) + 's)';
+            if (!flame.frames.length) {{
+                graph.textContent = 'No keyword timings recorded for this test';
+                graph.style.height = '';
+                return;
+            }}
+            const total = flame.time || flame.frames.reduce((sum, f) => sum + f.t, 0) || 1;
+            let depth = 0;
+            const draw = (frames, offset, level) => {{
+                if (frames.length) depth = Math.max(depth, level + 1);
+                frames.forEach(frame => {{
+                    const box = document.createElement('div');
+                    box.className = 'flame-frame';
+                    box.style.left = (offset / total * 100) + '%';
+                    box.style.width = (frame.t / total * 100) + '%';
+                    box.style.top = (level * 24) + 'px';
+                    box.style.background = libraryColor(frame.l);
+                    box.textContent = frame.n;
+                    box.title = (frame.l ? frame.l + '.' : '') + frame.n + ' - ' + frame.t.toFixed(3) + 's';
+                    graph.appendChild(box);
+                    draw(frame.c, offset, level + 1);
+                    offset += frame.t;
+                }});
+            }};
+            draw(flame.frames, 0, 0);
+            graph.style.height = (depth * 24) + 'px';
+        }}
+
+        document.addEventListener('click', e => {{
+            const row = e.target.closest('tr.flame-row');
+            if (row) showFlameGraph(Number(row.dataset.index));
+        }});
+
         // Chart.js defaults
         Chart.defaults.font.family = 'Inter, sans-serif';
         Chart.defaults.color = '#6b7280';
 
-        // Status Distribution Chart
-        new Chart(document.getElementById('statusChart'), {{
-            type: 'doughnut',
-            data: {{
-                labels: {json.dumps(list(charts['status_distribution'].keys()))},
-                datasets: [{{
-                    data: {json.dumps(list(charts['status_distribution'].values()))},
-                    backgroundColor: ['#10b981', '#ef4444', '#f59e0b'],
-                    borderWidth: 0
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        position: 'bottom',
-                        labels: {{
-                            padding: 15,
-                            usePointStyle: true
+        function renderCharts(chartData) {{
+            testFlames = chartData.flames;
+
+            // Status Distribution Chart
+            new Chart(document.getElementById('statusChart'), {{
+                type: 'doughnut',
+                data: {{
+                    labels: Object.keys(chartData.status_distribution),
+                    datasets: [{{
+                        data: Object.values(chartData.status_distribution),
+                        backgroundColor: ['#10b981', '#ef4444', '#f59e0b'],
+                        borderWidth: 0
+                    }}]
+                }},
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {{
+                        legend: {{
+                            position: 'bottom',
+                            labels: {{
+                                padding: 15,
+                                usePointStyle: true
+                            }}
                         }}
                     }}
                 }}
-            }}
-        }});
+            }});
 
-        // Time Distribution Chart
-        new Chart(document.getElementById('timeChart'), {{
-            type: 'bar',
-            data: {{
-                labels: {json.dumps(list(charts['time_distribution'].keys()))},
-                datasets: [{{
-                    label: 'Tests',
-                    data: {json.dumps(list(charts['time_distribution'].values()))},
-                    backgroundColor: '#3b82f6',
-                    borderRadius: 6
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
+            // Time Distribution Chart
+            new Chart(document.getElementById('timeChart'), {{
+                type: 'bar',
+                data: {{
+                    labels: Object.keys(chartData.time_distribution),
+                    datasets: [{{
+                        label: 'Tests',
+                        data: Object.values(chartData.time_distribution),
+                        backgroundColor: '#3b82f6',
+                        borderRadius: 6
+                    }}]
                 }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        grid: {{
-                            color: '#e5e7eb'
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {{
+                        legend: {{
+                            display: false
                         }}
                     }},
-                    x: {{
-                        grid: {{
-                            display: false
+                    scales: {{
+                        y: {{
+                            beginAtZero: true,
+                            grid: {{
+                                color: '#e5e7eb'
+                            }}
+                        }},
+                        x: {{
+                            grid: {{
+                                display: false
+                            }}
                         }}
                     }}
                 }}
-            }}
-        }});
+            }});
 
-        // Suite Performance Chart
-        const suiteData = {json.dumps(charts['suite_performance'])};
-        new Chart(document.getElementById('suiteChart'), {{
-            type: 'bar',
-            data: {{
-                labels: suiteData.map(s => s[0]),
-                datasets: [{{
-                    label: 'Duration (s)',
-                    data: suiteData.map(s => s[1]),
-                    backgroundColor: '#2563eb',
-                    borderRadius: 6
-                }}]
-            }},
-            options: {{
-                responsive: true,
-                maintainAspectRatio: false,
-                plugins: {{
-                    legend: {{
-                        display: false
-                    }}
+            // Suite Performance Chart
+            const suiteData = chartData.suite_performance;
+            new Chart(document.getElementById('suiteChart'), {{
+                type: 'bar',
+                data: {{
+                    labels: suiteData.map(s => s[0]),
+                    datasets: [{{
+                        label: 'Duration (s)',
+                        data: suiteData.map(s => s[1]),
+                        backgroundColor: '#2563eb',
+                        borderRadius: 6
+                    }}]
                 }},
-                scales: {{
-                    y: {{
-                        beginAtZero: true,
-                        grid: {{
-                            color: '#e5e7eb'
+                options: {{
+                    responsive: true,
+                    maintainAspectRatio: false,
+                    plugins: {{
+                        legend: {{
+                            display: false
                         }}
                     }},
-                    x: {{
-                        grid: {{
-                            display: false
+                    scales: {{
+                        y: {{
+                            beginAtZero: true,
+                            grid: {{
+                                color: '#e5e7eb'
+                            }}
+                        }},
+                        x: {{
+                            grid: {{
+                                display: false
+                            }}
                         }}
                     }}
                 }}
+            }});
+
+            // Page Load Performance Chart
+            const pagePerf = chartData.page_performance;
+            const pageColors = ['#2563eb', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6', '#06b6d4'];
+            if (Object.keys(pagePerf).length) {{
+                // parsing is off, so category x values must already be label indices
+                const pageTimes = [...new Set(Object.values(pagePerf).flat().map(p => p.time))].sort();
+                const pageTimeIndex = new Map(pageTimes.map((time, i) => [time, i]));
+                new Chart(document.getElementById('pagePerfChart'), {{
+                    type: 'line',
+                    data: {{
+                        datasets: Object.entries(pagePerf).flatMap(([page, points], i) => [
+                            {{
+                                label: page + ' load (ms)',
+                                data: points.map(p => ({{x: pageTimeIndex.get(p.time), y: p.load}})),
+                                borderColor: pageColors[i % pageColors.length],
+                                tension: 0.3
+                            }},
+                            {{
+                                label: page + ' LCP (ms)',
+                                data: points.map(p => ({{x: pageTimeIndex.get(p.time), y: p.lcp}})),
+                                borderColor: pageColors[i % pageColors.length],
+                                borderDash: [6, 4],
+                                tension: 0.3
+                            }}
+                        ])
+                    }},
+                    options: {{
+                        responsive: true,
+                        maintainAspectRatio: false,
+                        parsing: false,
+                        scales: {{
+                            x: {{
+                                type: 'category',
+                                labels: pageTimes,
+                                grid: {{
+                                    display: false
+                                }}
+                            }},
+                            y: {{
+                                beginAtZero: true,
+                                grid: {{
+                                    color: '#e5e7eb'
+                                }}
+                            }}
+                        }}
+                    }}
+                }});
             }}
-        }});
+        }}
+
+        {chart_loader}
 
         // Search and filter functionality
         document.getElementById('testSearch').addEventListener('input', function() {{
@@ -1489,31 +2738,569 @@ class ProfessionalDashboardGenerator:
             minutes = int(seconds // 60)
             secs = seconds % 60
             return f"{minutes}m {secs:.0f}s"
+    
+    def _format_bytes(self, size: float) -> str:
+        """Format a byte count"""
+        for unit in ('B', 'KB', 'MB'):
+            if size < 1024:
+                return f"{size:.0f}{unit}" if unit == 'B' else f"{size:.1f}{unit}"
+            size /= 1024
+        return f"{size:.2f}GB"
+
+class IncrementalResultIngestor:
+    """Tail result files under a root directory and parse only newly written bytes"""
+    
+    # output.xml starts with a per-run generator timestamp, so its first bytes identify the run
+    HEAD_BYTES = 256
+    
+    def __init__(self, root_dir: str, parser: Optional[ProfessionalDashboardParser] = None):
+        self.root_dir = root_dir
+        self.parser = parser or ProfessionalDashboardParser()
+        self.xml_files = {}
+        self.event_files = {}
+        self.metrics_files = {}
+    
+    def poll(self) -> bool:
+        """Consume whatever was appended since the last poll; True if anything changed"""
+        changed = False
+        for root, dirs, files in os.walk(self.root_dir):
+            # A later run without the listener replaces the stream with its output.xml
+            use_events = EVENTS_FILE in files and _events_are_current(os.path.join(root, EVENTS_FILE))
+            for file in files:
+                path = os.path.join(root, file)
+                if file == EVENTS_FILE:
+                    if use_events:
+                        changed |= self._ingest_events(path)
+                    elif self.event_files.pop(path, None) is not None:
+                        changed = True
+                elif file == 'output.xml':
+                    if not use_events:
+                        changed |= self._ingest_xml(path)
+                    elif self.xml_files.pop(path, None) is not None:
+                        changed = True
+                elif file == 'page_metrics.jsonl':
+                    changed |= self._ingest_page_metrics(path)
+        return changed
+    
+    def snapshot(self) -> Dict:
+        """Dashboard data for everything ingested so far"""
+        all_suites = [suite for state in self.xml_files.values() for suite in state['suites']]
+        all_tests = [test for state in self.xml_files.values() for test in state['tests']]
+        for state in self.event_files.values():
+            all_suites.extend(state['replay'].suites)
+            all_tests.extend(state['replay'].tests)
+        page_metrics = sorted((record for state in self.metrics_files.values() for record in state['records']),
+                              key=lambda r: r.get('timestamp', ''))
+        return self.parser.build_dashboard_data(all_tests, all_suites, page_metrics)
+    
+    def _new_xml_state(self) -> Dict:
+        return {
+            'offset': 0,
+            'pull': ET.XMLPullParser(events=('start', 'end')),
+            'suite_names': [],
+            'suites': [],
+            'tests': [],
+            'head': b'',
+            'broken_at': None
+        }
+    
+    def _read_appended(self, path: str, state: Dict, size: int) -> bytes:
+        """Read the bytes between the recorded offset and the current size"""
+        with open(path, 'rb') as f:
+            f.seek(state['offset'])
+            data = f.read(size - state['offset'])
+        state['offset'] += len(data)
+        return data
+    
+    def _ingest_xml(self, path: str) -> bool:
+        """Feed new bytes of an output.xml to its pull parser and collect finished tests and suites"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return False
+        state = self.xml_files.get(path)
+        if state is not None and size in (state['offset'], state['broken_at']):
+            return False
+        with open(path, 'rb') as f:
+            head = f.read(self.HEAD_BYTES)
+        rewritten = state is not None and (size < state['offset'] or not head.startswith(state['head']))
+        if state is None or rewritten:
+            if rewritten:
+                logger.info(f"{path} was rewritten, ingesting it from the start")
+            state = self.xml_files[path] = self._new_xml_state()
+        state['head'] = head
+        
+        found = 0
+        try:
+            state['pull'].feed(self._read_appended(path, state, size))
+            for event, elem in state['pull'].read_events():
+                found += self._handle_xml_event(state, event, elem, path)
+        except ET.ParseError as e:
+            logger.warning(f"Skipped {path} until it changes: {e}")
+            state = self.xml_files[path] = self._new_xml_state()
+            state['broken_at'] = size
+            return True
+        return bool(found) or rewritten
+    
+    def _handle_xml_event(self, state: Dict, event: str, elem, source_file: str) -> int:
+        """Turn completed <test> and <suite> elements into records; return how many were added"""
+        if elem.tag == 'suite':
+            if event == 'start':
+                state['suite_names'].append(elem.get('name', ''))
+                return 0
+            suite_data = self.parser._parse_suite(elem, source_file, '.'.join(state['suite_names']))
+            state['suite_names'].pop()
+            elem.clear()
+            state['suites'].append(suite_data)
+            return 1
+        if elem.tag == 'test' and event == 'end':
+            suite_name = state['suite_names'][-1] if state['suite_names'] else ''
+            state['tests'].append(self.parser._parse_test(elem, suite_name, '.'.join(state['suite_names'])))
+            # Keyword bodies are not needed once the test is recorded
+            for child in list(elem):
+                if child.tag not in ('status', 'tag', 'doc'):
+                    elem.remove(child)
+            return 1
+        return 0
+    
+    def _read_new_lines(self, path: str, states: Dict, new_state: Callable[[], Dict]) -> Optional[List[Dict]]:
+        """Decode newly completed JSON lines; None when the file has not grown"""
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return None
+        state = states.get(path)
+        if state is not None and size == state['offset']:
+            return None
+        with open(path, 'rb') as f:
+            head = f.read(self.HEAD_BYTES)
+        # A truncated file may already have grown past the old offset, so compare its first bytes too
+        if state is None or size < state['offset'] or not head.startswith(state['head']):
+            state = states[path] = {'offset': 0, 'partial': b'', 'head': b'', **new_state()}
+        state['head'] = head
+        if size == state['offset']:
+            return None
+        
+        lines = (state['partial'] + self._read_appended(path, state, size)).split(b'\n')
+        # The last element is an unterminated line still being written
+        state['partial'] = lines.pop()
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug(f"Skipped malformed line in {path}")
+        return records
+    
+    def _ingest_page_metrics(self, path: str) -> bool:
+        """Parse newly completed lines of a page_metrics.jsonl file"""
+        records = self._read_new_lines(path, self.metrics_files, lambda: {'records': []})
+        if records is None:
+            return False
+        self.metrics_files[path]['records'].extend(records)
+        return True
+    
+    def _ingest_events(self, path: str) -> bool:
+        """Replay newly written DashboardListener events"""
+        records = self._read_new_lines(
+            path, self.event_files, lambda: {'replay': ListenerEventReplay(path, self.parser)})
+        if records is None:
+            return False
+        replay = self.event_files[path]['replay']
+        return any([replay.feed(record) for record in records])
+
+
+class LiveDashboardServer:
+    """Serve the dashboard over HTTP and push server-sent events when results change"""
+    
+    def __init__(self, root_dir: str, host: str = '127.0.0.1', port: int = 8765, interval: float = 2.0,
+                 generator: Optional[ProfessionalDashboardGenerator] = None):
+        self.ingestor = IncrementalResultIngestor(root_dir)
+        self.generator = generator or ProfessionalDashboardGenerator(live_updates=True)
+        self.interval = interval
+        self.version = 0
+        self.data = self.ingestor.snapshot()
+        self.changed = threading.Condition()
+        self.stopped = threading.Event()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+    
+    def serve_forever(self):
+        """Start watching in the background and serve until interrupted"""
+        watcher = threading.Thread(target=self._watch, name='dashboard-watcher', daemon=True)
+        watcher.start()
+        host, port = self.httpd.server_address[:2]
+        logger.info(f"Live dashboard at http://{host}:{port}/ watching {self.ingestor.root_dir}")
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self.stopped.set()
+            with self.changed:
+                self.changed.notify_all()
+            self.httpd.server_close()
+    
+    def shutdown(self):
+        self.httpd.shutdown()
+    
+    def _watch(self):
+        while not self.stopped.is_set():
+            try:
+                if self.ingestor.poll():
+                    data = self.ingestor.snapshot()
+                    with self.changed:
+                        self.data = data
+                        self.version += 1
+                        self.changed.notify_all()
+                    logger.info(f"Dashboard updated: {data['metrics'].total_tests} tests (version {self.version})")
+            except Exception as e:
+                logger.error(f"Failed to ingest results: {e}")
+            self.stopped.wait(self.interval)
+    
+    def _handler_class(self):
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if path == '/':
+                    body = server.generator._generate_html(server.data).encode('utf-8')
+                    self._send(body, 'text/html; charset=utf-8')
+                elif path == '/data.json':
+                    body = json.dumps(server.generator.chart_payload(server.data)).encode('utf-8')
+                    self._send(body, 'application/json')
+                elif path == '/events':
+                    self._stream_events()
+                else:
+                    self.send_error(404)
+            
+            def _send(self, body: bytes, content_type: str):
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def _stream_events(self):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                seen = server.version
+                try:
+                    while not server.stopped.is_set():
+                        with server.changed:
+                            server.changed.wait_for(lambda: server.version != seen or server.stopped.is_set(),
+                                                    timeout=15)
+                            version, data = server.version, server.data
+                        if version == seen:
+                            self.wfile.write(b': keepalive\n\n')
+                        else:
+                            seen = version
+                            event = json.dumps({'version': version, 'total_tests': data['metrics'].total_tests})
+                            self.wfile.write(f"event: update\ndata: {event}\n\n".encode('utf-8'))
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+            
+            def log_message(self, format, *args):
+                logger.debug(f"{self.address_string()} {format % args}")
+        
+        return Handler
+
+class RunComparator:
+    """Diff two runs joined on a hashed test key"""
+    
+    STATUS_SEVERITY = {'PASS': 0, 'SKIP': 1, 'NOT RUN': 1, 'FAIL': 2}
+    # Modified z-score cut-off (Iglewicz & Hoaglin) for duration changes
+    Z_THRESHOLD = 3.5
+    # Log-ratio noise floor so identical historical timings do not make every change significant
+    MIN_SIGMA = 0.05
+    
+    def __init__(self, runs_dir: str = '.dashboard_runs', min_delta: float = 0.5,
+                 parser: Optional[ProfessionalDashboardParser] = None):
+        self.runs_dir = runs_dir
+        self.min_delta = min_delta
+        self.parser = parser or ProfessionalDashboardParser()
+    
+    @staticmethod
+    def test_key(longname: str) -> str:
+        return hashlib.blake2b(longname.encode('utf-8'), digest_size=8).hexdigest()
+    
+    def summarize(self, tests: List[Dict]) -> Dict[str, Dict]:
+        """One entry per test: worst status and every duration seen in the run"""
+        run = {}
+        for test in tests:
+            key = self.test_key(test['longname'])
+            entry = run.get(key)
+            if entry is None:
+                run[key] = {'name': test['longname'], 'status': test['status'], 'durations': [test['elapsed_time']]}
+                continue
+            entry['durations'].append(test['elapsed_time'])
+            if self.STATUS_SEVERITY.get(test['status'], 0) > self.STATUS_SEVERITY.get(entry['status'], 0):
+                entry['status'] = test['status']
+        return run
+    
+    def save_run(self, run_id: str, tests: List[Dict]) -> str:
+        """Store a compact run summary that compare can refer to by id"""
+        os.makedirs(self.runs_dir, exist_ok=True)
+        path = os.path.join(self.runs_dir, f"{run_id}.json.gz")
+        payload = json.dumps({'id': run_id, 'created': datetime.now().isoformat(), 'tests': self.summarize(tests)})
+        with open(path, 'wb') as f:
+            f.write(gzip.compress(payload.encode('utf-8'), compresslevel=5))
+        logger.info(f"Run '{run_id}' stored: {path}")
+        return path
+    
+    def load_run(self, ref: str) -> Dict[str, Dict]:
+        """Summary of a result directory or of a stored run id"""
+        if os.path.isdir(ref):
+            return self.summarize(self.parser.parse_results(ref)[0])
+        path = os.path.join(self.runs_dir, f"{ref}.json.gz")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"'{ref}' is neither a results directory nor a run stored in {self.runs_dir}")
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return json.load(f)['tests']
+    
+    def compare(self, baseline: Dict[str, Dict], current: Dict[str, Dict]) -> Dict:
+        """New failures, fixes, added/removed tests and significant duration changes"""
+        base_keys, current_keys = baseline.keys(), current.keys()
+        common = base_keys & current_keys
+        
+        new_failures = [{'name': current[k]['name'], 'was': baseline[k]['status'] if k in baseline else 'ADDED'}
+                        for k in current_keys if current[k]['status'] == 'FAIL'
+                        and (k not in baseline or baseline[k]['status'] != 'FAIL')]
+        fixed = [{'name': current[k]['name']} for k in common
+                 if baseline[k]['status'] == 'FAIL' and current[k]['status'] == 'PASS']
+        added = [{'name': current[k]['name'], 'status': current[k]['status']} for k in current_keys - base_keys]
+        removed = [{'name': baseline[k]['name'], 'status': baseline[k]['status']} for k in base_keys - current_keys]
+        slower, faster = self._duration_changes(baseline, current, common)
+        
+        for items in (new_failures, fixed, added, removed):
+            items.sort(key=lambda item: item['name'])
+        return {
+            'summary': {
+                'baseline_tests': len(baseline),
+                'current_tests': len(current),
+                'new_failures': len(new_failures),
+                'fixed': len(fixed),
+                'added': len(added),
+                'removed': len(removed),
+                'slower': len(slower),
+                'faster': len(faster)
+            },
+            'new_failures': new_failures,
+            'fixed': fixed,
+            'added': added,
+            'removed': removed,
+            'slower': slower,
+            'faster': faster
+        }
+    
+    def _duration_changes(self, baseline: Dict, current: Dict, common: Iterable[str]) -> tuple:
+        """Tests whose duration ratio is an outlier against the run-wide ratio distribution"""
+        ratios = {}
+        for key in common:
+            # A failing test stops early, so its duration says nothing about speed
+            if baseline[key]['status'] != 'PASS' or current[key]['status'] != 'PASS':
+                continue
+            before = statistics.fmean(baseline[key]['durations'])
+            after = statistics.fmean(current[key]['durations'])
+            if before > 0 and after > 0:
+                ratios[key] = (before, after, math.log(after / before))
+        if not ratios:
+            return [], []
+        
+        log_ratios = [ratio for _, _, ratio in ratios.values()]
+        center = statistics.median(log_ratios)
+        sigma = max(1.4826 * statistics.median(abs(r - center) for r in log_ratios), self.MIN_SIGMA)
+        
+        slower, faster = [], []
+        for key, (before, after, ratio) in ratios.items():
+            z = (ratio - center) / sigma
+            if abs(z) < self.Z_THRESHOLD or abs(after - before) < self.min_delta:
+                continue
+            change = {'name': current[key]['name'], 'before': before, 'after': after,
+                      'change_pct': (after / before - 1) * 100, 'z': z}
+            (slower if z > 0 else faster).append(change)
+        slower.sort(key=lambda c: c['before'] - c['after'])
+        faster.sort(key=lambda c: c['after'] - c['before'])
+        return slower, faster
+
+
+class PabotOrderPlanner:
+    """Longest-processing-time-first schedule written as a pabot --ordering file"""
+    
+    LEVELS = ('test', 'suite')
+    
+    def __init__(self, workers: int, level: str = 'test'):
+        if workers < 1:
+            raise ValueError("Worker count must be at least 1")
+        if level not in self.LEVELS:
+            raise ValueError(f"Unknown ordering level '{level}'. Use one of: {', '.join(self.LEVELS)}")
+        self.workers = workers
+        self.level = level
+    
+    def historical_durations(self, data: Dict) -> Dict[str, float]:
+        """Median duration per test or leaf suite long name, in first-seen order"""
+        if self.level == 'test':
+            items = data['tests']
+        else:
+            items = [suite for suite in data['suites'] if suite['total']]
+        history = defaultdict(list)
+        for item in items:
+            history[item['longname']].append(item['elapsed_time'])
+        return {name: statistics.median(times) for name, times in history.items()}
+    
+    def plan(self, durations: Dict[str, float]) -> Dict:
+        """Assign items to workers longest first and predict the resulting makespan"""
+        order = sorted(durations, key=lambda name: (-durations[name], name))
+        schedule = self._list_schedule(order, durations)
+        makespan = max((load for load, _ in schedule), default=0.0)
+        file_order = self._list_schedule(list(durations), durations)
+        total = sum(durations.values())
+        return {
+            'level': self.level,
+            'workers': self.workers,
+            'order': order,
+            'predicted_makespan': makespan,
+            'file_order_makespan': max((load for load, _ in file_order), default=0.0),
+            'total_work': total,
+            'utilization': total / (self.workers * makespan) if makespan else 0.0,
+            'worker_loads': [{'load': load, 'items': items} for load, items in schedule]
+        }
+    
+    def _list_schedule(self, order: List[str], durations: Dict[str, float]) -> List[tuple]:
+        """Simulate pabot handing the next item to whichever worker frees up first"""
+        heap = [(0.0, worker) for worker in range(self.workers)]
+        assigned = [[] for _ in range(self.workers)]
+        for name in order:
+            load, worker = heapq.heappop(heap)
+            assigned[worker].append(name)
+            heapq.heappush(heap, (load + durations[name], worker))
+        loads = dict((worker, load) for load, worker in heap)
+        return [(loads[worker], assigned[worker]) for worker in range(self.workers)]
+    
+    def write(self, plan: Dict, ordering_file: str) -> str:
+        """Write the ordering file and a JSON prediction report next to it"""
+        option = '--test' if plan['level'] == 'test' else '--suite'
+        with open(ordering_file, 'w', encoding='utf-8') as f:
+            f.writelines(f"{option} {name}\n" for name in plan['order'])
+        report_file = f"{ordering_file}.json"
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=2)
+        logger.info(f"Pabot ordering written: {ordering_file} ({len(plan['order'])} {plan['level']}s, "
+                    f"{plan['workers']} workers)")
+        logger.info(f"Predicted makespan {plan['predicted_makespan']:.1f}s "
+                    f"(file order {plan['file_order_makespan']:.1f}s), "
+                    f"utilization {plan['utilization'] * 100:.1f}%")
+        return report_file
 
 def main():
     """Main function"""
     parser = argparse.ArgumentParser(description='Generate Professional Test Monitoring Dashboard')
+    parser.add_argument('mode', nargs='?', choices=['generate', 'serve', 'compare'], default='generate',
+                        help='Write a static report, serve a live one that follows --root-dir, '
+                             'or compare --baseline against --current')
     parser.add_argument('--root-dir', '-r', default='.', help='Root directory to scan')
-    parser.add_argument('--output', '-o', default='professional_dashboard.html', help='Output file')
+    parser.add_argument('--output', '-o', help='Output file (professional_dashboard.html, '
+                                                 'or run_comparison.html in compare mode)')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
+    parser.add_argument('--all-rows', action='store_true', help='Render every suite and test row instead of the top entries')
+    parser.add_argument('--bundle', action='store_true', help='Inline vendored Chart.js, Font Awesome and Inter for offline viewing')
+    parser.add_argument('--compress-data', action='store_true', help='Embed chart data gzip-compressed and decode it in the browser')
+    parser.add_argument('--host', default='127.0.0.1', help='Bind address in serve mode')
+    parser.add_argument('--port', type=int, default=8765, help='Port in serve mode')
+    parser.add_argument('--interval', type=float, default=2.0, help='Seconds between result scans in serve mode')
+    parser.add_argument('--save-run', metavar='RUN_ID', help='Store a summary of this run for later comparison')
+    parser.add_argument('--runs-dir', default='.dashboard_runs', help='Where stored runs are kept')
+    parser.add_argument('--baseline', help='Compare mode: results directory or stored run id to compare against')
+    parser.add_argument('--current', help='Compare mode: results directory or stored run id (default: --root-dir)')
+    parser.add_argument('--ordering', help='Also write a pabot --ordering file balanced on historical durations')
+    parser.add_argument('--workers', type=int, default=max(os.cpu_count() or 1, 2),
+                        help='pabot process count to balance the ordering for')
+    parser.add_argument('--ordering-level', choices=PabotOrderPlanner.LEVELS, default='test',
+                        help='Order tests (pabot --testlevelsplit) or leaf suites')
+    parser.add_argument('--profile', nargs='?', const='', metavar='REPORT',
+                        help='Record cProfile stats, tracemalloc peaks and per-phase wall times to a JSON report '
+                             '(default: OUTPUT.profile.json)')
+    parser.add_argument('--profile-html', action='store_true',
+                        help='Also add a profile summary section to the dashboard (implies --profile)')
     
     args = parser.parse_args()
     
+    # Configured here rather than on import so library users keep control of logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('professional_dashboard.log'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+    
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
+    row_limits = {'max_suite_rows': None, 'max_test_rows': None} if args.all_rows else {}
+    
+    if args.mode == 'serve':
+        generator = ProfessionalDashboardGenerator(bundle_assets=args.bundle, live_updates=True, **row_limits)
+        try:
+            LiveDashboardServer(args.root_dir, args.host, args.port, args.interval, generator).serve_forever()
+        except KeyboardInterrupt:
+            logger.info("Live dashboard stopped")
+        return
+    
+    if args.mode == 'compare':
+        if not args.baseline:
+            parser.error('compare mode needs --baseline')
+        try:
+            current = args.current or args.root_dir
+            comparator = RunComparator(args.runs_dir)
+            diff = comparator.compare(comparator.load_run(args.baseline), comparator.load_run(current))
+            generator = ProfessionalDashboardGenerator(bundle_assets=args.bundle)
+            generator.generate_comparison(diff, args.baseline, current, args.output or 'run_comparison.html')
+            summary = diff['summary']
+            logger.info(f"🔀 {summary['new_failures']} new failures, {summary['fixed']} fixed, "
+                        f"{summary['added']} added, {summary['removed']} removed, "
+                        f"{summary['slower']} slower, {summary['faster']} faster")
+        except Exception as e:
+            logger.error(f"Error: {e}")
+            sys.exit(1)
+        return
+    
+    profiler = DashboardProfiler()
+    if args.profile is not None or args.profile_html:
+        # Wall times include the tracing overhead, which is largest in allocation-heavy parsing
+        profiler.start()
+    
     try:
         # Parse data
-        parser_obj = ProfessionalDashboardParser()
+        parser_obj = ProfessionalDashboardParser(profiler)
         data = parser_obj.parse_all_xml_files(args.root_dir)
         
         # Generate dashboard
-        generator = ProfessionalDashboardGenerator()
-        output_path = generator.generate(data, args.output)
+        generator = ProfessionalDashboardGenerator(bundle_assets=args.bundle, compress_data=args.compress_data,
+                                                   profiler=profiler, **row_limits)
+        if args.profile_html:
+            data['profile'] = profiler.report()
+        output_path = generator.generate(data, args.output or 'professional_dashboard.html')
+        
+        if args.save_run:
+            RunComparator(args.runs_dir).save_run(args.save_run, data['tests'])
+        
+        if args.ordering:
+            planner = PabotOrderPlanner(args.workers, args.ordering_level)
+            planner.write(planner.plan(planner.historical_durations(data)), args.ordering)
         
         logger.info(f"✅ Professional dashboard generated: {output_path}")
         logger.info(f"📊 Metrics: {data['metrics'].total_tests} tests, {data['metrics'].pass_rate:.1f}% pass rate")
         
+        if profiler.active:
+            report_path = profiler.write(args.profile or f"{output_path}.profile.json")
+            phases = ', '.join(f"{name} {seconds:.2f}s" for name, seconds in profiler.phases.items())
+            logger.info(f"⏱️ Phases: {phases} (report: {report_path})")
+        
     except Exception as e:
         logger.error(f"Error: {e}")
         sys.exit(1)
@@ -3,41 +3,817 @@ from http.client import responses
 import requests
 from robot.api.deco import keyword
 from robot.api import logger
+import atexit
 import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+@contextmanager
+def _file_lock(lock_file):
+    """Exclusive OS lock on lock_file, shared by every process on the host."""
+    with open(lock_file, "a+") as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _write_json_atomic(path, data, **dump_options):
+    """Replace path in one step so concurrent readers never see a partial file."""
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, **dump_options)
+    os.replace(tmp_file, path)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while a host's circuit is open."""
+
+
+class CircuitBreaker:
+    """Per-host breaker over a rolling window of request outcomes.
+
+    Opens when the failure rate in the window crosses the threshold, fails
+    fast for `reset_timeout` seconds, then lets a single half-open probe
+    through: success closes the circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=0.5, window=20, min_requests=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.reset_timeout = reset_timeout
+        self.outcomes = deque(maxlen=window)
+        self.state = self.CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.lock = threading.Lock()
+
+    def allow_request(self):
+        with self.lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+            if self.state == self.HALF_OPEN and not self.probe_in_flight:
+                self.probe_in_flight = True
+                return True
+            return False
+
+    def record(self, success):
+        with self.lock:
+            if self.state == self.HALF_OPEN:
+                self.probe_in_flight = False
+                if success:
+                    self.state = self.CLOSED
+                    self.outcomes.clear()
+                else:
+                    self._open()
+                return
+            self.outcomes.append(success)
+            failures = self.outcomes.count(False)
+            if (len(self.outcomes) >= self.min_requests
+                    and failures / len(self.outcomes) >= self.failure_threshold):
+                self._open()
+
+    def release_probe(self):
+        """Let another request probe when the current probe ended without an outcome."""
+        with self.lock:
+            self.probe_in_flight = False
+
+    def _open(self):
+        self.state = self.OPEN
+        self.opened_at = time.monotonic()
+        self.outcomes.clear()
+
+
+_CIRCUIT_BREAKERS = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+def _circuit_breaker_for(url, **settings):
+    # Library instances configured with different thresholds get their own breaker per host
+    key = (urlsplit(url).netloc, tuple(sorted(settings.items())))
+    with _CIRCUIT_BREAKERS_LOCK:
+        if key not in _CIRCUIT_BREAKERS:
+            _CIRCUIT_BREAKERS[key] = CircuitBreaker(**settings)
+        return _CIRCUIT_BREAKERS[key]
+
+
+class TrafficArchive:
+    """Compact HAR-like archive of API exchanges for record/replay runs.
+
+    Replay looks responses up in a dict keyed by method, URL with sorted
+    query and the normalized form body. Long digit runs (the timestamps
+    the suites put into e-mails) are masked so a recording made at one
+    time still matches later runs. Repeated identical requests replay in
+    recorded order, then keep returning the last one. Recording a request
+    again replaces what earlier runs stored for it, so re-recording
+    refreshes stale responses while keeping the rest of the archive.
+    Parallel recorders merge into the file under a lock, each replacing
+    only the requests it recorded itself.
+    """
+
+    VOLATILE = re.compile(r"\d{10,}")
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = []
+        self.index = {}
+        self.cursors = {}
+        self.recorded_keys = set()
+        self.dirty = False
+        self.lock = threading.Lock()
+        self.entries = self._load()
+        for entry in self.entries:
+            self.index.setdefault(entry["_key"], []).append(entry)
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)["log"]["entries"]
+
+    @classmethod
+    def key(cls, method, url, kwargs):
+        parts = urlsplit(url)
+        params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+        params += sorted((kwargs.get("params") or {}).items())
+        data = kwargs.get("data") or {}
+        body = urlencode(sorted(data.items())) if isinstance(data, dict) else str(data)
+        url = urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(params), ""))
+        return cls.VOLATILE.sub("{n}", f"{method.upper()} {url} {body}")
+
+    def record(self, method, url, kwargs, response):
+        entry = {
+            "_key": self.key(method, url, kwargs),
+            "startedDateTime": datetime.now().isoformat(),
+            "time": round(response.elapsed.total_seconds() * 1000, 1),
+            "request": {"method": method.upper(), "url": url},
+            "response": {
+                "status": response.status_code,
+                "headers": [{"name": k, "value": v} for k, v in response.headers.items()
+                            if k.lower() in ("content-type", "content-encoding", "retry-after")],
+                "content": {"text": response.text},
+            },
+        }
+        data = kwargs.get("data")
+        if data:
+            entry["request"]["postData"] = {"text": urlencode(data) if isinstance(data, dict) else str(data)}
+        key = entry["_key"]
+        with self.lock:
+            if key not in self.recorded_keys:
+                self.recorded_keys.add(key)
+                if self.index.pop(key, None):
+                    self.entries = [e for e in self.entries if e["_key"] != key]
+            self.entries.append(entry)
+            self.index.setdefault(key, []).append(entry)
+            self.dirty = True
+
+    def replay(self, method, url, kwargs):
+        key = self.key(method, url, kwargs)
+        with self.lock:
+            recorded = self.index.get(key)
+            if not recorded:
+                raise AssertionError(f"No recorded response in {self.path} for: {key}")
+            position = self.cursors.get(key, 0)
+            self.cursors[key] = position + 1
+            entry = recorded[min(position, len(recorded) - 1)]
+        response = requests.Response()
+        response.status_code = entry["response"]["status"]
+        response._content = entry["response"]["content"]["text"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.headers.update({h["name"]: h["value"] for h in entry["response"]["headers"]})
+        response.url = url
+        response.elapsed = timedelta(milliseconds=entry["time"])
+        response.reason = responses.get(response.status_code, "")
+        return response
+
+    def save(self):
+        with self.lock:
+            if not self.dirty:
+                return
+            with _file_lock(self.path + ".lock"):
+                # Other workers may have saved since this archive was loaded; keep what they recorded
+                entries = [e for e in self._load() if e["_key"] not in self.recorded_keys]
+                entries += [e for e in self.entries if e["_key"] in self.recorded_keys]
+                archive = {"log": {"version": "1.2", "creator": {"name": "APILibrary", "version": "1.0"},
+                                   "entries": entries}}
+                _write_json_atomic(self.path, archive, separators=(",", ":"))
+            self.entries = entries
+            self.index = {}
+            for entry in entries:
+                self.index.setdefault(entry["_key"], []).append(entry)
+            self.dirty = False
+
+
+_TRAFFIC_ARCHIVES = {}
+
+
+def _traffic_archive(path):
+    path = os.path.abspath(path)
+    if path not in _TRAFFIC_ARCHIVES:
+        _TRAFFIC_ARCHIVES[path] = TrafficArchive(path)
+    return _TRAFFIC_ARCHIVES[path]
+
+
+@atexit.register
+def _save_traffic_archives():
+    for archive in _TRAFFIC_ARCHIVES.values():
+        archive.save()
+
+
+class HttpTransport:
+    """requests wrapper with timeouts, jittered retries and circuit breaking.
+
+    Idempotent methods are retried on connection errors, timeouts and
+    throttling/gateway statuses using exponential backoff with full jitter.
+    POST is only retried when the connection could not be established,
+    since the request cannot have reached the server.
+    """
+
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS", "PUT", "DELETE"}
+    RETRY_STATUSES = {429, 502, 503, 504}
+
+    MODES = ("live", "record", "replay")
+
+    def __init__(self, connect_timeout=5.0, read_timeout=30.0, max_retries=3,
+                 backoff_base=0.5, backoff_cap=8.0, failure_threshold=0.5, reset_timeout=30.0,
+                 traffic_mode="live", traffic_archive=None):
+        if traffic_mode not in self.MODES:
+            raise ValueError(f"Unknown traffic mode '{traffic_mode}'. Use one of: {', '.join(self.MODES)}")
+        if traffic_mode != "live" and not traffic_archive:
+            raise ValueError(f"Traffic mode '{traffic_mode}' needs a traffic archive path")
+        self.traffic_mode = traffic_mode
+        self.archive = _traffic_archive(traffic_archive) if traffic_mode != "live" else None
+        self.timeout = (float(connect_timeout), float(read_timeout))
+        self.max_retries = int(max_retries)
+        self.backoff_base = float(backoff_base)
+        self.backoff_cap = float(backoff_cap)
+        self.breaker_settings = {"failure_threshold": float(failure_threshold),
+                                 "reset_timeout": float(reset_timeout)}
+
+    def _backoff(self, attempt):
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    def request(self, method, url, **kwargs):
+        if self.traffic_mode == "replay":
+            return self.archive.replay(method, url, kwargs)
+        response = self._send(method, url, **kwargs)
+        if self.traffic_mode == "record":
+            self.archive.record(method, url, kwargs, response)
+        return response
+
+    def _send(self, method, url, **kwargs):
+        method = method.upper()
+        kwargs.setdefault("timeout", self.timeout)
+        breaker = _circuit_breaker_for(url, **self.breaker_settings)
+        idempotent = method in self.IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            if not breaker.allow_request():
+                raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}, failing fast: {method} {url}")
+            response, error = None, None
+            try:
+                response = requests.request(method, url, **kwargs)
+            except requests.exceptions.ConnectTimeout as e:
+                breaker.record(False)
+                retryable, error = True, e
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                breaker.record(False)
+                retryable, error = idempotent, e
+            except requests.exceptions.RequestException as e:
+                # Broken responses (chunked encoding, decoding) still count against the host
+                breaker.record(False)
+                retryable, error = False, e
+            except BaseException:
+                breaker.release_probe()
+                raise
+            else:
+                breaker.record(response.status_code < 500 and response.status_code != 429)
+                retryable = idempotent and response.status_code in self.RETRY_STATUSES
+                if not retryable:
+                    return response
+            if not retryable or attempt >= self.max_retries:
+                if error is not None:
+                    raise error
+                return response
+            delay = self._backoff(attempt)
+            attempt += 1
+            logger.info(f"Retrying {method} {url} in {delay:.2f}s (attempt {attempt}/{self.max_retries})")
+            time.sleep(delay)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+
+PAYLOAD_SCHEMAS = {
+    "product": {
+        "id": int,
+        "name": str,
+        "price": str,
+        "brand": str,
+        "category": {
+            "usertype": {"usertype": str},
+            "category": str,
+        },
+    },
+    "brand": {"id": int, "brand": str},
+    "user": {
+        "id": int,
+        "name": str,
+        "email": str,
+        "title": str,
+        "birth_day": (str, int),
+        "birth_month": (str, int),
+        "birth_year": (str, int),
+        "first_name": str,
+        "last_name": str,
+        "company": str,
+        "address1": str,
+        "address2": str,
+        "country": str,
+        "state": str,
+        "city": str,
+        "zipcode": (str, int),
+    },
+    "products_list": {"responseCode": int, "products": ["product"]},
+    "brands_list": {"responseCode": int, "brands": ["brand"]},
+    "user_detail": {"responseCode": int, "user": "user"},
+}
+
+
+def _compile_schema(schema, validators):
+    """Turn a schema definition into a validator closure.
+
+    Dicts describe required keys, a one-item list describes "every item",
+    strings refer to another named schema and anything else is the type(s)
+    accepted by isinstance. Validators append errors instead of raising so
+    a whole payload is checked in a single pass.
+    """
+    if isinstance(schema, str):
+        def validate_ref(value, path, errors):
+            validators[schema](value, path, errors)
+        return validate_ref
+
+    if isinstance(schema, dict):
+        fields = [(key, _compile_schema(sub, validators)) for key, sub in schema.items()]
+
+        def validate_dict(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append(f"{path}: expected object, got {type(value).__name__}")
+                return
+            for key, validate_field in fields:
+                if key not in value:
+                    errors.append(f"{path}.{key}: missing")
+                else:
+                    validate_field(value[key], f"{path}.{key}", errors)
+        return validate_dict
+
+    if isinstance(schema, list):
+        validate_item = _compile_schema(schema[0], validators)
+
+        def validate_list(value, path, errors):
+            if not isinstance(value, list):
+                errors.append(f"{path}: expected array, got {type(value).__name__}")
+                return
+            for i, item in enumerate(value):
+                validate_item(item, f"{path}[{i}]", errors)
+        return validate_list
+
+    types = schema if isinstance(schema, tuple) else (schema,)
+    type_names = "/".join(t.__name__ for t in types)
+
+    def validate_type(value, path, errors):
+        if isinstance(value, bool) or not isinstance(value, types):
+            errors.append(f"{path}: expected {type_names}, got {type(value).__name__} ({value!r})")
+    return validate_type
+
+
+def _compile_schemas(schemas):
+    validators = {}
+    for name, schema in schemas.items():
+        validators[name] = _compile_schema(schema, validators)
+    return validators
+
+
+SCHEMA_VALIDATORS = _compile_schemas(PAYLOAD_SCHEMAS)
+
+
+class ProductSearchOracle:
+    """Case-insensitive substring index over a product catalog.
+
+    Every product name is broken into 1- to 3-character grams once, so the
+    products a search term should match are found by intersecting a few
+    posting sets instead of scanning the whole catalog for every term.
+    """
+
+    GRAM_SIZE = 3
+
+    def __init__(self, products, field="name"):
+        self.field = field
+        self.products = {}
+        self.texts = {}
+        self.index = {}
+        for product in products:
+            product_id = product["id"]
+            text = str(product.get(field, "")).lower()
+            self.products[product_id] = product
+            self.texts[product_id] = text
+            for gram in self._grams(text):
+                self.index.setdefault(gram, set()).add(product_id)
+
+    def _grams(self, text):
+        grams = set()
+        for size in range(1, self.GRAM_SIZE + 1):
+            for i in range(len(text) - size + 1):
+                grams.add(text[i:i + size])
+        return grams
+
+    def expected_ids(self, term):
+        term = str(term).lower()
+        if not term:
+            return set(self.products)
+        if len(term) <= self.GRAM_SIZE:
+            return set(self.index.get(term, ()))
+        postings = []
+        for i in range(len(term) - self.GRAM_SIZE + 1):
+            posting = self.index.get(term[i:i + self.GRAM_SIZE])
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates &= posting
+            if not candidates:
+                return candidates
+        return {pid for pid in candidates if term in self.texts[pid]}
+
+    def expected_products(self, term):
+        return [self.products[pid] for pid in sorted(self.expected_ids(term))]
+
+    def compare(self, term, actual_products):
+        expected = self.expected_ids(term)
+        actual = {p["id"] for p in actual_products or []}
+        return sorted(expected - actual), sorted(actual - expected)
+
+
+class AccountPool:
+    """File-backed pool of pre-created user accounts shared by pabot workers.
+
+    The pool state lives in a JSON file guarded by an OS file lock, so any
+    number of processes on the host can provision, lease and release
+    accounts without handing the same account to two tests at once.
+
+    Every process that provisions the pool joins it as a client, and only
+    the last client to leave deletes the accounts. Leases whose owning
+    process has exited, or that are older than `lease_timeout` seconds,
+    are reclaimed so a crashed worker cannot hold accounts forever.
+    """
+
+    LEASE_TIMEOUT = 3600
+
+    DEFAULT_PROFILE = {
+        "name": "Pool User",
+        "title": "Mr",
+        "birth_date": "1",
+        "birth_month": "1",
+        "birth_year": "1990",
+        "firstname": "Pool",
+        "lastname": "User",
+        "company": "PoolCo",
+        "address1": "1 Pool Street",
+        "address2": "",
+        "country": "India",
+        "state": "PoolState",
+        "city": "PoolCity",
+        "zipcode": "100001",
+        "mobile_number": "9000000000",
+    }
+
+    def __init__(self, base_url, pool_file=None, password="Pool@123", workers=8, transport=None,
+                 lease_timeout=LEASE_TIMEOUT):
+        self.base_url = base_url
+        self.lease_timeout = float(lease_timeout)
+        self.transport = transport or HttpTransport()
+        self.pool_file = pool_file or os.environ.get(
+            "ACCOUNT_POOL_FILE", os.path.join(tempfile.gettempdir(), "metlife_account_pool.json"))
+        self.lock_file = self.pool_file + ".lock"
+        self.password = password
+        self.workers = workers
+
+    def _locked(self):
+        return _file_lock(self.lock_file)
+
+    def _load(self):
+        if not os.path.exists(self.pool_file):
+            return {"accounts": [], "clients": {}}
+        with open(self.pool_file, encoding="utf-8") as f:
+            state = json.load(f)
+        state.setdefault("clients", {})
+        return state
+
+    def _save(self, state):
+        _write_json_atomic(self.pool_file, state, indent=2)
+
+    def _account_data(self, account):
+        data = dict(self.DEFAULT_PROFILE)
+        data.update(email=account["email"], password=account["password"])
+        return data
+
+    def _create(self, account):
+        response = self.transport.post(f"{self.base_url}/createAccount", data=self._account_data(account))
+        return "User created" in response.text or "Email already exists" in response.text
+
+    def _reset(self, account):
+        response = self.transport.put(f"{self.base_url}/updateAccount", data=self._account_data(account))
+        return "User updated" in response.text
+
+    def _restore(self, account):
+        if not self._reset(account):
+            logger.info(f"Reset failed for {account['email']}, recreating it")
+            self._delete(account)
+            self._create(account)
+
+    @staticmethod
+    def _pid_alive(pid):
+        if os.name == "nt":
+            # os.kill(pid, 0) terminates the process on Windows; expiry relies on the lease timeout there
+            return True
+        try:
+            os.kill(int(pid), 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            return True
+        return True
+
+    def _reclaim(self, state):
+        """Free leases of exited or timed-out owners and forget clients that have exited."""
+        now = time.time()
+        for account in state["accounts"]:
+            if account.get("leased_by") is None:
+                continue
+            pid = account.get("leased_pid")
+            expired = now - (account.get("leased_at") or 0) > self.lease_timeout
+            if expired or (pid is not None and not self._pid_alive(pid)):
+                logger.info(f"Reclaiming {account['email']} from expired lease {account['leased_by']}")
+                try:
+                    self._restore(account)
+                except requests.exceptions.RequestException as e:
+                    logger.warn(f"Could not restore reclaimed account {account['email']}: {e}")
+                account.update(leased_by=None, leased_pid=None, leased_at=None)
+        for pid in [pid for pid in state["clients"] if not self._pid_alive(pid)]:
+            del state["clients"][pid]
+
+    def _delete(self, account):
+        response = self.transport.delete(f"{self.base_url}/deleteAccount",
+                                         data={"email": account["email"], "password": account["password"]})
+        return "Account deleted" in response.text or "Account not found" in response.text
+
+    def provision(self, size):
+        """Create accounts concurrently until the pool holds `size` of them, and join it as a client."""
+        with self._locked():
+            state = self._load()
+            self._reclaim(state)
+            missing = int(size) - len(state["accounts"])
+            if missing > 0:
+                run_id = f"{int(time.time())}{os.getpid()}"
+                offset = len(state["accounts"])
+                new_accounts = [{"email": f"pool{run_id}_{offset + i}@test.com",
+                                 "password": self.password,
+                                 "leased_by": None} for i in range(missing)]
+                with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                    created = list(executor.map(self._create, new_accounts))
+                failed = [a["email"] for a, ok in zip(new_accounts, created) if not ok]
+                if failed:
+                    raise AssertionError(f"Failed to provision {len(failed)} pool accounts: {failed}")
+                state["accounts"].extend(new_accounts)
+            pid = str(os.getpid())
+            state["clients"][pid] = state["clients"].get(pid, 0) + 1
+            self._save(state)
+            return state["accounts"]
+
+    def lease(self, owner):
+        with self._locked():
+            state = self._load()
+            self._reclaim(state)
+            for account in state["accounts"]:
+                if account.get("leased_by") is None:
+                    account.update(leased_by=owner, leased_pid=os.getpid(), leased_at=time.time())
+                    self._save(state)
+                    return self._account_data(account)
+        raise AssertionError(f"No free accounts in pool {self.pool_file}. Provision a larger pool")
+
+    def release(self, email, retire=False):
+        """Return a leased account, restoring its profile, or drop it if retired."""
+        with self._locked():
+            state = self._load()
+            account = next((a for a in state["accounts"] if a["email"] == email), None)
+            if account is None:
+                raise AssertionError(f"Account '{email}' is not part of the pool")
+            if retire:
+                state["accounts"].remove(account)
+            else:
+                self._restore(account)
+                account.update(leased_by=None, leased_pid=None, leased_at=None)
+            self._save(state)
+
+    def teardown(self):
+        """Leave the pool; the last client, with no leases outstanding, deletes every account.
+
+        Returns the number of deleted accounts, 0 while other clients or leases keep the pool alive.
+        """
+        with self._locked():
+            state = self._load()
+            self._reclaim(state)
+            pid = str(os.getpid())
+            if state["clients"].get(pid, 0) > 1:
+                state["clients"][pid] -= 1
+            else:
+                state["clients"].pop(pid, None)
+            leased = sum(1 for a in state["accounts"] if a.get("leased_by") is not None)
+            if state["clients"] or leased:
+                self._save(state)
+                logger.info(f"Keeping pool {self.pool_file}: {len(state['clients'])} clients still joined, "
+                            f"{leased} accounts leased")
+                return 0
+            accounts = state["accounts"]
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                deleted = list(executor.map(self._delete, accounts))
+            if os.path.exists(self.pool_file):
+                os.remove(self.pool_file)
+        return sum(deleted)
+
+
+def _percentiles(values, points=(50, 90, 95, 99, 99.9)):
+    if not values:
+        return {}
+    ordered = sorted(values)
+    result = {}
+    for point in points:
+        rank = max(1, int(-(-point * len(ordered) // 100)))
+        result[f"p{point:g}"] = round(ordered[min(rank, len(ordered)) - 1], 4)
+    result["max"] = round(ordered[-1], 4)
+    return result
+
+
+class ArrivalRateScheduler:
+    """Open-model load generator issuing requests at a target arrival rate.
+
+    Send times are planned up front from the rate profile and never wait
+    for earlier responses, so a slow server cannot throttle the load the
+    way closed-model thread groups do. Latency is reported both as service
+    time (actual send to response) and corrected for coordinated omission
+    (intended send to response).
+    """
+
+    PROFILES = ("constant", "ramp", "step", "spike")
+
+    def __init__(self, profile="constant", rate=10, duration=30, start_rate=1, steps=4,
+                 spike_rate=None, spike_start=None, spike_duration=None, max_workers=200, timeout=(5.0, 30.0)):
+        if profile not in self.PROFILES:
+            raise ValueError(f"Unknown profile '{profile}'. Use one of: {', '.join(self.PROFILES)}")
+        if float(rate) <= 0:
+            raise ValueError(f"Arrival rate must be positive, got {rate}")
+        if float(duration) <= 0:
+            raise ValueError(f"Duration must be positive, got {duration}")
+        if int(steps) < 1:
+            raise ValueError(f"Step profile needs at least one step, got {steps}")
+        self.profile = profile
+        self.rate = float(rate)
+        self.duration = float(duration)
+        self.start_rate = float(start_rate)
+        self.steps = int(steps)
+        self.spike_rate = float(spike_rate) if spike_rate is not None else self.rate * 5
+        self.spike_start = float(spike_start) if spike_start is not None else self.duration / 2
+        self.spike_duration = float(spike_duration) if spike_duration is not None else self.duration / 10
+        self.max_workers = int(max_workers)
+        self.timeout = timeout
+        self.local = threading.local()
+
+    def rate_at(self, t):
+        if self.profile == "ramp":
+            return self.start_rate + (self.rate - self.start_rate) * t / self.duration
+        if self.profile == "step":
+            step = min(int(t / (self.duration / self.steps)), self.steps - 1)
+            return self.start_rate + (self.rate - self.start_rate) * step / max(self.steps - 1, 1)
+        if self.profile == "spike" and self.spike_start <= t < self.spike_start + self.spike_duration:
+            return self.spike_rate
+        return self.rate
+
+    def schedule(self):
+        """Intended send offsets (seconds from start) for the whole run."""
+        offsets = []
+        t = 0.0
+        while t < self.duration:
+            offsets.append(t)
+            t += 1.0 / max(self.rate_at(t), 1e-3)
+        return offsets
+
+    def _session(self):
+        if not hasattr(self.local, "session"):
+            self.local.session = requests.Session()
+        return self.local.session
+
+    def _send(self, method, url, kwargs, intended):
+        actual = time.perf_counter()
+        try:
+            response = self._session().request(method, url, timeout=self.timeout, **kwargs)
+            ok = response.status_code < 400
+        except requests.exceptions.RequestException:
+            ok = False
+        end = time.perf_counter()
+        return intended, actual, end, ok
+
+    def run(self, method, url, **kwargs):
+        offsets = self.schedule()
+        futures = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            start = time.perf_counter()
+            for offset in offsets:
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                futures.append(executor.submit(self._send, method, url, kwargs, intended))
+            results = [f.result() for f in futures]
+            elapsed = time.perf_counter() - start
+        service = [end - actual for _, actual, end, _ in results]
+        corrected = [end - intended for intended, _, end, _ in results]
+        send_lag = [actual - intended for intended, actual, _, _ in results]
+        return {
+            "profile": self.profile,
+            "requests": len(results),
+            "errors": sum(1 for *_, ok in results if not ok),
+            "elapsed": round(elapsed, 3),
+            "achieved_rate": round(len(results) / elapsed, 2) if elapsed else 0,
+            "service_time": _percentiles(service),
+            "corrected_latency": _percentiles(corrected),
+            "max_send_lag": round(max(send_lag), 4) if send_lag else 0,
+        }
 
 
 class APILibrary:
     
-    def __init__(self):
+    def __init__(self, connect_timeout=5, read_timeout=30, max_retries=3,
+                 failure_threshold=0.5, reset_timeout=30, traffic_mode="live", traffic_archive=None):
         self.base_url = "https://automationexercise.com/api"
+        self.transport = HttpTransport(connect_timeout=connect_timeout, read_timeout=read_timeout,
+                                       max_retries=max_retries, failure_threshold=failure_threshold,
+                                       reset_timeout=reset_timeout, traffic_mode=traffic_mode,
+                                       traffic_archive=traffic_archive)
         self.last_response = None
         self.stored_data = {}
+        self.search_oracle = None
         
     @keyword
     def get_all_products_list(self):
         url = f"{self.base_url}/productsList"
         logger.info(f"GET Request to: {url}")
-        self.last_response = requests.get(url)
+        self.last_response = self.transport.get(url)
         logger.info(f"Response Status: {self.last_response.status_code}")
         logger.info(f"Response Time: {self.last_response.elapsed.total_seconds()}s")
         try:
             response_json = self.last_response.json()
-            expected_data={
-                          "id": 1,
-                          "name": "Blue Top",
-                          "price": "Rs. 500",
-                          "brand": "Polo",
-                          "category": {
-                            "usertype": {
-                              "usertype": "Women"
-                            },
-                            "category": "Tops"
-                          }
-            }
-            actual_data = response_json["products"][0]
-            assert expected_data==actual_data
-            logger.info("Expected_Data = "+str(expected_data))
-            logger.info("Actual_Data = "+str(actual_data))
             logger.info(f"Response JSON: {json.dumps(response_json)}")
             return response_json["products"]
         except:
@@ -48,7 +824,7 @@ class APILibrary:
     def get_all_brands_list(self):
         url = f"{self.base_url}/brandsList"
         logger.info(f"GET Request to: {url}")
-        self.last_response = requests.get(url)
+        self.last_response = self.transport.get(url)
         logger.info(f"Response Status: {self.last_response.status_code}")
         logger.info(f"Response Time: {self.last_response.elapsed.total_seconds()}s")
         try:
@@ -64,7 +840,7 @@ class APILibrary:
         data = {"search_product": product_name}
         logger.info(f"POST Request to: {url}")
         logger.info(f"Request Data: {data}")
-        self.last_response = requests.post(url, data=data)
+        self.last_response = self.transport.post(url, data=data)
         logger.info(f"Response Status: {self.last_response.status_code}")
         logger.info(f"Response Time: {self.last_response.elapsed.total_seconds()}s")
         try:
@@ -84,7 +860,7 @@ class APILibrary:
         }
         logger.info(f"POST Request to: {url}")
         logger.info(f"Request Data: email={email}, password=***")
-        self.last_response = requests.post(url, data=data)
+        self.last_response = self.transport.post(url, data=data)
         logger.info(f"Response Status: {self.last_response.status_code}")
         logger.info(f"Response Time: {self.last_response.elapsed.total_seconds()}s")
         logger.info(f"Response Text: {self.last_response.text}")
@@ -116,7 +892,7 @@ class APILibrary:
         }
         logger.info(f"POST Request to: {url}")
         logger.info(f"Creating account for: {email}")
-        self.last_response = requests.post(url, data=data)
+        self.last_response = self.transport.post(url, data=data)
         logger.info(f"Response Status: {self.last_response.status_code}")
         logger.info(f"Response Time: {self.last_response.elapsed.total_seconds()}s")
         logger.info(f"Response Text: {self.last_response.text}")
@@ -146,7 +922,7 @@ class APILibrary:
             "zipcode": zipcode,
             "mobile_number": mobile_number
         }
-        self.last_response = requests.put(url, data=data)
+        self.last_response = self.transport.put(url, data=data)
         return self.last_response
         
     @keyword
@@ -156,52 +932,52 @@ class APILibrary:
             "email": email,
             "password": password
         }
-        self.last_response = requests.delete(url, data=data)
+        self.last_response = self.transport.delete(url, data=data)
         return self.last_response
         
     @keyword
     def get_user_account_detail_by_email(self, email):
         url = f"{self.base_url}/getUserDetailByEmail"
         data = {"email": email}
-        self.last_response = requests.get(url, params=data)
+        self.last_response = self.transport.get(url, params=data)
         return self.last_response
         
     @keyword
     def post_to_products_list(self):
         url = f"{self.base_url}/productsList"
-        self.last_response = requests.post(url)
+        self.last_response = self.transport.post(url)
         return self.last_response
         
     @keyword
     def put_to_brands_list(self):
         url = f"{self.base_url}/brandsList"
-        self.last_response = requests.put(url)
+        self.last_response = self.transport.put(url)
         return self.last_response
         
     @keyword
     def search_product_without_parameter(self):
         url = f"{self.base_url}/searchProduct"
-        self.last_response = requests.post(url, data={})
+        self.last_response = self.transport.post(url, data={})
         return self.last_response
         
     @keyword
     def verify_login_without_email(self, password):
         url = f"{self.base_url}/verifyLogin"
         data = {"password": password}
-        self.last_response = requests.post(url, data=data)
+        self.last_response = self.transport.post(url, data=data)
         return self.last_response
         
     @keyword
     def verify_login_without_password(self, email):
         url = f"{self.base_url}/verifyLogin"
         data = {"email": email}
-        self.last_response = requests.post(url, data=data)
+        self.last_response = self.transport.post(url, data=data)
         return self.last_response
         
     @keyword
     def delete_verify_login(self):
         url = f"{self.base_url}/verifyLogin"
-        self.last_response = requests.delete(url)
+        self.last_response = self.transport.delete(url)
         return self.last_response
         
     @keyword
@@ -291,16 +1067,116 @@ class APILibrary:
         except Exception as e:
             logger.error(f"Failed to store response JSON: {str(e)}")
             raise
+
     @keyword
-    def Validate_Search_Products(self,products):
+    def validate_payload_schema(self, payload, schema_name, **expected_fields):
+        if schema_name not in SCHEMA_VALIDATORS:
+            raise ValueError(f"Unknown schema '{schema_name}'. Available: {', '.join(SCHEMA_VALIDATORS)}")
+        errors = []
+        SCHEMA_VALIDATORS[schema_name](payload, "$", errors)
+        for field_path, expected in expected_fields.items():
+            value = payload
+            try:
+                for key in field_path.split('.'):
+                    value = value[int(key)] if isinstance(value, list) else value[key]
+            except (KeyError, IndexError, ValueError, TypeError):
+                errors.append(f"$.{field_path}: missing")
+                continue
+            if str(value) != str(expected):
+                errors.append(f"$.{field_path}: expected {expected!r}, got {value!r}")
+        if errors:
+            shown = "\n".join(errors[:50])
+            more = f"\n... and {len(errors) - 50} more" if len(errors) > 50 else ""
+            raise AssertionError(f"Schema '{schema_name}' validation failed with {len(errors)} errors:\n{shown}{more}")
+        logger.info(f"Payload matches schema '{schema_name}'")
+        return True
+
+    @keyword
+    def validate_response_schema(self, schema_name, **expected_fields):
         try:
-            logger.info(len(products))
-            for product in products:
-                searched_product_data = self.search_product(product["name"])
-                expected_matched_data = [p for p in products if p["name"] in product["name"]]
-                logger.info("Searched Name : " + product["name"])
-                logger.info("Response from search api"+ str(searched_product_data))
-                assert sorted(searched_product_data)==sorted(expected_matched_data)
-        except Exception as e:
-            logger.error(f"Failed to store response JSON: {str(e)}")
-            raise
+            payload = self.last_response.json()
+        except ValueError:
+            raise AssertionError(f"Response is not JSON: {self.last_response.text[:500]}")
+        return self.validate_payload_schema(payload, schema_name, **expected_fields)
+
+    @keyword
+    def provision_account_pool(self, size, pool_file=None):
+        pool = AccountPool(self.base_url, pool_file, transport=self.transport)
+        accounts = pool.provision(size)
+        logger.info(f"Account pool {pool.pool_file} holds {len(accounts)} accounts")
+        return len(accounts)
+
+    @keyword
+    def lease_pooled_account(self, pool_file=None):
+        owner = f"{os.getpid()}:{time.time()}"
+        account = AccountPool(self.base_url, pool_file, transport=self.transport).lease(owner)
+        logger.info(f"Leased pooled account: {account['email']}")
+        return account
+
+    @keyword
+    def release_pooled_account(self, email, retire=False, pool_file=None):
+        retire = str(retire).lower() in ("true", "yes", "1")
+        AccountPool(self.base_url, pool_file, transport=self.transport).release(email, retire)
+        logger.info(f"{'Retired' if retire else 'Released'} pooled account: {email}")
+        return True
+
+    @keyword
+    def teardown_account_pool(self, pool_file=None):
+        deleted = AccountPool(self.base_url, pool_file, transport=self.transport).teardown()
+        logger.info(f"Deleted {deleted} pooled accounts")
+        return deleted
+
+    @keyword
+    def run_open_model_load_test(self, method, endpoint, profile="constant", rate=10, duration=30,
+                                 data=None, **profile_options):
+        if self.transport.traffic_mode != "live":
+            # The scheduler drives its own sessions for throughput, so recordings can neither serve nor capture it
+            raise AssertionError(f"Open-model load tests need live traffic, "
+                                 f"but the library is in '{self.transport.traffic_mode}' mode")
+        url = f"{self.base_url}/{endpoint.lstrip('/')}"
+        scheduler = ArrivalRateScheduler(profile, rate, duration, timeout=self.transport.timeout, **profile_options)
+        logger.info(f"Open-model {profile} load: {method} {url}, target {rate} req/s for {duration}s")
+        kwargs = {"data": data} if data else {}
+        report = scheduler.run(method.upper(), url, **kwargs)
+        logger.info(f"Load test report: {json.dumps(report, indent=2)}")
+        return report
+
+    @keyword
+    def save_traffic_archive(self):
+        if self.transport.archive is None:
+            logger.info("Traffic recording is not enabled")
+            return None
+        self.transport.archive.save()
+        logger.info(f"Saved {len(self.transport.archive.entries)} exchanges to {self.transport.archive.path}")
+        return self.transport.archive.path
+
+    @keyword
+    def build_product_search_oracle(self, products, field="name"):
+        self.search_oracle = ProductSearchOracle(products, field)
+        logger.info(f"Indexed {len(self.search_oracle.products)} products for search validation")
+        return self.search_oracle
+
+    @keyword
+    def get_expected_search_results(self, term, products=None):
+        oracle = self.search_oracle if products is None else ProductSearchOracle(products)
+        if oracle is None:
+            raise AssertionError("No product catalog indexed. Call 'Build Product Search Oracle' first")
+        return oracle.expected_products(term)
+
+    @keyword
+    def Validate_Search_Products(self, products, terms=None):
+        oracle = self.build_product_search_oracle(products)
+        if terms is None:
+            terms = [product["name"] for product in products]
+        logger.info(f"Validating search for {len(terms)} terms against {len(products)} products")
+        mismatches = []
+        for term in terms:
+            searched_product_data = self.search_product(term)
+            missing, unexpected = oracle.compare(term, searched_product_data)
+            logger.info("Searched Name : " + term)
+            logger.info("Response from search api" + str(searched_product_data))
+            if missing or unexpected:
+                mismatches.append(f"'{term}': missing ids {missing}, unexpected ids {unexpected}")
+        if mismatches:
+            raise AssertionError(f"Search validation failed for {len(mismatches)} terms:\n" + "\n".join(mismatches))
+        return True
@@ -0,0 +1,99 @@
+from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
+from robot.version import get_version
+import json
+import os
+import time
+
+
+EVENTS_FILE = 'dashboard_events.jsonl'
+
+
+class DashboardListener:
+    """Stream suite, test and keyword events to a JSON-lines file.
+
+    Every line is one compact record with an ``event`` field (``start_suite``,
+    ``end_suite``, ``start_test``, ``end_test``, ``start_keyword``,
+    ``end_keyword``) and a wall-clock timestamp ``t`` in epoch seconds.
+    ``dashboard.py`` ingests these files in place of ``output.xml``, so results
+    show up while the run is still going.
+
+    Usage::
+
+        robot --listener libraries/DashboardListener.py tests/
+        robot --listener libraries/DashboardListener.py:results/events.jsonl tests/
+
+    Without a path the file is written to ``${OUTPUT DIR}/dashboard_events.jsonl``,
+    which gives every pabot worker its own file. The file is truncated when a
+    run starts, so rerunning into the same output directory replaces the
+    previous run's events instead of adding to them.
+
+    Listener API v3 only delivers keyword events on Robot Framework 7, so on
+    older versions the same records are produced through the v2 hooks.
+    """
+
+    ROBOT_LISTENER_API_VERSION = 3 if int(get_version().split('.')[0]) >= 7 else 2
+
+    def __init__(self, path=None):
+        self.path = path
+        self.stream = None
+
+    def _write(self, record, flush=False):
+        if self.stream is None:
+            path = self.path or os.path.join(BuiltIn().get_variable_value('${OUTPUT DIR}', '.'), EVENTS_FILE)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            # The first event of a run is its top-level start_suite
+            self.stream = open(path, 'w', encoding='utf-8')
+            logger.console(f"Dashboard events: {path}")
+        record['t'] = round(time.time(), 6)
+        self.stream.write(json.dumps(record, separators=(',', ':')) + '\n')
+        if flush:
+            self.stream.flush()
+
+    def _v2(self, data):
+        return isinstance(data, str)
+
+    def start_suite(self, data, result):
+        if self._v2(data):
+            record = {'id': result['id'], 'name': data, 'source': result['source']}
+        else:
+            record = {'id': result.id, 'name': result.name, 'source': str(data.source or '')}
+        self._write({'event': 'start_suite', **record}, flush=True)
+
+    def end_suite(self, data, result):
+        if self._v2(data):
+            record = {'id': result['id'], 'status': result['status']}
+        else:
+            record = {'id': result.id, 'status': result.status}
+        self._write({'event': 'end_suite', **record}, flush=True)
+
+    def start_test(self, data, result):
+        if self._v2(data):
+            record = {'id': result['id'], 'name': data, 'tags': list(result['tags']), 'doc': result['doc']}
+        else:
+            record = {'id': result.id, 'name': result.name, 'tags': list(result.tags), 'doc': result.doc}
+        self._write({'event': 'start_test', **record})
+
+    def end_test(self, data, result):
+        if self._v2(data):
+            record = {'id': result['id'], 'status': result['status'], 'message': result['message']}
+        else:
+            record = {'id': result.id, 'status': result.status, 'message': result.message}
+        self._write({'event': 'end_test', **record}, flush=True)
+
+    def start_keyword(self, data, result):
+        if self._v2(data):
+            record = {'name': result['kwname'], 'library': result['libname'], 'type': result['type']}
+        else:
+            record = {'name': result.name, 'library': getattr(result, 'owner', None) or result.libname or '',
+                      'type': result.type}
+        self._write({'event': 'start_keyword', **record})
+
+    def end_keyword(self, data, result):
+        status = result['status'] if self._v2(data) else result.status
+        self._write({'event': 'end_keyword', 'status': status})
+
+    def close(self):
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
@@ -1,75 +1,970 @@
 from robot.api.deco import keyword
 from robot.api import logger
+from robot.libraries.BuiltIn import BuiltIn
 from playwright.sync_api import sync_playwright
+from playwright.async_api import async_playwright
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import quote_plus
+from urllib.request import urlopen
+import asyncio
+import atexit
+import base64
+import json
+import os
+import re
+import shutil
+import signal
+import socket
+import subprocess
+import tempfile
 import time
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+STATIC_ASSET_PATTERN = re.compile(r".*\.(css|js|png|jpe?g|gif|svg|webp|ico|woff2?|ttf|eot)(\?.*)?$", re.IGNORECASE)
+
+PERF_OBSERVER_SCRIPT = """
+(() => {
+    const metrics = window.__perfMetrics = {lcp: 0, cls: 0, tbt: 0, longTasks: 0};
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', e => { metrics.lcp = e.renderTime || e.loadTime || e.startTime; });
+    observe('layout-shift', e => { if (!e.hadRecentInput) metrics.cls += e.value; });
+    observe('longtask', e => { metrics.longTasks += 1; metrics.tbt += Math.max(0, e.duration - 50); });
+})();
+"""
+
+COLLECT_METRICS_SCRIPT = """
+() => {
+    const round = v => (typeof v === 'number' ? Math.round(v * 10) / 10 : null);
+    const nav = performance.getEntriesByType('navigation')[0] || {};
+    const paint = {};
+    performance.getEntriesByType('paint').forEach(p => { paint[p.name] = p.startTime; });
+    const byType = {};
+    let transfer = 0;
+    const resources = performance.getEntriesByType('resource');
+    resources.forEach(r => {
+        const t = byType[r.initiatorType] = byType[r.initiatorType] || {count: 0, transfer_size: 0, max_duration: 0};
+        t.count += 1;
+        t.transfer_size += r.transferSize || 0;
+        t.max_duration = Math.max(t.max_duration, round(r.duration));
+        transfer += r.transferSize || 0;
+    });
+    const vitals = window.__perfMetrics || {};
+    const memory = performance.memory || {};
+    return {
+        url: location.href,
+        ttfb: round(nav.responseStart - nav.requestStart),
+        dom_interactive: round(nav.domInteractive),
+        dom_content_loaded: nav.domContentLoadedEventEnd ? round(nav.domContentLoadedEventEnd) : null,
+        load: nav.loadEventEnd ? round(nav.loadEventEnd) : null,
+        document_transfer_size: nav.transferSize || 0,
+        fcp: round(paint['first-contentful-paint']),
+        lcp: round(vitals.lcp),
+        cls: Math.round((vitals.cls || 0) * 10000) / 10000,
+        tbt: round(vitals.tbt || 0),
+        long_tasks: vitals.longTasks || 0,
+        resources: {count: resources.length, transfer_size: transfer, by_type: byType},
+        js_heap_used: memory.usedJSHeapSize || null,
+        js_heap_total: memory.totalJSHeapSize || null
+    };
+}
+"""
+
+BATCH_CHECK_SCRIPT = """
+(selectors) => {
+    const isXPath = s => s.startsWith('/') || s.startsWith('(') || s.startsWith('xpath=');
+    const findAll = s => {
+        if (isXPath(s)) {
+            const snapshot = document.evaluate(s.replace(/^xpath=/, ''), document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+        }
+        return Array.from(document.querySelectorAll(s.replace(/^css=/, '')));
+    };
+    const isVisible = el => {
+        if (!el || getComputedStyle(el).visibility === 'hidden') return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    return {
+        url: location.href,
+        title: document.title,
+        results: selectors.map(s => {
+            let matches;
+            try {
+                matches = findAll(s);
+            } catch (e) {
+                return {unsupported: true};
+            }
+            const first = matches[0];
+            return {count: matches.length, visible: isVisible(first), text: first ? first.textContent : null};
+        })
+    };
+}
+"""
+
+FILL_FORM_SCRIPT = """
+(fields) => {
+    const find = s => {
+        if (s.startsWith('/') || s.startsWith('(') || s.startsWith('xpath=')) {
+            return document.evaluate(s.replace(/^xpath=/, ''), document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+        return document.querySelector(s.replace(/^css=/, ''));
+    };
+    // The same actionability checks Playwright runs before fill and check
+    const blocked = (el, editable) => {
+        const style = getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        if (!rect.width || !rect.height || style.visibility !== 'visible') return 'not visible';
+        if (el.matches(':disabled')) return 'disabled';
+        if (editable && el.readOnly) return 'read-only';
+        el.scrollIntoView({block: 'center', inline: 'center'});
+        const box = el.getBoundingClientRect();
+        const hit = document.elementFromPoint(box.left + box.width / 2, box.top + box.height / 2);
+        const label = hit && hit.closest('label');
+        if (hit && !el.contains(hit) && !(label && label.control === el)) {
+            return `covered by <${hit.tagName.toLowerCase()}>`;
+        }
+        return null;
+    };
+    return fields.map(([selector, value, checked]) => {
+        let el;
+        try {
+            el = find(selector);
+        } catch (e) {
+            return {unsupported: true};
+        }
+        if (!el) return {missing: true};
+        const tag = el.tagName.toLowerCase();
+        const type = (el.type || '').toLowerCase();
+        const toggle = type === 'checkbox' || type === 'radio';
+        const reason = blocked(el, tag !== 'select' && !toggle);
+        if (reason) return {blocked: reason};
+        if (toggle) {
+            // A real click runs the page's handlers and fires input/change itself
+            if (el.checked !== checked) el.click();
+            return {kind: 'check', checked: el.checked};
+        }
+        if (tag === 'select') {
+            const options = Array.from(el.options);
+            const option = options.find(o => o.value === value) || options.find(o => o.text.trim() === value);
+            if (option) el.value = option.value;
+        } else {
+            const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+            el.focus();
+            setter.call(el, value);
+        }
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+        el.dispatchEvent(new Event('change', {bubbles: true}));
+        if (tag === 'select') {
+            const selected = el.options[el.selectedIndex];
+            return {kind: 'select', value: el.value, label: selected ? selected.text.trim() : null};
+        }
+        return {kind: 'text', value: el.value};
+    });
+}
+"""
+
+PAGE_ROUTES = {
+    'home': {'path': '/', 'ready': '.features_items', 'title': 'Automation Exercise'},
+    'login': {'path': '/login', 'ready': '.login-form', 'title': 'Automation Exercise',
+              'link': '//a[@href="/login"]', 'heading': '//h2[contains(text(), "Login to your account")]'},
+    'products': {'path': '/products', 'ready': '.features_items', 'title': 'Products',
+                 'link': '//a[@href="/products"]', 'heading': '//h2[contains(text(), "All Products")]'},
+    'contact_us': {'path': '/contact_us', 'ready': 'input[data-qa="name"]', 'title': 'Contact us',
+                   'link': '//a[@href="/contact_us"]', 'heading': '//h2[contains(text(), "Get In Touch")]'},
+}
+
+
+@contextmanager
+def _file_lock(lock_file):
+    """Exclusive OS lock on lock_file, shared by every process on the host."""
+    with open(lock_file, 'a+') as handle:
+        if fcntl:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _write_json_atomic(path, data):
+    """Replace path in one step so concurrent readers never see a partial file."""
+    tmp_file = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+    os.replace(tmp_file, path)
+
+
+def _process_tree(root_pid):
+    """Descendant pids of root_pid, read from /proc (empty where /proc is unavailable)."""
+    children = {}
+    try:
+        entries = os.listdir('/proc')
+    except OSError:
+        return []
+    for entry in entries:
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat', encoding='utf-8') as f:
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(entry))
+    descendants, stack = [], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            descendants.append(child)
+            stack.append(child)
+    return descendants
+
+
+def _process_info(pid):
+    try:
+        with open(f'/proc/{pid}/cmdline', 'rb') as f:
+            cmdline = f.read().replace(b'\0', b' ').decode('utf-8', 'replace')
+        with open(f'/proc/{pid}/stat', encoding='utf-8') as f:
+            stat = f.read().rsplit(')', 1)[1].split()
+        with open(f'/proc/{pid}/status', encoding='utf-8') as f:
+            rss_kb = next((int(line.split()[1]) for line in f if line.startswith('VmRSS:')), 0)
+    except (OSError, IndexError):
+        return None
+    # Start time (clock ticks since boot) tells a reused pid apart from the process recorded earlier
+    return {'pid': pid, 'ppid': int(stat[1]), 'start': int(stat[19]), 'cmdline': cmdline, 'rss_mb': rss_kb / 1024}
+
+
+class SharedBrowserServer:
+    """One headless Chromium per host, shared by every pabot worker.
+
+    Python Playwright has no launch_server, so the first worker starts
+    Chromium with a local remote-debugging websocket and records it in a
+    state file. Every worker connects over CDP and works in its own
+    contexts. Workers register their pid under a file lock, and the
+    browser is terminated when the last live worker releases it.
+    """
+    
+    def __init__(self, state_file=None, startup_timeout=20):
+        self.state_file = state_file or os.path.join(tempfile.gettempdir(), 'metlife_shared_chromium.json')
+        self.lock_file = self.state_file + '.lock'
+        self.startup_timeout = startup_timeout
+        self.pid = None
+    
+    def _locked(self):
+        return _file_lock(self.lock_file)
+    
+    def _load(self):
+        if not os.path.exists(self.state_file):
+            return None
+        with open(self.state_file, encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _save(self, state):
+        with open(self.state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+    
+    @staticmethod
+    def _pid_alive(pid):
+        try:
+            os.kill(pid, 0)
+        except OSError:
+            return False
+        return True
+    
+    @staticmethod
+    def _healthy(endpoint):
+        try:
+            with urlopen(f"{endpoint}/json/version", timeout=2) as response:
+                return 'webSocketDebuggerUrl' in json.loads(response.read())
+        except Exception:
+            return False
+    
+    def _launch(self, executable_path):
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+        user_data_dir = tempfile.mkdtemp(prefix='shared-chromium-')
+        process = subprocess.Popen(
+            [executable_path, '--headless=new', f'--remote-debugging-port={port}',
+             '--remote-debugging-address=127.0.0.1', '--no-sandbox', '--disable-dev-shm-usage',
+             '--no-first-run', f'--user-data-dir={user_data_dir}', 'about:blank'],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+        endpoint = f"http://127.0.0.1:{port}"
+        deadline = time.time() + self.startup_timeout
+        while not self._healthy(endpoint):
+            if process.poll() is not None or time.time() > deadline:
+                process.kill()
+                process.wait()
+                shutil.rmtree(user_data_dir, ignore_errors=True)
+                raise Exception(f"Shared Chromium did not start on {endpoint}")
+            time.sleep(0.2)
+        logger.info(f"Launched shared Chromium (pid {process.pid}) on {endpoint}")
+        return {'pid': process.pid, 'endpoint': endpoint, 'user_data_dir': user_data_dir, 'clients': []}
+    
+    def acquire(self, executable_path):
+        """Return the CDP endpoint, starting or replacing the browser if needed."""
+        with self._locked():
+            state = self._load()
+            if not state or not self._pid_alive(state['pid']) or not self._healthy(state['endpoint']):
+                if state and self._pid_alive(state['pid']):
+                    self._terminate(state)
+                state = self._launch(executable_path)
+            state['clients'] = [pid for pid in state['clients'] if self._pid_alive(pid)]
+            if os.getpid() not in state['clients']:
+                state['clients'].append(os.getpid())
+            self._save(state)
+            self.pid = state['pid']
+            return state['endpoint']
+    
+    def release(self):
+        with self._locked():
+            state = self._load()
+            if not state:
+                return
+            state['clients'] = [pid for pid in state['clients']
+                                if pid != os.getpid() and self._pid_alive(pid)]
+            if state['clients']:
+                self._save(state)
+                return
+            self._terminate(state)
+            os.remove(self.state_file)
+    
+    def _terminate(self, state):
+        try:
+            os.kill(state['pid'], signal.SIGTERM)
+            logger.info(f"Stopped shared Chromium (pid {state['pid']})")
+        except OSError:
+            pass
+        # Chromium writes its profile until it exits, so wait briefly before removing it
+        deadline = time.time() + 5
+        while self._pid_alive(state['pid']) and time.time() < deadline:
+            try:
+                # A browser this worker launched stays a zombie (and looks alive) until reaped
+                if os.waitpid(state['pid'], os.WNOHANG)[0]:
+                    break
+            except (ChildProcessError, AttributeError, OSError):
+                pass
+            time.sleep(0.1)
+        if state.get('user_data_dir'):
+            shutil.rmtree(state['user_data_dir'], ignore_errors=True)
+
+
+class AsyncSearchEngine:
+    """Runs the product search flow for many terms across concurrent tabs.
+    
+    Uses Playwright's async API in a dedicated thread and event loop, so it
+    never interferes with the sync browser the other keywords drive. A
+    fixed number of tabs pull terms from a shared queue. With a browser
+    server it joins the host's shared Chromium, and a HAR plan from the
+    library makes its contexts record or replay like the sync ones.
+    """
+    
+    RESULT_NAMES_SCRIPT = "els => els.map(el => el.textContent.trim())"
+    
+    def __init__(self, base_url, tabs=4, isolated_contexts=False, headless=True, timeout=30000,
+                 context_options=None, browser_server=None, har=None):
+        self.base_url = base_url
+        self.tabs = int(tabs)
+        self.isolated_contexts = isolated_contexts
+        self.headless = headless
+        self.timeout = timeout
+        self.context_options = context_options or {'viewport': {'width': 1920, 'height': 1080},
+                                                   'ignore_https_errors': True}
+        self.browser_server = browser_server
+        self.har = har or {}
+        self.har_recordings = []
+    
+    def run(self, terms):
+        """One result per term, in the order given; repeated terms are searched again"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self._run(list(terms))).result()
+    
+    async def _run(self, terms):
+        queue = asyncio.Queue()
+        for index, term in enumerate(terms):
+            queue.put_nowait((index, term))
+        results = [None] * len(terms)
+        try:
+            async with async_playwright() as playwright:
+                browser = await self._browser(playwright)
+                shared_context = None
+                try:
+                    shared_context = None if self.isolated_contexts else await self._new_context(browser)
+                    workers = [self._worker(browser, shared_context, queue, results)
+                               for _ in range(max(1, min(self.tabs, len(terms))))]
+                    await asyncio.gather(*workers)
+                finally:
+                    if shared_context is not None:
+                        await shared_context.close()
+                    await browser.close()
+            self._merge_har_recordings()
+        finally:
+            # Recordings of a failed run are partial and never merged, but must not pile up in har_dir
+            for path in self.har_recordings:
+                if os.path.exists(path):
+                    os.remove(path)
+            self.har_recordings = []
+        return results
+    
+    async def _browser(self, playwright):
+        if self.browser_server:
+            # Closing a CDP connection only disconnects, so the shared browser keeps running
+            endpoint = self.browser_server.acquire(playwright.chromium.executable_path)
+            return await playwright.chromium.connect_over_cdp(endpoint)
+        return await playwright.chromium.launch(
+            headless=self.headless, args=['--no-sandbox', '--disable-dev-shm-usage'])
+    
+    async def _new_context(self, browser):
+        if 'record' in self.har:
+            path = f"{os.path.splitext(self.har['record'])[0]}.{os.getpid()}-{len(self.har_recordings)}.har"
+            self.har_recordings.append(path)
+            return await browser.new_context(record_har_path=path, record_har_content='embed',
+                                             **self.context_options)
+        context = await browser.new_context(**self.context_options)
+        if 'route' in self.har:
+            await context.route_from_har(self.har['route'], **self.har.get('options', {}))
+        return context
+    
+    def _merge_har_recordings(self):
+        if not self.har_recordings:
+            return
+        har = None
+        for path in self.har_recordings:
+            if not os.path.exists(path):
+                continue
+            with open(path, encoding='utf-8') as f:
+                recording = json.load(f)
+            if har is None:
+                har = recording
+            else:
+                har['log']['entries'].extend(recording['log']['entries'])
+            os.remove(path)
+        if har is not None:
+            _write_json_atomic(self.har['record'], har)
+            logger.info(f"Recorded concurrent search HAR to {self.har['record']}")
+        self.har_recordings = []
+    
+    async def _worker(self, browser, shared_context, queue, results):
+        context = shared_context or await self._new_context(browser)
+        page = await context.new_page()
+        page.set_default_timeout(self.timeout)
+        try:
+            while not queue.empty():
+                index, term = queue.get_nowait()
+                results[index] = {'term': term, **await self._search(page, term)}
+        finally:
+            await page.close()
+            if shared_context is None:
+                await context.close()
+    
+    async def _search(self, page, term):
+        started = time.perf_counter()
+        try:
+            await page.goto(f"{self.base_url}/products?search={quote_plus(term)}", wait_until='domcontentloaded')
+            await page.wait_for_selector('//h2[contains(text(), "Searched Products")]', state='visible')
+            names = await page.eval_on_selector_all('.features_items .productinfo p', self.RESULT_NAMES_SCRIPT)
+            return {'count': len(names), 'names': names, 'elapsed': round(time.perf_counter() - started, 3)}
+        except Exception as e:
+            return {'count': 0, 'names': [], 'error': str(e), 'elapsed': round(time.perf_counter() - started, 3)}
+
+
+class _FailureTraceListener:
+    """Library listener feeding test/keyword events to PlaywrightLibrary."""
+    
+    ROBOT_LISTENER_API_VERSION = 2
+    
+    def __init__(self, library):
+        self.library = library
+    
+    def start_test(self, name, attrs):
+        self.library._on_start_test(name, attrs)
+    
+    def start_keyword(self, name, attrs):
+        self.library._on_start_keyword(name, attrs)
+    
+    def end_test(self, name, attrs):
+        self.library._on_end_test(name, attrs)
+
 
 class PlaywrightLibrary:
     
     ROBOT_LIBRARY_SCOPE = 'GLOBAL'
+    HAR_MODES = ('off', 'record', 'replay', 'static', 'update')
+    NAVIGATION_MODES = ('direct', 'click')
     
-    def __init__(self):
+    def __init__(self, har_mode='off', har_dir='har', collect_metrics=True, metrics_file=None,
+                 trace_on_failure=True, trace_actions=50, trace_dir=None, navigation_mode='direct',
+                 shared_browser=False, shared_browser_state=None,
+                 memory_limit_mb=1500, recycle_after_tests=0):
+        if har_mode not in self.HAR_MODES:
+            raise ValueError(f"Unknown HAR mode '{har_mode}'. Use one of: {', '.join(self.HAR_MODES)}")
+        if navigation_mode not in self.NAVIGATION_MODES:
+            raise ValueError(f"Unknown navigation mode '{navigation_mode}'. Use one of: {', '.join(self.NAVIGATION_MODES)}")
         self.base_url = "https://automationexercise.com"
+        self.navigation_mode = navigation_mode
+        self.shared_browser = str(shared_browser).lower() in ('true', 'yes', '1')
+        self.shared_browser_server = SharedBrowserServer(shared_browser_state) if self.shared_browser else None
+        if self.shared_browser:
+            atexit.register(self.shared_browser_server.release)
+        self.har_mode = har_mode
+        self.har_dir = har_dir
+        self.har_path = None
+        self.har_misses = []
+        self.static_har_recording = None
+        self.collect_metrics = str(collect_metrics).lower() not in ('false', 'no', '0')
+        self.metrics_file = metrics_file
+        self.page_metrics = []
+        self.pending_metrics = None
+        self.trace_on_failure = str(trace_on_failure).lower() not in ('false', 'no', '0')
+        self.trace_actions = int(trace_actions)
+        self.trace_dir = trace_dir
+        self.recent_actions = deque(maxlen=self.trace_actions)
+        self.trace_chunk_open = False
+        self.trace_chunk_actions = 0
+        self.previous_trace_chunk = None
+        self.tracing_context = None
+        self.ROBOT_LIBRARY_LISTENER = _FailureTraceListener(self)
+        self.memory_limit_mb = float(memory_limit_mb)
+        self.recycle_after_tests = int(recycle_after_tests)
+        self.memory_baseline = None
+        self.closed_memory = None
+        self.memory_report = []
+        self.tests_since_launch = 0
+        self.recycle_pending = None
+        self.browser_pids = {}
+        atexit.register(self._reap_browser_processes)
         self.playwright = None
         self.browser = None
         self.context = None
         self.page = None
+    
+    def _on_start_test(self, name, attrs):
+        self.recent_actions.clear()
+        self.closed_memory = None
+        if self.context and not self.trace_chunk_open:
+            self._start_trace_chunk()
+    
+    def _on_start_keyword(self, name, attrs):
+        if attrs.get('libname') != 'PlaywrightLibrary':
+            return
+        self.recent_actions.append({
+            'keyword': attrs.get('kwname', name),
+            'args': attrs.get('args', []),
+            'started': datetime.now().isoformat(),
+            'url': self.page.url if self.page and not self.page.is_closed() else None,
+        })
+        if self.trace_chunk_open:
+            self.trace_chunk_actions += 1
+            if self.trace_chunk_actions >= self.trace_actions:
+                self._rotate_trace_chunk()
+    
+    def _on_end_test(self, name, attrs):
+        self._finalize_page_metrics()
+        self._finish_trace_chunk(attrs.get('status') == 'FAIL', name)
+        # One memory record per test: from the live browser, or from the one closed during the test
+        if self.browser and self.memory_baseline is not None:
+            sample = self._sample_memory()
+            self._record_memory_delta(name, self.memory_baseline, sample)
+            self.memory_baseline = sample
+            self.tests_since_launch += 1
+            self._schedule_recycle(sample)
+        elif self.closed_memory:
+            self._record_memory_delta(name, *self.closed_memory)
+        self.closed_memory = None
+    
+    def _sample_memory(self):
+        pids = set(_process_tree(os.getpid()))
+        if self.shared_browser_server and self.shared_browser_server.pid:
+            # The shared browser may be our child but belongs to every worker
+            shared = self.shared_browser_server.pid
+            pids -= {shared, *_process_tree(shared)}
+        processes = [info for info in map(_process_info, pids)
+                     if info and re.search(r'chrom|headless_shell', info['cmdline'], re.IGNORECASE)]
+        self.browser_pids.update((info['pid'], info) for info in processes)
+        js_heap = None
+        try:
+            if self.page and not self.page.is_closed():
+                js_heap = self.page.evaluate("performance.memory ? performance.memory.usedJSHeapSize : null")
+        except Exception:
+            pass
+        return {
+            'browser_rss_mb': round(sum(info['rss_mb'] for info in processes), 1),
+            'renderer_rss_mb': round(sum(info['rss_mb'] for info in processes if '--type=renderer' in info['cmdline']), 1),
+            'processes': len(processes),
+            'js_heap_mb': round(js_heap / 1048576, 1) if js_heap else None,
+        }
+    
+    def _record_memory_delta(self, test_name, baseline, sample):
+        delta = {key: round(sample[key] - baseline[key], 1)
+                 for key in ('browser_rss_mb', 'renderer_rss_mb', 'js_heap_mb')
+                 if sample[key] is not None and baseline[key] is not None}
+        record = {
+            'test': test_name,
+            'timestamp': datetime.now().isoformat(),
+            'start': baseline,
+            'end': sample,
+            'delta': delta,
+        }
+        self.memory_report.append(record)
+        report_file = os.path.join(BuiltIn().get_variable_value('${OUTPUT DIR}', '.'), 'memory_metrics.jsonl')
+        with open(report_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+        logger.info(f" Memory: browser RSS {sample['browser_rss_mb']}MB ({delta.get('browser_rss_mb', 0):+}MB), "
+                    f"renderers {sample['renderer_rss_mb']}MB, JS heap {sample['js_heap_mb']}MB")
+    
+    def _schedule_recycle(self, sample):
+        # Relaunching here would run outside any test and waste a launch on suites that set up per test,
+        # so the next Setup Browser And Navigate does it instead
+        reasons = []
+        if sample and sample['browser_rss_mb'] > self.memory_limit_mb:
+            reasons.append(f"browser RSS {sample['browser_rss_mb']}MB over {self.memory_limit_mb:g}MB")
+        if self.recycle_after_tests and self.tests_since_launch >= self.recycle_after_tests:
+            reasons.append(f"{self.tests_since_launch} tests since launch")
+        if reasons:
+            self.recycle_pending = ', '.join(reasons)
+            logger.info(f"Browser will be recycled at the next setup: {self.recycle_pending}")
+    
+    def _still_ours(self, recorded):
+        current = _process_info(recorded['pid'])
+        if not current or current['start'] != recorded['start'] or current['cmdline'] != recorded['cmdline']:
+            return False
+        # Orphans are re-parented once their parent exits; any other parent change means a different process
+        return current['ppid'] == recorded['ppid'] or not self._same_process(recorded['ppid'])
+    
+    def _same_process(self, pid):
+        recorded = self.browser_pids.get(pid)
+        current = _process_info(pid)
+        if current is None:
+            return False
+        return recorded is None or current['start'] == recorded['start']
+    
+    def _reap_browser_processes(self):
+        # Renderers exit mid-test and their pids can be reused, e.g. by another worker's Chromium
+        orphans = [pid for pid, recorded in self.browser_pids.items() if self._still_ours(recorded)]
+        # Ask first so Chromium can flush its profile; only processes that ignore SIGTERM are killed
+        self._signal_processes(orphans, signal.SIGTERM)
+        survivors = orphans
+        deadline = time.time() + 2
+        while survivors and time.time() < deadline:
+            time.sleep(0.1)
+            for pid in survivors:
+                try:
+                    # Our own children stay zombies, with their cmdline gone, until reaped
+                    os.waitpid(pid, os.WNOHANG)
+                except (ChildProcessError, AttributeError, OSError):
+                    pass
+            survivors = [pid for pid in survivors if self._still_ours(self.browser_pids[pid])]
+        self._signal_processes(survivors, signal.SIGKILL)
+        if orphans:
+            logger.info(f"Reaped {len(orphans)} orphaned browser processes: {orphans}"
+                        + (f" ({len(survivors)} killed)" if survivors else ""))
+        self.browser_pids.clear()
+    
+    def _signal_processes(self, pids, sig):
+        for pid in pids:
+            try:
+                os.kill(pid, sig)
+            except OSError:
+                pass
+    
+    def _start_trace_chunk(self):
+        if not self.trace_on_failure or not self.context:
+            return
+        try:
+            if self.tracing_context is not self.context:
+                self.context.tracing.start(screenshots=True, snapshots=True)
+                self.tracing_context = self.context
+            self.context.tracing.start_chunk()
+            self.trace_chunk_open = True
+            self.trace_chunk_actions = 0
+        except Exception as e:
+            logger.info(f"Note: Could not start tracing: {str(e)}")
+    
+    def _rotate_trace_chunk(self):
+        # Keep only the previous chunk on disk so a failure has between N and 2N actions of history
+        path = os.path.join(tempfile.gettempdir(), f"pw-trace-{os.getpid()}-{time.time_ns()}.zip")
+        try:
+            self.context.tracing.stop_chunk(path=path)
+            self._discard_previous_trace_chunk()
+            self.previous_trace_chunk = path
+            self.context.tracing.start_chunk()
+            self.trace_chunk_actions = 0
+        except Exception as e:
+            self.trace_chunk_open = False
+            logger.info(f"Note: Could not rotate trace chunk: {str(e)}")
+    
+    def _discard_previous_trace_chunk(self):
+        if self.previous_trace_chunk and os.path.exists(self.previous_trace_chunk):
+            os.remove(self.previous_trace_chunk)
+        self.previous_trace_chunk = None
+    
+    def _finish_trace_chunk(self, failed, test_name=None):
+        if not self.trace_chunk_open:
+            return
+        self.trace_chunk_open = False
+        try:
+            if not failed:
+                self.context.tracing.stop_chunk()
+                return
+            test_name = test_name or BuiltIn().get_variable_value('${TEST NAME}', 'test')
+            trace_dir = self.trace_dir or os.path.join(BuiltIn().get_variable_value('${OUTPUT DIR}', '.'), 'traces')
+            os.makedirs(trace_dir, exist_ok=True)
+            base = os.path.join(trace_dir, re.sub(r'[^A-Za-z0-9_.-]+', '_', test_name))
+            self.context.tracing.stop_chunk(path=f"{base}.zip")
+            if self.previous_trace_chunk:
+                os.replace(self.previous_trace_chunk, f"{base}-previous.zip")
+                self.previous_trace_chunk = None
+            if self.page and not self.page.is_closed():
+                self.page.screenshot(path=f"{base}.png", full_page=True)
+            with open(f"{base}-actions.json", 'w', encoding='utf-8') as f:
+                json.dump(list(self.recent_actions), f, indent=2)
+            logger.info(f"Failure trace saved: {base}.zip (open with 'playwright show-trace')")
+        except Exception as e:
+            logger.info(f"Note: Could not save failure trace: {str(e)}")
+        finally:
+            self._discard_previous_trace_chunk()
+    
+    def _scenario_har_path(self):
+        test_name = BuiltIn().get_variable_value('${TEST NAME}', 'default')
+        file_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', test_name) + '.har'
+        return os.path.join(self.har_dir, file_name)
+    
+    def _context_options(self):
+        return {'viewport': {'width': 1920, 'height': 1080}, 'ignore_https_errors': True}
+    
+    def _search_engine_har(self):
+        """How AsyncSearchEngine contexts should use HARs under the current har_mode"""
+        if self.har_mode == 'off':
+            return None
+        if self.har_mode == 'static':
+            path = os.path.join(self.har_dir, 'static_assets.har')
+            if not os.path.exists(path):
+                return None
+            return {'route': path, 'options': {'url': STATIC_ASSET_PATTERN, 'not_found': 'fallback'}}
+        # Separate from the scenario HAR so it never collides with the sync context's recording
+        path = os.path.splitext(self._scenario_har_path())[0] + '-search.har'
+        exists = os.path.exists(path)
+        if self.har_mode == 'replay':
+            if not exists:
+                raise Exception(f"HAR replay requested but {path} does not exist. Run with har_mode=record first")
+            return {'route': path, 'options': {'not_found': 'abort'}}
+        if self.har_mode == 'record' or not exists:
+            os.makedirs(self.har_dir, exist_ok=True)
+            return {'record': path}
+        return {'route': path, 'options': {'not_found': 'fallback'}}
+    
+    def _new_context(self):
+        options = self._context_options()
+        self.har_path = None
+        self.har_misses = []
+        if self.har_mode == 'off':
+            return self.browser.new_context(**options)
+        
+        os.makedirs(self.har_dir, exist_ok=True)
+        if self.har_mode == 'static':
+            self.har_path = os.path.join(self.har_dir, 'static_assets.har')
+        else:
+            self.har_path = self._scenario_har_path()
+        har_exists = os.path.exists(self.har_path)
+        
+        if self.har_mode == 'replay' and not har_exists:
+            raise Exception(f"HAR replay requested but {self.har_path} does not exist. Run with har_mode=record first")
+        if self.har_mode == 'record' or not har_exists:
+            record_path = self.har_path
+            if self.har_mode == 'static':
+                # Every pabot worker records its own file; close_browser_instance merges it into the shared HAR
+                record_path = self.static_har_recording = f"{os.path.splitext(self.har_path)[0]}.{os.getpid()}.har"
+                options['record_har_url_filter'] = STATIC_ASSET_PATTERN
+            logger.info(f"Recording HAR to {record_path}")
+            return self.browser.new_context(record_har_path=record_path, record_har_content='embed', **options)
+        
+        context = self.browser.new_context(**options)
+        if self.har_mode == 'update':
+            context.route('**/*', self._record_har_miss)
+        if self.har_mode == 'replay':
+            context.route_from_har(self.har_path, not_found='abort')
+        elif self.har_mode == 'static':
+            context.route_from_har(self.har_path, url=STATIC_ASSET_PATTERN, not_found='fallback')
+        else:
+            context.route_from_har(self.har_path, not_found='fallback')
+        logger.info(f"Serving {self.har_mode} HAR routes from {self.har_path}")
+        return context
+    
+    def _capture_page_metrics(self, page_name):
+        # Reads whatever timings exist right away; the record is re-read and written when the page is left
+        if not self.collect_metrics or not self.page:
+            return None
+        self._finalize_page_metrics()
+        try:
+            metrics = self.page.evaluate(COLLECT_METRICS_SCRIPT)
+        except Exception as e:
+            logger.info(f"Could not collect page metrics for {page_name}: {str(e)}")
+            return None
+        record = {
+            'page': page_name,
+            'test': BuiltIn().get_variable_value('${TEST NAME}', ''),
+            'suite': BuiltIn().get_variable_value('${SUITE NAME}', ''),
+            'timestamp': datetime.now().isoformat(),
+            **metrics,
+        }
+        self.page_metrics.append(record)
+        self.pending_metrics = record
+        logger.info(f" {page_name} timings: TTFB {record['ttfb']}ms, DCL {record['dom_content_loaded']}ms, "
+                    f"LCP {record['lcp']}ms")
+        return record
+    
+    def _refresh_page_metrics(self):
+        record = self.pending_metrics
+        if not record or not self.page or self.page.is_closed() or self.page.url != record['url']:
+            return record
+        try:
+            record.update(self.page.evaluate(COLLECT_METRICS_SCRIPT))
+        except Exception as e:
+            logger.info(f"Could not refresh page metrics for {record['page']}: {str(e)}")
+        return record
+    
+    def _finalize_page_metrics(self):
+        record = self._refresh_page_metrics()
+        if not record:
+            return
+        self.pending_metrics = None
+        metrics_file = self.metrics_file or os.path.join(
+            BuiltIn().get_variable_value('${OUTPUT DIR}', '.'), 'page_metrics.jsonl')
+        with open(metrics_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+        logger.info(f" {record['page']} final timings: load {record['load']}ms, LCP {record['lcp']}ms, "
+                    f"CLS {record['cls']}, TBT {record['tbt']}ms")
+    
+    def _record_har_miss(self, route):
+        request = route.request
+        started = time.time()
+        response = route.fetch()
+        body = response.body()
+        headers = [{'name': k, 'value': v} for k, v in response.headers.items()]
+        entry = {
+            'startedDateTime': datetime.fromtimestamp(started).astimezone().isoformat(),
+            'time': round((time.time() - started) * 1000, 1),
+            'request': {
+                'method': request.method,
+                'url': request.url,
+                'httpVersion': 'HTTP/1.1',
+                'cookies': [],
+                'headers': [{'name': k, 'value': v} for k, v in request.headers.items()],
+                'queryString': [],
+                'headersSize': -1,
+                'bodySize': len(request.post_data_buffer or b''),
+            },
+            'response': {
+                'status': response.status,
+                'statusText': response.status_text,
+                'httpVersion': 'HTTP/1.1',
+                'cookies': [],
+                'headers': headers,
+                'content': {
+                    'size': len(body),
+                    'mimeType': response.headers.get('content-type', 'application/octet-stream'),
+                    'text': base64.b64encode(body).decode('ascii'),
+                    'encoding': 'base64',
+                },
+                'redirectURL': response.headers.get('location', ''),
+                'headersSize': -1,
+                'bodySize': len(body),
+            },
+            'cache': {},
+            'timings': {'send': 0, 'wait': -1, 'receive': 0},
+        }
+        if request.post_data is not None:
+            entry['request']['postData'] = {
+                'mimeType': request.headers.get('content-type', ''),
+                'text': request.post_data,
+            }
+        self.har_misses.append(entry)
+        route.fulfill(response=response, body=body)
+    
+    def _merge_har_misses(self):
+        if not self.har_misses or not self.har_path:
+            return
+        with _file_lock(self.har_path + '.lock'):
+            with open(self.har_path, encoding='utf-8') as f:
+                har = json.load(f)
+            har['log']['entries'].extend(self.har_misses)
+            _write_json_atomic(self.har_path, har)
+        logger.info(f"Added {len(self.har_misses)} missed requests to {self.har_path}")
+        self.har_misses = []
+    
+    def _publish_static_har(self):
+        recording, self.static_har_recording = self.static_har_recording, None
+        if not recording or not os.path.exists(recording):
+            return
+        with open(recording, encoding='utf-8') as f:
+            har = json.load(f)
+        with _file_lock(self.har_path + '.lock'):
+            if os.path.exists(self.har_path):
+                # Another worker published first: add only the assets it did not record
+                with open(self.har_path, encoding='utf-8') as f:
+                    shared = json.load(f)
+                known = {(e['request']['method'], e['request']['url']) for e in shared['log']['entries']}
+                added = [e for e in har['log']['entries']
+                         if (e['request']['method'], e['request']['url']) not in known]
+                shared['log']['entries'].extend(added)
+                har = shared
+            _write_json_atomic(self.har_path, har)
+        os.remove(recording)
+        logger.info(f"Published static asset HAR {self.har_path}")
         
     @keyword
-    def setup_browser_and_navigate(self):
+    def setup_browser_and_navigate(self, path='/'):
         try:
+            if self.recycle_pending:
+                logger.info(f"Recycling browser: {self.recycle_pending}")
             self.close_browser_instance()
             
             logger.info("Starting Playwright browser setup...")
             self.playwright = sync_playwright().start()
             
-            try:
-                logger.info("Launching Chromium browser...")
-                self.browser = self.playwright.chromium.launch(
-                    headless=False,
-                    args=['--no-sandbox', '--disable-dev-shm-usage']
-                )
-                logger.info(" Successfully launched Chromium")
-            except Exception as browser_error:
-                logger.info(f"Chromium launch failed: {str(browser_error)}")
-                logger.info("Trying headless mode as fallback...")
-                self.browser = self.playwright.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-dev-shm-usage']
-                )
-                logger.info(" Successfully launched Chromium in headless mode")
-            
-            self.context = self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                ignore_https_errors=True
-            )
+            if self.shared_browser:
+                endpoint = self.shared_browser_server.acquire(self.playwright.chromium.executable_path)
+                logger.info(f"Connecting to shared Chromium at {endpoint}")
+                self.browser = self.playwright.chromium.connect_over_cdp(endpoint)
+            else:
+                self._launch_browser()
+            
+            self.context = self._new_context()
+            if self.collect_metrics:
+                self.context.add_init_script(PERF_OBSERVER_SCRIPT)
+            self._start_trace_chunk()
             self.page = self.context.new_page()
             self.page.set_default_timeout(30000)
             
-            logger.info(f"Navigating to {self.base_url}")
-            response = self.page.goto(self.base_url, wait_until='domcontentloaded', timeout=30000)
-            
-            if response.status >= 400:
-                raise Exception(f"Failed to load page, status: {response.status}")
-            
-            try:
-                self.page.wait_for_load_state('networkidle', timeout=15000)
-            except:
-                logger.info("Network idle timeout, checking if page loaded...")
-                self.page.wait_for_load_state('domcontentloaded', timeout=10000)
-            time.sleep(2)
-            
-            page_title = self.page.title()
-            logger.info(f"Page title: {page_title}")
-            
-            try:
-                self.page.wait_for_selector(".features_items", timeout=15000)
-                logger.info(" Home page features section found")
-            except:
-                logger.info("Features section not found, checking for alternative elements...")
-                if self.page.locator("body").count() == 0:
-                    raise Exception("Page body not loaded")
+            page_name = next((name for name, route in PAGE_ROUTES.items() if route['path'] == path), path)
+            if self.navigation_mode == 'click' and path == '/':
+                self._load_home_page()
+            else:
+                self._goto(path, PAGE_ROUTES.get(page_name, {}).get('ready', 'body'))
             
+            self._capture_page_metrics(page_name)
+            self.memory_baseline = self._sample_memory()
+            self.tests_since_launch = 0
             logger.info(" Browser setup and navigation completed successfully")
             
         except Exception as e:
@@ -77,30 +972,148 @@ class PlaywrightLibrary:
             self.close_browser_instance()
             raise
     
+    def _launch_browser(self):
+        try:
+            logger.info("Launching Chromium browser...")
+            self.browser = self.playwright.chromium.launch(
+                headless=False,
+                args=['--no-sandbox', '--disable-dev-shm-usage']
+            )
+            logger.info(" Successfully launched Chromium")
+        except Exception as browser_error:
+            logger.info(f"Chromium launch failed: {str(browser_error)}")
+            logger.info("Trying headless mode as fallback...")
+            self.browser = self.playwright.chromium.launch(
+                headless=True,
+                args=['--no-sandbox', '--disable-dev-shm-usage']
+            )
+            logger.info(" Successfully launched Chromium in headless mode")
+    
+    def _load_home_page(self):
+        logger.info(f"Navigating to {self.base_url}")
+        response = self.page.goto(self.base_url, wait_until='domcontentloaded', timeout=30000)
+        
+        if response.status >= 400:
+            raise Exception(f"Failed to load page, status: {response.status}")
+        
+        try:
+            self.page.wait_for_load_state('networkidle', timeout=15000)
+        except:
+            logger.info("Network idle timeout, checking if page loaded...")
+            self.page.wait_for_load_state('domcontentloaded', timeout=10000)
+        time.sleep(2)
+        
+        page_title = self.page.title()
+        logger.info(f"Page title: {page_title}")
+        
+        try:
+            self.page.wait_for_selector(".features_items", timeout=15000)
+            logger.info(" Home page features section found")
+        except:
+            logger.info("Features section not found, checking for alternative elements...")
+            if self.page.locator("body").count() == 0:
+                raise Exception("Page body not loaded")
+    
+    def _goto(self, path, ready_selector):
+        url = f"{self.base_url}{path}"
+        logger.info(f"Navigating directly to {url}")
+        response = self.page.goto(url, wait_until='domcontentloaded', timeout=30000)
+        if response is not None and response.status >= 400:
+            raise Exception(f"Failed to load {url}, status: {response.status}")
+        self.page.wait_for_selector(ready_selector, state='visible', timeout=15000)
+    
+    def _navigate_to(self, page_name, mode=None):
+        route = PAGE_ROUTES[page_name]
+        mode = mode or self.navigation_mode
+        if mode not in self.NAVIGATION_MODES:
+            raise ValueError(f"Unknown navigation mode '{mode}'. Use one of: {', '.join(self.NAVIGATION_MODES)}")
+        # Direct mode skips the reload when already on the page, so there is no new page load to measure
+        navigate = mode == 'click' or (
+            self.page.url.split('?')[0].rstrip('/') != f"{self.base_url}{route['path']}".rstrip('/'))
+        if navigate:
+            self._finalize_page_metrics()
+            if mode == 'click':
+                self.click_and_wait(route['link'], route['heading'])
+            else:
+                self._goto(route['path'], route['ready'])
+        self.validate_page_loaded(route['path'], route['title'], route['ready'])
+        if navigate:
+            self._capture_page_metrics(page_name)
+        return True
+    
     @keyword
     def close_browser_instance(self):
+        self._finalize_page_metrics()
+        self._finish_trace_chunk(BuiltIn().get_variable_value('${TEST STATUS}') == 'FAIL')
+        if self.browser and self.memory_baseline is not None:
+            # Recorded by the end_test listener, so a test that closes its browser still gets exactly one record
+            self.closed_memory = (self.memory_baseline, self._sample_memory())
+        self.memory_baseline = None
+        errors = []
+        steps = [
+            ('page', "Closing page...", lambda: self.page.close() if not self.page.is_closed() else None),
+            ('context', "Closing context...", lambda: self.context.close()),
+            ('browser', "Closing browser...", lambda: self.browser.close()),
+            ('playwright', "Stopping playwright...", lambda: self.playwright.stop()),
+        ]
+        for attribute, message, close in steps:
+            if getattr(self, attribute, None):
+                try:
+                    logger.info(message)
+                    close()
+                except Exception as e:
+                    errors.append(f"{attribute}: {str(e)}")
         try:
-            if hasattr(self, 'page') and self.page and not self.page.is_closed():
-                logger.info("Closing page...")
-                self.page.close()
-            if hasattr(self, 'context') and self.context:
-                logger.info("Closing context...")
-                self.context.close()
-            if hasattr(self, 'browser') and self.browser:
-                logger.info("Closing browser...")
-                self.browser.close()
-            if hasattr(self, 'playwright') and self.playwright:
-                logger.info("Stopping playwright...")
-                self.playwright.stop()
-            logger.info(" Browser closed successfully")
+            self._merge_har_misses()
+            self._publish_static_har()
         except Exception as e:
-            logger.info(f"Note: Error during cleanup: {str(e)}")
-        finally:
-            self.page = None
-            self.context = None
-            self.browser = None
-            self.playwright = None
+            errors.append(f"HAR merge: {str(e)}")
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
+        self.recycle_pending = None
+        self._reap_browser_processes()
+        if errors:
+            logger.info(f"Note: Errors during cleanup: {'; '.join(errors)}")
+        else:
+            logger.info(" Browser closed successfully")
     
+    @keyword
+    def get_memory_report(self):
+        return self.memory_report
+    
+    
+    @keyword
+    def get_page_metrics(self):
+        if not self.page_metrics:
+            raise AssertionError("No page metrics collected yet")
+        self._refresh_page_metrics()
+        return self.page_metrics[-1]
+    
+    @keyword
+    def assert_performance_budget(self, **budgets):
+        metrics = self.get_page_metrics()
+        if metrics is self.pending_metrics and metrics['load'] is None:
+            # Budgets can cover load-time metrics, so only an explicit assertion waits for the load event
+            try:
+                self.page.wait_for_load_state('load', timeout=10000)
+            except Exception:
+                logger.info(f"Load event not reached for {metrics['page']}, checking partial timings")
+            metrics = self.get_page_metrics()
+        violations = []
+        for name, limit in budgets.items():
+            value = metrics
+            for key in name.split('.'):
+                value = value.get(key) if isinstance(value, dict) else None
+            if value is None:
+                violations.append(f"{name}: not measured")
+            elif float(value) > float(limit):
+                violations.append(f"{name}: {value} exceeds budget {limit}")
+        if violations:
+            raise AssertionError(f"Performance budget failed for '{metrics['page']}' ({metrics['url']}):\n" + "\n".join(violations))
+        logger.info(f" Performance budget met for {metrics['page']}: {budgets}")
+        return True
     
     @keyword
     def click_and_wait(self, selector, wait_selector=None, sleep_time=1):
@@ -144,24 +1157,123 @@ class PlaywrightLibrary:
             logger.error(f" Fill failed for {field_name}: {str(e)}")
             raise
     
+    def _evaluate_checks(self, checks):
+        selectors = [check['selector'] for check in checks]
+        state = self.page.evaluate(BATCH_CHECK_SCRIPT, selectors)
+        for i, result in enumerate(state['results']):
+            if result.get('unsupported'):
+                # Playwright-only selectors such as :has-text() are resolved through a locator
+                locator = self.page.locator(selectors[i])
+                count = locator.count()
+                state['results'][i] = {
+                    'count': count,
+                    'visible': count > 0 and locator.first.is_visible(),
+                    'text': locator.first.text_content() if count > 0 else None,
+                }
+        return state
+    
+    def _check_failure(self, check, result):
+        name = check.get('name', check['selector'])
+        condition = check.get('condition', 'visible')
+        text = result['text'] or ''
+        if condition == 'visible' and not result['visible']:
+            return f"{name} is not visible"
+        if condition == 'hidden' and result['visible']:
+            return f"{name} is visible"
+        if condition == 'present' and result['count'] == 0:
+            return f"{name} is not present"
+        if condition == 'absent' and result['count'] > 0:
+            return f"{name} is present ({result['count']} matches)"
+        if condition == 'count' and result['count'] < int(check.get('min', 1)):
+            return f"{name} has {result['count']} matches, expected at least {check.get('min', 1)}"
+        if condition == 'text_contains' and check['text'].lower() not in text.lower():
+            return f"{name} text validation failed. Expected: '{check['text']}', Got: '{text}'"
+        if condition == 'text_equals' and text.strip() != check['text']:
+            return f"{name} text validation failed. Expected: '{check['text']}', Got: '{text.strip()}'"
+        if condition not in ('visible', 'hidden', 'present', 'absent', 'count', 'text_contains', 'text_equals'):
+            return f"{name}: unknown condition '{condition}'"
+        return None
+    
+    @keyword
+    def validate_elements(self, *checks):
+        checks = [check if isinstance(check, dict) else {'selector': check} for check in checks]
+        state = self._evaluate_checks(checks)
+        failures = [failure for check, result in zip(checks, state['results'])
+                    if (failure := self._check_failure(check, result))]
+        if failures:
+            raise AssertionError("; ".join(failures))
+        for check in checks:
+            logger.info(f" {check.get('name', check['selector'])}: {check.get('condition', 'visible')}")
+        return state
+    
+    def _fill_with_locator(self, selector, value, checked):
+        locator = self.page.locator(selector)
+        tag, input_type = locator.evaluate("el => [el.tagName.toLowerCase(), (el.type || '').toLowerCase()]")
+        if tag == 'select':
+            try:
+                locator.select_option(value=value, timeout=5000)
+            except Exception:
+                locator.select_option(label=value)
+            return {'kind': 'select', 'value': locator.input_value(),
+                    'label': locator.evaluate("el => el.options[el.selectedIndex].text.trim()")}
+        if input_type in ('checkbox', 'radio'):
+            locator.set_checked(checked)
+            return {'kind': 'check', 'checked': locator.is_checked()}
+        locator.fill(value)
+        return {'kind': 'text', 'value': locator.input_value()}
+    
+    @keyword
+    def fill_form(self, *fields):
+        if len(fields) == 1 and isinstance(fields[0], dict):
+            fields = list(fields[0].items())
+        elif len(fields) % 2:
+            raise ValueError("Fill Form expects selector/value pairs or a single dictionary")
+        else:
+            fields = list(zip(fields[::2], fields[1::2]))
+        
+        fields = [(selector, str(value), str(value).lower() in ('true', 'yes', 'on', '1', 'checked'))
+                  for selector, value in fields]
+        try:
+            results = self.page.evaluate(FILL_FORM_SCRIPT, fields)
+            mismatches = []
+            for (selector, value, checked), result in zip(fields, results):
+                if result.get('unsupported'):
+                    result = self._fill_with_locator(selector, value, checked)
+                if result.get('missing'):
+                    mismatches.append(f"{selector}: element not found")
+                elif result.get('blocked'):
+                    mismatches.append(f"{selector}: element is {result['blocked']}")
+                elif result['kind'] == 'select' and value not in (result['value'], result['label']):
+                    mismatches.append(f"{selector}: expected option '{value}', got '{result['label']}'")
+                elif result['kind'] == 'check' and result['checked'] != checked:
+                    mismatches.append(f"{selector}: expected checked={checked}, got {result['checked']}")
+                elif result['kind'] == 'text' and result['value'] != value:
+                    mismatches.append(f"{selector}: expected '{value}', got '{result['value']}'")
+            if mismatches:
+                raise AssertionError(f"Form validation failed for {len(mismatches)} fields: " + "; ".join(mismatches))
+            logger.info(f" Filled and validated {len(fields)} form fields")
+            return True
+        except Exception as e:
+            logger.error(f" Fill form failed: {str(e)}")
+            raise
+    
     @keyword
     def validate_page_loaded(self, url_part, title_part, main_element):
         try:
-            current_url = self.page.url
+            state = self._evaluate_checks([{'selector': main_element}])
+            current_url = state['url']
+            current_title = state['title']
             assert url_part in current_url, f"URL validation failed. Expected '{url_part}' in '{current_url}'"
             
             try:
-                current_title = self.page.title()
                 title_words = title_part.lower().split()
                 title_matched = any(word in current_title.lower() for word in title_words)
                 assert title_matched, f"Title validation failed. Expected words from '{title_part}' in '{current_title}'"
             except AssertionError as ae:
                 logger.info(f"️ Title validation: {str(ae)} - continuing anyway")
             
-            main_locator = self.page.locator(main_element)
-            assert main_locator.is_visible(), f"Main element '{main_element}' is not visible"
+            assert state['results'][0]['visible'], f"Main element '{main_element}' is not visible"
             
-            current_title = self.page.title()
             logger.info(f" Page loaded: {current_title}")
             return True
             
@@ -172,9 +1284,7 @@ class PlaywrightLibrary:
     @keyword
     def validate_element_visible(self, selector, element_name):
         try:
-            locator = self.page.locator(selector)
-            assert locator.is_visible(), f"{element_name} is not visible"
-            logger.info(f" {element_name} is visible")
+            self.validate_elements({'selector': selector, 'name': element_name})
             return True
                 
         except Exception as e:
@@ -184,9 +1294,8 @@ class PlaywrightLibrary:
     @keyword
     def validate_element_text(self, selector, expected_text, element_name):
         try:
-            locator = self.page.locator(selector)
-            actual_text = locator.text_content()
-            assert expected_text.lower() in actual_text.lower(), f"{element_name} text validation failed. Expected: '{expected_text}', Got: '{actual_text}'"
+            self.validate_elements({'selector': selector, 'condition': 'text_contains',
+                                    'text': expected_text, 'name': element_name})
             logger.info(f" {element_name} text validation passed: '{expected_text}'")
             return True
                 
@@ -196,21 +1305,25 @@ class PlaywrightLibrary:
     
     
     @keyword
-    def navigate_to_login_page(self):
-        self.click_and_wait('//a[@href="/login"]', '//h2[contains(text(), "Login to your account")]')
-        self.validate_page_loaded("/login", "Automation Exercise", '.login-form')
-        return True
+    def navigate_to_login_page(self, mode=None):
+        return self._navigate_to('login', mode)
     
     @keyword
-    def navigate_to_products_page(self):
-        self.click_and_wait('//a[@href="/products"]', '//h2[contains(text(), "All Products")]')
-        self.validate_page_loaded("/products", "Products", '.features_items')
-        return True
+    def navigate_to_products_page(self, mode=None):
+        return self._navigate_to('products', mode)
+    
+    @keyword
+    def navigate_to_contact_page(self, mode=None):
+        return self._navigate_to('contact_us', mode)
+    
     
     @keyword
-    def navigate_to_contact_page(self):
-        self.click_and_wait('//a[@href="/contact_us"]', '//h2[contains(text(), "Get In Touch")]')
-        self.validate_page_loaded("/contact_us", "Contact us", 'input[data-qa="name"]')
+    def navigate_to_product_details(self, product_id=1):
+        path = f"/product_details/{product_id}"
+        self._finalize_page_metrics()
+        self._goto(path, '//div[@class="product-information"]')
+        self._capture_page_metrics('product_details')
+        logger.info(f" Product details page loaded: {path}")
         return True
     
     
@@ -265,14 +1378,13 @@ class PlaywrightLibrary:
     @keyword
     def validate_search_results(self):
         try:
-            search_title = self.page.locator('//h2[contains(text(), "Searched Products")]')
-            assert search_title.is_visible(), "Search title 'Searched Products' is not visible"
-            
-            results_locator = self.page.locator('//div[@class="features_items"]//div[contains(@class, "col-sm-4")]')
-            results_count = results_locator.count()
-            assert results_count > 0, "No search results found"
-            
-            assert results_locator.first.is_visible(), "First search result is not visible"
+            results_selector = '//div[@class="features_items"]//div[contains(@class, "col-sm-4")]'
+            state = self.validate_elements(
+                {'selector': '//h2[contains(text(), "Searched Products")]', 'name': "Search title 'Searched Products'"},
+                {'selector': results_selector, 'condition': 'count', 'min': 1, 'name': "Search results"},
+                {'selector': results_selector, 'name': "First search result"},
+            )
+            results_count = state['results'][1]['count']
             
             logger.info(f" Search results found: {results_count} products")
             return True
@@ -281,6 +1393,32 @@ class PlaywrightLibrary:
             logger.error(f" Search results validation failed: {str(e)}")
             raise
     
+    @keyword
+    def search_products_concurrently(self, *terms, tabs=4, isolated_contexts=False, require_results=True):
+        try:
+            isolated = str(isolated_contexts).lower() in ('true', 'yes', '1')
+            engine = AsyncSearchEngine(self.base_url, tabs=tabs, isolated_contexts=isolated,
+                                       context_options=self._context_options(),
+                                       browser_server=self.shared_browser_server, har=self._search_engine_har())
+            started = time.perf_counter()
+            results = engine.run(terms)
+            elapsed = time.perf_counter() - started
+            
+            for result in results:
+                logger.info(f" '{result['term']}': {result['count']} products in {result['elapsed']}s"
+                            + (f" (error: {result['error']})" if 'error' in result else ""))
+            logger.info(f" Searched {len(terms)} terms across {engine.tabs} tabs in {elapsed:.2f}s")
+            
+            if str(require_results).lower() in ('true', 'yes', '1'):
+                failed = [f"'{result['term']}': {result.get('error', 'no results')}"
+                          for result in results if 'error' in result or result['count'] == 0]
+                assert not failed, f"Search failed for {len(failed)} of {len(terms)} terms: " + "; ".join(failed)
+            return results
+            
+        except Exception as e:
+            logger.error(f" Concurrent product search failed: {str(e)}")
+            raise
+    
     @keyword
     def view_first_product_details(self):
         try:
@@ -298,17 +1436,15 @@ class PlaywrightLibrary:
     @keyword
     def validate_product_details(self):
         try:
-            self.validate_element_visible('//div[@class="product-information"]//h2', "Product Name")
-            
-            self.validate_element_visible('//div[@class="product-information"]//p[contains(text(), "Category:")]', "Product Category")
-            
-            self.validate_element_visible('//div[@class="product-information"]//span[contains(text(), "Rs.")]', "Product Price")
-            
-            self.validate_element_visible('//div[@class="product-information"]//b[contains(text(), "Availability:")]', "Product Availability")
-            
-            self.validate_element_visible('//div[@class="product-information"]//b[contains(text(), "Condition:")]', "Product Condition")
-            
-            self.validate_element_visible('//div[@class="product-information"]//b[contains(text(), "Brand:")]', "Product Brand")
+            info = '//div[@class="product-information"]'
+            self.validate_elements(
+                {'selector': f'{info}//h2', 'name': "Product Name"},
+                {'selector': f'{info}//p[contains(text(), "Category:")]', 'name': "Product Category"},
+                {'selector': f'{info}//span[contains(text(), "Rs.")]', 'name': "Product Price"},
+                {'selector': f'{info}//b[contains(text(), "Availability:")]', 'name': "Product Availability"},
+                {'selector': f'{info}//b[contains(text(), "Condition:")]', 'name': "Product Condition"},
+                {'selector': f'{info}//b[contains(text(), "Brand:")]', 'name': "Product Brand"},
+            )
             
             logger.info(" All product details validated")
             return True
@@ -374,10 +1510,12 @@ class PlaywrightLibrary:
     @keyword
     def fill_contact_form(self, name, email, subject, message):
         try:
-            self.fill_and_validate('//input[@data-qa="name"]', name, "Name")
-            self.fill_and_validate('//input[@data-qa="email"]', email, "Email")
-            self.fill_and_validate('//input[@data-qa="subject"]', subject, "Subject")
-            self.fill_and_validate('//textarea[@data-qa="message"]', message, "Message")
+            self.fill_form(
+                '//input[@data-qa="name"]', name,
+                '//input[@data-qa="email"]', email,
+                '//input[@data-qa="subject"]', subject,
+                '//textarea[@data-qa="message"]', message,
+            )
             logger.info(" Contact form filled")
             return True
         except Exception as e: